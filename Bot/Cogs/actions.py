@@ -1,3 +1,6 @@
+from functools import partial
+from typing import List
+
 import discord
 import orjson
 from discord import app_commands
@@ -5,6 +8,13 @@ from discord.ext import commands
 from discord.ext.commands import Greedy
 from kumikocore import KumikoCore
 from Libs.utils import Embed, format_greedy
+from yarl import URL
+
+NEKOS_URL = URL("https://nekos.life/api/v2/img")
+ACTIONS = ("hug", "pat", "kiss", "cuddle", "slap", "tickle", "poke")
+
+# nekos.life gives one image per request, so a batch is made of a few requests at once
+BATCH_SIZE = 5
 
 
 class Actions(commands.Cog):
@@ -18,65 +28,93 @@ class Actions(commands.Cog):
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji.from_str("<:headpat:1020641548645437491>")
 
+    async def cog_load(self) -> None:
+        for action in ACTIONS:
+            self.bot.image_pool.register(
+                f"nekos:{action}",
+                partial(self._fetch_batch, NEKOS_URL / action),
+                capacity=10,
+                low_water=3,
+            )
+
+    async def cog_unload(self) -> None:
+        self.bot.image_pool.unregister(*[f"nekos:{action}" for action in ACTIONS])
+
+    async def _fetch_image(self, url: URL) -> str:
+        async with self.session.get(url) as r:
+            r.raise_for_status()
+            data = await r.json(loads=orjson.loads)
+            return data["url"]
+
+    async def _fetch_batch(self, url: URL) -> List[str]:
+        results = await self.bot.fan_out.gather(
+            *[(url, partial(self._fetch_image, url)) for _ in range(BATCH_SIZE)]
+        )
+        images = [result.value for result in results if result.ok]
+        if not images and results[0].error is not None:
+            raise results[0].error
+        return images
+
+    async def _send_action(
+        self, ctx: commands.Context, action: str, title: str
+    ) -> None:
+        url = await self.bot.image_pool.get(f"nekos:{action}")
+        if url is None:
+            await ctx.send("Could not get an image right now. Please try again later")
+            return
+        embed = Embed(title=title)
+        embed.set_image(url=url)
+        await ctx.send(embed=embed)
+
     @commands.hybrid_command(name="hug")
     @app_commands.describe(user="The user to hug")
     async def hug(self, ctx: commands.Context, user: Greedy[discord.Member]) -> None:
         """Hug someone on Discord!"""
-        async with self.session.get("https://nekos.life/api/v2/img/hug") as r:
-            data = await r.json(loads=orjson.loads)
-            embed = Embed(
-                title=f"{ctx.author.name} hugs {format_greedy([items.name for items in user])}!"
-            )
-            embed.set_image(url=data["url"])
-            await ctx.send(embed=embed)
+        await self._send_action(
+            ctx,
+            "hug",
+            f"{ctx.author.name} hugs {format_greedy([items.name for items in user])}!",
+        )
 
     @commands.hybrid_command(name="pat")
     @app_commands.describe(user="The user to pat")
     async def pat(self, ctx: commands.Context, user: Greedy[discord.Member]) -> None:
         """Give someone a headpat!"""
-        async with self.session.get("https://nekos.life/api/v2/img/pat") as r:
-            data = await r.json(loads=orjson.loads)
-            embed = Embed(
-                title=f"{ctx.author.name} pats {format_greedy([items.name for items in user])}!"
-            )
-            embed.set_image(url=data["url"])
-            await ctx.send(embed=embed)
+        await self._send_action(
+            ctx,
+            "pat",
+            f"{ctx.author.name} pats {format_greedy([items.name for items in user])}!",
+        )
 
     @commands.hybrid_command(name="kiss")
     @app_commands.describe(user="The user to kiss")
     async def kiss(self, ctx: commands.Context, user: Greedy[discord.Member]) -> None:
         """Give someone a kiss!"""
-        async with self.session.get("https://nekos.life/api/v2/img/kiss") as r:
-            data = await r.json(loads=orjson.loads)
-            embed = Embed(
-                title=f"{ctx.author.name} kisses {format_greedy([items.name for items in user])}!"
-            )
-            embed.set_image(url=data["url"])
-            await ctx.send(embed=embed)
+        await self._send_action(
+            ctx,
+            "kiss",
+            f"{ctx.author.name} kisses {format_greedy([items.name for items in user])}!",
+        )
 
     @commands.hybrid_command(name="cuddle")
     @app_commands.describe(user="The user to cuddle")
     async def cuddle(self, ctx: commands.Context, user: Greedy[discord.Member]) -> None:
         """Cuddle someone on Discord!"""
-        async with self.session.get("https://nekos.life/api/v2/img/cuddle") as r:
-            data = await r.json(loads=orjson.loads)
-            embed = Embed(
-                title=f"{ctx.author.name} cuddles {format_greedy([items.name for items in user])}!"
-            )
-            embed.set_image(url=data["url"])
-            await ctx.send(embed=embed)
+        await self._send_action(
+            ctx,
+            "cuddle",
+            f"{ctx.author.name} cuddles {format_greedy([items.name for items in user])}!",
+        )
 
     @commands.hybrid_command(name="slap")
     @app_commands.describe(user="The user to slap")
     async def slap(self, ctx: commands.Context, user: Greedy[discord.Member]) -> None:
         """Slaps someone on Discord!"""
-        async with self.session.get("https://nekos.life/api/v2/img/slap") as r:
-            data = await r.json(loads=orjson.loads)
-            embed = Embed(
-                title=f"{ctx.author.name} slaps {format_greedy([items.name for items in user])}!"
-            )
-            embed.set_image(url=data["url"])
-            await ctx.send(embed=embed)
+        await self._send_action(
+            ctx,
+            "slap",
+            f"{ctx.author.name} slaps {format_greedy([items.name for items in user])}!",
+        )
 
     @commands.hybrid_command(name="tickle")
     @app_commands.describe(user="The user to tickle")
@@ -84,25 +122,21 @@ class Actions(commands.Cog):
         self, ctx: commands.Context, user: Greedy[discord.Member]
     ) -> None:
         """Tickle someone on Discord!"""
-        async with self.session.get("https://nekos.life/api/v2/img/tickle") as r:
-            data = await r.json(loads=orjson.loads)
-            embed = Embed(
-                title=f"{ctx.author.name} tickles {format_greedy([items.name for items in user])}!"
-            )
-            embed.set_image(url=data["url"])
-            await ctx.send(embed=embed)
+        await self._send_action(
+            ctx,
+            "tickle",
+            f"{ctx.author.name} tickles {format_greedy([items.name for items in user])}!",
+        )
 
     @commands.hybrid_command(name="poke")
     @app_commands.describe(user="The user to poke")
     async def poke(self, ctx: commands.Context, user: Greedy[discord.Member]) -> None:
         """Poke someone on Discord!"""
-        async with self.session.get("https://nekos.life/api/v2/img/poke") as r:
-            data = await r.json(loads=orjson.loads)
-            embed = Embed(
-                title=f"{ctx.author.name} pokes {format_greedy([items.name for items in user])}!"
-            )
-            embed.set_image(url=data["url"])
-            await ctx.send(embed=embed)
+        await self._send_action(
+            ctx,
+            "poke",
+            f"{ctx.author.name} pokes {format_greedy([items.name for items in user])}!",
+        )
 
 
 async def setup(bot: KumikoCore) -> None:
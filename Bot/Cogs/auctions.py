@@ -14,8 +14,14 @@ from Libs.cog_utils.auctions import (
     purchase_auction,
 )
 from Libs.cog_utils.economy import check_economy_enabled
-from Libs.ui.auctions import AuctionPages, AuctionSearchPages, OwnedAuctionPages
-from Libs.utils import Embed, MessageConstants
+from Libs.ui.auctions import (
+    AuctionItemPageEntry,
+    AuctionPages,
+    AuctionSearchPages,
+    OwnedAuctionPages,
+)
+from Libs.utils import Embed, KContext, MessageConstants
+from Libs.utils.pages import KeysetEmbedSource
 from typing_extensions import Annotated
 
 
@@ -30,7 +36,7 @@ class Auctions(commands.Cog):
     def display_emoji(self) -> PartialEmoji:
         return PartialEmoji.from_str("<:auction_house:1136906394323398749>")
 
-    async def cog_check(self, ctx: commands.Context) -> bool:
+    async def cog_check(self, ctx: KContext) -> bool:
         return await check_economy_enabled(ctx)
 
     @commands.hybrid_group(
@@ -39,21 +45,37 @@ class Auctions(commands.Cog):
     async def auctions(self, ctx: commands.Context) -> None:
         """List the items available for purchase"""
         sql = """
-        SELECT eco_item.id, eco_item.name, eco_item.description, auction_house.user_id, auction_house.amount_listed, auction_house.listed_price, auction_house.listed_at
+        SELECT auction_house.id AS listing_id, eco_item.id, eco_item.name, eco_item.description, auction_house.user_id, auction_house.amount_listed, auction_house.listed_price, auction_house.listed_at
         FROM auction_house
         INNER JOIN eco_item ON eco_item.id = auction_house.item_id
-        WHERE auction_house.guild_id = $1;
+        WHERE auction_house.guild_id = $1 AND auction_house.id > $2
+        ORDER BY auction_house.id
+        LIMIT $3;
+        """
+        count_sql = """
+        SELECT 1
+        FROM auction_house
+        WHERE auction_house.guild_id = $1
         """
         if ctx.guild is None:
             await ctx.send(MessageConstants.NO_DM.value)
             return
-        rows = await self.pool.fetch(sql, ctx.guild.id)
+        source = KeysetEmbedSource(
+            self.pool,
+            sql,
+            ctx.guild.id,
+            per_page=1,
+            count_query=count_sql,
+            key="listing_id",
+            transform=lambda row: AuctionItemPageEntry(row).to_dict(),  # type: ignore
+        )
+        await source.prepare()
 
-        if len(rows) == 0:
+        if len(source.entries) == 0:
             await ctx.send("No records found")
             return
 
-        pages = AuctionPages(entries=rows, ctx=ctx, per_page=1)
+        pages = AuctionPages(source, ctx=ctx)
         await pages.start()
 
     @auctions.command(name="create", aliases=["make"], usage="amount: <int>")
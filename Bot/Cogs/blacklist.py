@@ -54,6 +54,7 @@ class Blacklist(commands.Cog, command_attrs=dict(hidden=True)):
             VALUES ($1, $2) ON CONFLICT (id) DO NOTHING;
             """
             await self.pool.execute(query, gid, True)
+            self.bot.blacklist.add(gid)
             get_blacklist.cache_invalidate(gid, self.pool)
             await ctx.send(f"Done. Added ID {gid} to the blacklist")
             return
@@ -71,6 +72,7 @@ class Blacklist(commands.Cog, command_attrs=dict(hidden=True)):
             WHERE id = $1;
             """
             await self.pool.execute(query, gid)
+            self.bot.blacklist.discard(gid)
             get_blacklist.cache_invalidate(gid, self.pool)
             await ctx.send(f"Done. Removed ID {gid} from the blacklist")
             return
@@ -204,7 +204,7 @@ class Config(commands.Cog):
             await self.pool.execute(
                 query, guild_id, broadcast_webhook.channel_id, broadcast_webhook.url
             )
-            webhook_dispatcher.get_webhook_config.cache_invalidate(guild_id=guild_id)
+            webhook_dispatcher.invalidate()
             await ctx.send(f"EventLogs Channel created at {channel.mention}")
         except asyncpg.UniqueViolationError:
             await channel.delete(reason="Failed to create logs")
@@ -245,14 +245,19 @@ class Config(commands.Cog):
         self, ctx: GuildContext, old_prefix: str, new_prefix: PrefixConverter
     ) -> None:
         """Updates the prefix for your server"""
+        # Guilds whose default prefix hasn't been backfilled yet start from the default
         query = """
             UPDATE guild
-            SET prefix = ARRAY_REPLACE(prefix, $1, $2)
+            SET prefix = ARRAY_REPLACE(
+                CASE WHEN cardinality(prefix) > 0 THEN prefix ELSE ARRAY[$4] END, $1, $2
+            )
             WHERE id = $3;
         """
         guild_id = ctx.guild.id
         if old_prefix in self.bot.prefixes[guild_id]:
-            await self.pool.execute(query, old_prefix, new_prefix, guild_id)
+            await self.pool.execute(
+                query, old_prefix, new_prefix, guild_id, self.bot.default_prefix
+            )
             prefixes = self.bot.prefixes[guild_id][
                 :
             ]  # Shallow copy the list so we can safely perform operations on it
@@ -280,13 +285,16 @@ class Config(commands.Cog):
             await ctx.send("The prefix you want to set already exists")
             return
 
+        # Guilds whose default prefix hasn't been backfilled yet start from the default
         query = """
             UPDATE guild
-            SET prefix = ARRAY_APPEND(prefix, $1)
+            SET prefix = ARRAY_APPEND(
+                CASE WHEN cardinality(prefix) > 0 THEN prefix ELSE ARRAY[$3] END, $1
+            )
             WHERE id=$2;
         """
         guild_id = ctx.guild.id
-        await self.pool.execute(query, prefix, guild_id)
+        await self.pool.execute(query, prefix, guild_id, self.bot.default_prefix)
         # the weird solution but it actually works
         if isinstance(self.bot.prefixes[guild_id], list):
             self.bot.prefixes[guild_id].append(prefix)
@@ -346,6 +354,7 @@ class Config(commands.Cog):
         # Delete the unused entries
         delete_query = "DELETE FROM logging_webhooks WHERE id = $1;"
         await self.pool.execute(delete_query, channel.guild.id)
+        webhook_dispatcher.invalidate()
 
 
 async def setup(bot: KumikoCore) -> None:
@@ -5,7 +5,8 @@ from Cogs import EXTENSIONS
 from discord.ext import commands
 from discord.ext.commands import Context, Greedy
 from kumikocore import KumikoCore
-from Libs.utils import KContext, WebhookDispatcher
+from Libs.config import CacheStats, guild_config_cache
+from Libs.utils import Embed, KContext, WebhookDispatcher, webhook_config_cache
 
 TESTING_GUILD_ID = discord.Object(id=970159505390325842)
 HANGOUT_GUILD_ID = discord.Object(id=1145897416160194590)
@@ -91,13 +92,68 @@ class DevTools(commands.Cog, command_attrs=dict(hidden=True)):
         """Dispatch the webhook logs event"""
         assert ctx.guild is not None
         dispatcher = WebhookDispatcher(self.bot, ctx.guild.id)
-        wb = await dispatcher.get_webhook()
-        if wb is None:
+        if await dispatcher.get_webhook_config() is None:
             await ctx.send("Guild does no have logs webhook. Aborting")
             return
-        await wb.send(content=content)
+        if not dispatcher.send(Embed(description=content)):
+            await ctx.send("The logs queue of this guild is full. Aborting")
+            return
         await ctx.send(f"Webhook dispatched with message: {content}")
 
+    @commands.command(name="log-stats", hidden=True)
+    async def log_stats(self, ctx: KContext) -> None:
+        """Displays the queue depth and flush latency of the logs webhooks"""
+        stats = self.bot.log_sender.stats
+        embed = Embed(title="Logs Webhook Stats")
+        embed.description = (
+            f"Queued: {stats.queued} (across {stats.guilds} guilds)\n"
+            f"Sent: {stats.sent_embeds} embeds in {stats.sent_messages} messages\n"
+            f"Dropped: {stats.dropped}\n"
+            f"Flush Latency: p50 {stats.flush_p50:.2f}ms, p95 {stats.flush_p95:.2f}ms"
+        )
+        await ctx.send(embed=embed)
+
+    @commands.command(name="image-stats", hidden=True)
+    async def image_stats(self, ctx: KContext) -> None:
+        """Displays the fill level and fetch latency of the prefetched images"""
+        embed = Embed(title="Image Pool Stats")
+        for category, stats in self.bot.image_pool.stats.items():
+            embed.add_field(
+                name=category,
+                value=(
+                    f"Ready: {stats.size}/{stats.capacity}\n"
+                    f"Served: {stats.served} ({stats.misses} waited)\n"
+                    f"Failed Fetches: {stats.failures}\n"
+                    f"Fetch Latency: p50 {stats.fetch_p50:.2f}ms, p95 {stats.fetch_p95:.2f}ms"
+                ),
+            )
+        await ctx.send(embed=embed)
+
+    @commands.command(name="cache-stats", hidden=True)
+    async def cache_stats(self, ctx: KContext) -> None:
+        """Displays the hit, miss and eviction counters of the in-process caches"""
+
+        def format_stats(stats: CacheStats) -> str:
+            lookups = stats.hits + stats.misses
+            hit_rate = (stats.hits / lookups) * 100 if lookups else 0
+            return (
+                f"Hits: {stats.hits}\n"
+                f"Misses: {stats.misses}\n"
+                f"Evictions: {stats.evictions}\n"
+                f"Hit Rate: {hit_rate:.2f}%\n"
+                f"Size: {stats.size}/{stats.max_size}"
+            )
+
+        embed = Embed(title="Cache Stats")
+        embed.add_field(
+            name="Guild Config (L1)", value=format_stats(guild_config_cache.stats)
+        )
+        embed.add_field(name="Prefixes", value=format_stats(self.bot.prefix_stats))
+        embed.add_field(
+            name="Logging Webhooks", value=format_stats(webhook_config_cache.stats)
+        )
+        await ctx.send(embed=embed)
+
 
 async def setup(bot: KumikoCore):
     await bot.add_cog(DevTools(bot))
@@ -1,4 +1,3 @@
-import orjson
 from discord import PartialEmoji, app_commands
 from discord.ext import commands
 from kumikocore import KumikoCore
@@ -26,13 +25,13 @@ class Dictionary(commands.Cog):
     ) -> None:
         """Define a word from the English dictionary"""
         url = URL("https://api.dictionaryapi.dev/api/v2/entries/en") / query
-        async with self.session.get(url) as r:
-            data = await r.json(loads=orjson.loads)
-            if "message" in data:
-                await ctx.send("No results found")
-                return
-            pages = DictPages(data, ctx=ctx)
-            await pages.start()
+        r = await self.bot.http_cache.get(url)
+        data = r.json()
+        if "message" in data:
+            await ctx.send("No results found")
+            return
+        pages = DictPages(data, ctx=ctx)
+        await pages.start()
 
     @define.command(name="japanese", aliases=["ja", "jp"])
     @app_commands.describe(
@@ -44,15 +43,15 @@ class Dictionary(commands.Cog):
         """Get the definition of a word from the Japanese dictionary"""
         params = {"keyword": query}
 
-        async with self.session.get(
+        r = await self.bot.http_cache.get(
             "https://jisho.org/api/v1/search/words", params=params
-        ) as r:
-            data = await r.json(loads=orjson.loads)
-            if len(data["data"]) == 0:
-                await ctx.send("No results found.")
-                return
-            pages = JapaneseDictPages(data["data"], ctx=ctx)
-            await pages.start()
+        )
+        data = r.json()
+        if len(data["data"]) == 0:
+            await ctx.send("No results found.")
+            return
+        pages = JapaneseDictPages(data["data"], ctx=ctx)
+        await pages.start()
 
 
 async def setup(bot: KumikoCore) -> None:
@@ -2,8 +2,14 @@ import discord
 from discord.ext import commands
 from kumikocore import KumikoCore
 from Libs.cog_utils.economy import RefundFlags, check_economy_enabled
-from Libs.ui.economy import LeaderboardPages, RegisterView, UserInvPages
-from Libs.utils import ConfirmEmbed, Embed
+from Libs.ui.economy import (
+    LeaderboardPages,
+    RegisterView,
+    UserInvPageEntry,
+    UserInvPages,
+)
+from Libs.utils import ConfirmEmbed, Embed, KContext
+from Libs.utils.pages import KeysetEmbedSource
 
 
 class Economy(commands.Cog):
@@ -26,7 +32,7 @@ class Economy(commands.Cog):
     def configurable(self) -> bool:
         return True
 
-    async def cog_check(self, ctx: commands.Context) -> bool:
+    async def cog_check(self, ctx: KContext) -> bool:
         return await check_economy_enabled(ctx)
 
     @commands.hybrid_group(name="eco", aliases=["economy"])
@@ -71,18 +77,36 @@ class Economy(commands.Cog):
     @eco.command(name="inventory", aliases=["inv"])
     async def inventory(self, ctx: commands.Context) -> None:
         """View your inventory"""
+        # An user owns each item once, so the unique (owner_id, item_id) index covers the keyset
         query = """
         SELECT eco_item.id, eco_item.name, eco_item.description, eco_item.price, user_inv.amount_owned, eco_item.producer_id
-        FROM user_inv 
+        FROM user_inv
         INNER JOIN eco_item ON eco_item.id = user_inv.item_id
-        WHERE eco_item.guild_id = $1 AND user_inv.owner_id = $2;
+        WHERE eco_item.guild_id = $1 AND user_inv.owner_id = $2 AND user_inv.item_id > $3
+        ORDER BY user_inv.item_id
+        LIMIT $4;
         """
-        rows = await self.pool.fetch(query, ctx.guild.id, ctx.author.id)  # type: ignore
-        if len(rows) == 0:
+        count_query = """
+        SELECT 1
+        FROM user_inv
+        INNER JOIN eco_item ON eco_item.id = user_inv.item_id
+        WHERE eco_item.guild_id = $1 AND user_inv.owner_id = $2
+        """
+        source = KeysetEmbedSource(
+            self.pool,
+            query,
+            ctx.guild.id,  # type: ignore
+            ctx.author.id,
+            per_page=1,
+            count_query=count_query,
+            transform=lambda row: UserInvPageEntry(row).to_dict(),  # type: ignore
+        )
+        await source.prepare()
+        if len(source.entries) == 0:
             await ctx.send("No items available")
             return
 
-        pages = UserInvPages(entries=rows, ctx=ctx, per_page=1, pool=self.pool)
+        pages = UserInvPages(source, ctx=ctx, pool=self.pool)
         await pages.start()
 
     @eco.command(name="top", aliases=["baltop"])
@@ -1,8 +1,11 @@
+from functools import partial
+from typing import Any, Dict, List, Optional
+
 import ciso8601
-import orjson
 from discord import PartialEmoji, app_commands
 from discord.ext import commands
 from kumikocore import KumikoCore
+from Libs.cache import CachedResponse
 from Libs.ui.github import (
     GitHubCommentReactions,
     GitHubCommit,
@@ -19,6 +22,7 @@ from Libs.ui.github import (
     GitHubRepoReleases,
     GitHubUser,
 )
+from Libs.utils import FanOutResult
 from yarl import URL
 
 
@@ -40,6 +44,32 @@ class Github(commands.Cog):
     def display_emoji(self) -> PartialEmoji:
         return PartialEmoji.from_str("<:githubmarkwhite:1127906278509912185>")
 
+    async def _get_many(
+        self, *urls: URL, params: Optional[Dict[str, Any]] = None
+    ) -> List[FanOutResult]:
+        # All of the requests are sent at once, so a command waits on the slowest one instead of all of them
+        return await self.bot.fan_out.gather(
+            *[
+                (
+                    url,
+                    partial(
+                        self.bot.http_cache.get,
+                        url,
+                        headers=self.headers,
+                        params=params,
+                    ),
+                )
+                for url in urls
+            ]
+        )
+
+    def _data(self, result: FanOutResult) -> Any:
+        """The JSON of a successful response, or None if the request failed"""
+        response: Optional[CachedResponse] = result.value
+        if not result.ok or response is None or response.status != 200:
+            return None
+        return response.json()
+
     @commands.hybrid_group(name="github")
     async def github(self, ctx: commands.Context) -> None:
         """Github search and utility commands"""
@@ -56,80 +86,76 @@ class Github(commands.Cog):
         self, ctx: commands.Context, owner: str, repo: str, issue: int
     ) -> None:
         """Obtains detailed information about the given issue"""
-        issues_url = self.base_url / str(issue)
-        comments_url = self.base_url / str(issue) / "comments"
-        async with self.session.get(
-            issues_url, headers=self.headers
-        ) as issues_res, self.session.get(
-            comments_url, headers=self.headers
-        ) as comments_res:
-            issue_data = await issues_res.json(loads=orjson.loads)
-            comments_data = await comments_res.json(loads=orjson.loads)
+        issues_url = self.base_url / owner / repo / "issues" / str(issue)
+        comments_url = issues_url / "comments"
+        issue_res, comments_res = await self._get_many(issues_url, comments_url)
 
-            if issues_res.status == 404 or comments_res.status == 404:
-                await ctx.send("Could not find either the issue or the repo itself")
-                return
+        issue_data = self._data(issue_res)
+        if issue_data is None:
+            await ctx.send("Could not find either the issue or the repo itself")
+            return
 
-            issue_entry = GitHubIssue(
-                title=issue_data["title"],
-                body=issue_data["body"],
-                state=issue_data["state"],
-                state_reason=issue_data["state_reason"],
-                url=issue_data["html_url"],
-                labels=[
-                    GitHubIssueLabel(
-                        name=label["name"], description=label["description"]
-                    )
-                    for label in issue_data["labels"]
-                ],
-                user=GitHubUser(
-                    name=issue_data["user"]["login"],
-                    avatar_url=issue_data["user"]["avatar_url"],
-                    url=issue_data["user"]["html_url"],
-                ),
-                assignees=[
-                    GitHubUser(
-                        name=assignee["login"],
-                        avatar_url=assignee["avatar_url"],
-                        url=assignee["html_url"],
-                    )
-                    for assignee in issue_data["assignees"]
-                ],
-                closed_at=ciso8601.parse_datetime(issue_data["closed_at"]) or None,
-                created_at=ciso8601.parse_datetime(issue_data["created_at"]) or None,
-                updated_at=ciso8601.parse_datetime(issue_data["updated_at"]) or None,
-            )
+        # The issue can still be shown if only the comments failed to load
+        comments_data = self._data(comments_res) or []
 
-            converted_comments = [
-                GitHubIssueComment(
-                    body=comment["body"],
-                    url=comment["html_url"],
-                    author=GitHubUser(
-                        name=comment["user"]["login"],
-                        avatar_url=comment["user"]["avatar_url"],
-                        url=comment["user"]["html_url"],
-                    ),
-                    created_at=ciso8601.parse_datetime(comment["created_at"]),
-                    updated_at=ciso8601.parse_datetime(comment["updated_at"]),
-                    reactions=GitHubCommentReactions(
-                        total_count=comment["reactions"]["total_count"],
-                        plus_1=comment["reactions"]["+1"],
-                        minus_1=comment["reactions"]["-1"],
-                        laugh=comment["reactions"]["laugh"],
-                        hooray=comment["reactions"]["hooray"],
-                        confused=comment["reactions"]["confused"],
-                        heart=comment["reactions"]["heart"],
-                        rocket=comment["reactions"]["rocket"],
-                        eyes=comment["reactions"]["eyes"],
-                    ),
+        issue_entry = GitHubIssue(
+            title=issue_data["title"],
+            body=issue_data["body"],
+            state=issue_data["state"],
+            state_reason=issue_data["state_reason"],
+            url=issue_data["html_url"],
+            labels=[
+                GitHubIssueLabel(name=label["name"], description=label["description"])
+                for label in issue_data["labels"]
+            ],
+            user=GitHubUser(
+                name=issue_data["user"]["login"],
+                avatar_url=issue_data["user"]["avatar_url"],
+                url=issue_data["user"]["html_url"],
+            ),
+            assignees=[
+                GitHubUser(
+                    name=assignee["login"],
+                    avatar_url=assignee["avatar_url"],
+                    url=assignee["html_url"],
                 )
-                for comment in comments_data
-            ]
+                for assignee in issue_data["assignees"]
+            ],
+            closed_at=ciso8601.parse_datetime(issue_data["closed_at"]) or None,
+            created_at=ciso8601.parse_datetime(issue_data["created_at"]) or None,
+            updated_at=ciso8601.parse_datetime(issue_data["updated_at"]) or None,
+        )
 
-            pages = GithubIssuesPages(
-                issue_entry=issue_entry, comments_entries=converted_comments, ctx=ctx
+        converted_comments = [
+            GitHubIssueComment(
+                body=comment["body"],
+                url=comment["html_url"],
+                author=GitHubUser(
+                    name=comment["user"]["login"],
+                    avatar_url=comment["user"]["avatar_url"],
+                    url=comment["user"]["html_url"],
+                ),
+                created_at=ciso8601.parse_datetime(comment["created_at"]),
+                updated_at=ciso8601.parse_datetime(comment["updated_at"]),
+                reactions=GitHubCommentReactions(
+                    total_count=comment["reactions"]["total_count"],
+                    plus_1=comment["reactions"]["+1"],
+                    minus_1=comment["reactions"]["-1"],
+                    laugh=comment["reactions"]["laugh"],
+                    hooray=comment["reactions"]["hooray"],
+                    confused=comment["reactions"]["confused"],
+                    heart=comment["reactions"]["heart"],
+                    rocket=comment["reactions"]["rocket"],
+                    eyes=comment["reactions"]["eyes"],
+                ),
             )
-            await pages.start()
+            for comment in comments_data
+        ]
+
+        pages = GithubIssuesPages(
+            issue_entry=issue_entry, comments_entries=converted_comments, ctx=ctx
+        )
+        await pages.start()
 
     @github.command(name="repo")
     @app_commands.describe(
@@ -138,86 +164,83 @@ class Github(commands.Cog):
     async def repo(self, ctx: commands.Context, owner: str, repo: str) -> None:
         """Provides detailed information about the given repo"""
         repo_url = self.base_url / owner / repo
-        releases_url = self.base_url / owner / repo / "releases"
-        async with self.session.get(
-            repo_url, headers=self.headers
-        ) as repo_res, self.session.get(
-            releases_url, headers=self.headers
-        ) as releases_res:
-            repo_data = await repo_res.json(loads=orjson.loads)
-            releases_data = await releases_res.json(loads=orjson.loads)
+        releases_url = repo_url / "releases"
+        repo_res, releases_res = await self._get_many(repo_url, releases_url)
 
-            if repo_res.status == 404 or releases_res.status == 404:
-                await ctx.send("Could not find either the release or the repo itself")
-                return
+        repo_data = self._data(repo_res)
+        if repo_data is None:
+            await ctx.send("Could not find either the release or the repo itself")
+            return
 
-            repo_entry = GitHubRepo(
-                name=repo_data["name"],
-                full_name=repo_data["full_name"],
-                private=repo_data["private"],
-                owner=GitHubUser(
-                    name=repo_data["owner"]["login"],
-                    avatar_url=repo_data["owner"]["avatar_url"],
-                    url=repo_data["owner"]["html_url"],
-                ),
-                url=repo_data["html_url"],
-                description=repo_data["description"],
-                fork=repo_data["fork"],
-                created_at=ciso8601.parse_datetime(repo_data["created_at"]),
-                updated_at=ciso8601.parse_datetime(repo_data["updated_at"]),
-                pushed_at=ciso8601.parse_datetime(repo_data["pushed_at"]),
-                homepage=repo_data["homepage"],
-                git_url=repo_data["git_url"],
-                ssh_url=repo_data["ssh_url"],
-                clone_url=repo_data["clone_url"],
-                star_count=repo_data["stargazers_count"],
-                watchers=repo_data["watchers"],
-                language=repo_data["language"],
-                forks=repo_data["forks"],
-                archived=repo_data["archived"],
-                open_issues=repo_data["open_issues_count"],
-                license=GitHubLicense(
-                    name=repo_data["license"]["name"] or "None",
-                    spdx_id=repo_data["license"]["spdx_id"] or "None",
+        releases_data = self._data(releases_res) or []
+
+        repo_entry = GitHubRepo(
+            name=repo_data["name"],
+            full_name=repo_data["full_name"],
+            private=repo_data["private"],
+            owner=GitHubUser(
+                name=repo_data["owner"]["login"],
+                avatar_url=repo_data["owner"]["avatar_url"],
+                url=repo_data["owner"]["html_url"],
+            ),
+            url=repo_data["html_url"],
+            description=repo_data["description"],
+            fork=repo_data["fork"],
+            created_at=ciso8601.parse_datetime(repo_data["created_at"]),
+            updated_at=ciso8601.parse_datetime(repo_data["updated_at"]),
+            pushed_at=ciso8601.parse_datetime(repo_data["pushed_at"]),
+            homepage=repo_data["homepage"],
+            git_url=repo_data["git_url"],
+            ssh_url=repo_data["ssh_url"],
+            clone_url=repo_data["clone_url"],
+            star_count=repo_data["stargazers_count"],
+            watchers=repo_data["watchers"],
+            language=repo_data["language"],
+            forks=repo_data["forks"],
+            archived=repo_data["archived"],
+            open_issues=repo_data["open_issues_count"],
+            license=GitHubLicense(
+                name=repo_data["license"]["name"] or "None",
+                spdx_id=repo_data["license"]["spdx_id"] or "None",
+            ),
+            topics=repo_data["topics"],
+        )
+
+        releases_entries = [
+            GitHubRepoReleases(
+                url=release["html_url"],
+                author=GitHubUser(
+                    name=release["author"]["login"],
+                    avatar_url=release["author"]["avatar_url"],
+                    url=release["author"]["html_url"],
                 ),
-                topics=repo_data["topics"],
+                tag_name=release["tag_name"],
+                name=release["name"],
+                prerelease=release["prerelease"],
+                assets=[
+                    GitHubReleaseAsset(
+                        name=asset["name"],
+                        label=asset["label"],
+                        state=asset["state"],
+                        size=asset["size"],
+                        download_count=asset["download_count"],
+                        created_at=ciso8601.parse_datetime(asset["created_at"]),
+                        updated_at=ciso8601.parse_datetime(asset["updated_at"]),
+                        download_url=asset["browser_download_url"],
+                    )
+                    for asset in release["assets"]
+                ],
+                created_at=ciso8601.parse_datetime(release["created_at"]),
+                published_at=ciso8601.parse_datetime(release["published_at"]),
+                tarball_url=release["tarball_url"],
+                zipball_url=release["zipball_url"],
+                body=release["body"],
             )
+            for release in releases_data
+        ]
 
-            releases_entries = [
-                GitHubRepoReleases(
-                    url=release["html_url"],
-                    author=GitHubUser(
-                        name=release["author"]["login"],
-                        avatar_url=release["author"]["avatar_url"],
-                        url=release["author"]["html_url"],
-                    ),
-                    tag_name=release["tag_name"],
-                    name=release["name"],
-                    prerelease=release["prerelease"],
-                    assets=[
-                        GitHubReleaseAsset(
-                            name=asset["name"],
-                            label=asset["label"],
-                            state=asset["state"],
-                            size=asset["size"],
-                            download_count=asset["download_count"],
-                            created_at=ciso8601.parse_datetime(asset["created_at"]),
-                            updated_at=ciso8601.parse_datetime(asset["updated_at"]),
-                            download_url=asset["browser_download_url"],
-                        )
-                        for asset in release["assets"]
-                    ],
-                    created_at=ciso8601.parse_datetime(release["created_at"]),
-                    published_at=ciso8601.parse_datetime(release["published_at"]),
-                    tarball_url=release["tarball_url"],
-                    zipball_url=release["zipball_url"],
-                    body=release["body"],
-                )
-                for release in releases_data
-            ]
-
-            pages = GithubRepoPages(repo_entry, releases_entries, ctx=ctx)
-            await pages.start()
+        pages = GithubRepoPages(repo_entry, releases_entries, ctx=ctx)
+        await pages.start()
 
     @github.command(name="commits")
     @app_commands.describe(
@@ -227,34 +250,32 @@ class Github(commands.Cog):
         """Get all of the latest commits from a given repo"""
         params = {"per_page": 75}
         url = self.base_url / owner / repo / "commits"
-        async with self.session.get(url, headers=self.headers, params=params) as r:
-            data = await r.json(loads=orjson.loads)
+        (result,) = await self._get_many(url, params=params)
 
-            if r.status == 404:
-                await ctx.send("Could not find the repo itself")
-                return
+        data = self._data(result)
+        if data is None:
+            await ctx.send("Could not find the repo itself")
+            return
 
-            converted = [
-                GitHubCommit(
-                    author=GitHubUser(
-                        name=commit["author"]["login"],
-                        avatar_url=commit["author"]["avatar_url"],
-                        url=commit["author"]["html_url"],
-                    ),
-                    commit_date=ciso8601.parse_datetime(
-                        commit["commit"]["author"]["date"]
-                    ),
-                    message=commit["commit"]["message"],
-                    url=commit["html_url"],
-                    parents=[
-                        GitHubParentCommit(sha=parent["sha"], url=parent["html_url"])
-                        for parent in commit["parents"]
-                    ],
-                )
-                for commit in data
-            ]
-            pages = GitHubCommitPages(entries=converted, ctx=ctx)
-            await pages.start()
+        converted = [
+            GitHubCommit(
+                author=GitHubUser(
+                    name=commit["author"]["login"],
+                    avatar_url=commit["author"]["avatar_url"],
+                    url=commit["author"]["html_url"],
+                ),
+                commit_date=ciso8601.parse_datetime(commit["commit"]["author"]["date"]),
+                message=commit["commit"]["message"],
+                url=commit["html_url"],
+                parents=[
+                    GitHubParentCommit(sha=parent["sha"], url=parent["html_url"])
+                    for parent in commit["parents"]
+                ],
+            )
+            for commit in data
+        ]
+        pages = GitHubCommitPages(entries=converted, ctx=ctx)
+        await pages.start()
 
 
 async def setup(bot: KumikoCore) -> None:
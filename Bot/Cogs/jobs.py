@@ -21,12 +21,14 @@ from Libs.ui.jobs import (
     CreateJobOutputItemModal,
     DeleteJobViaIDView,
     DeleteJobView,
+    JobListingPages,
+    JobPageEntry,
     JobPages,
     PurgeJobsView,
     UpdateJobModal,
 )
-from Libs.utils import ConfirmEmbed, Embed, MessageConstants
-from Libs.utils.pages import EmbedListSource, KumikoPages
+from Libs.utils import ConfirmEmbed, Embed, KContext, MessageConstants
+from Libs.utils.pages import KeysetEmbedSource, KeysetSimpleSource, KumikoPages
 from typing_extensions import Annotated
 
 
@@ -85,51 +87,57 @@ class Jobs(commands.Cog):
     def display_emoji(self) -> discord.PartialEmoji:
         return discord.PartialEmoji(name="\U0001f4bc")
 
-    async def cog_check(self, ctx: commands.Context) -> bool:
+    async def cog_check(self, ctx: KContext) -> bool:
         return await check_economy_enabled(ctx)
 
     @commands.hybrid_group(name="jobs", fallback="list")
     async def jobs(self, ctx: commands.Context, flags: JobListFlags) -> None:
         """Lists all available jobs in your server"""
-        sql = """
+        query = """
         SELECT job.id, job.name, job.description, job.required_rank, job.pay_amount
         FROM job_lookup
         INNER JOIN job ON job.id = job_lookup.job_id
-        WHERE job_lookup.guild_id = $1 AND job_lookup.listed = $2;
+        WHERE job_lookup.guild_id = $1 AND job_lookup.listed = $2 AND job.id > $3
+        ORDER BY job.id
+        LIMIT $4;
+        """
+        count_query = """
+        SELECT 1
+        FROM job_lookup
+        WHERE job_lookup.guild_id = $1 AND job_lookup.listed = $2
         """
-        results = await self.pool.fetch(sql, ctx.guild.id, True)  # type: ignore
+        if flags.compact is True:
+            source = KeysetSimpleSource(
+                self.pool,
+                query,
+                ctx.guild.id,  # type: ignore
+                True,
+                per_page=10,
+                count_query=count_query,
+                transform=JobPageEntry,  # type: ignore
+            )
+        else:
+            source = KeysetEmbedSource(
+                self.pool,
+                query,
+                ctx.guild.id,  # type: ignore
+                True,
+                per_page=1,
+                count_query=count_query,
+                transform=lambda row: JobPageEntry(row).to_dict(),  # type: ignore
+            )
+        await source.prepare()
 
-        if len(results) == 0:
+        if len(source.entries) == 0:
             await ctx.send(
                 "There are no listed jobs in this server! Create one to get started!"
             )
             return
         if flags.compact is True:
-            pages = JobPages(entries=results, ctx=ctx, per_page=10)
-            await pages.start()
+            pages = JobListingPages(source, ctx=ctx)
         else:
-            data_list = [
-                {
-                    "title": row["name"],
-                    "description": row["description"],
-                    "fields": [
-                        {"name": "ID", "value": row["id"], "inline": True},
-                        {
-                            "name": "Required Rank",
-                            "value": row["required_rank"],
-                            "inline": True,
-                        },
-                        {
-                            "name": "Pay Amount",
-                            "value": row["pay_amount"],
-                            "inline": True,
-                        },
-                    ],
-                }
-                for row in results
-            ]
-            pages = KumikoPages(EmbedListSource(data_list, per_page=1), ctx=ctx)
-            await pages.start()
+            pages = KumikoPages(source, ctx=ctx)
+        await pages.start()
 
     @jobs.command(name="create")
     @app_commands.describe(
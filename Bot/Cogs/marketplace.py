@@ -8,8 +8,9 @@ from Libs.cog_utils.marketplace import (
     get_item,
     is_payment_valid,
 )
-from Libs.ui.marketplace import ItemPages, SimpleSearchItemPages
+from Libs.ui.marketplace import ItemPageEntry, ItemPages, SimpleSearchItemPages
 from Libs.utils import Embed, GuildContext, KContext
+from Libs.utils.pages import KeysetEmbedSource
 from typing_extensions import Annotated
 
 
@@ -37,14 +38,30 @@ class Marketplace(commands.Cog):
         SELECT eco_item.id, eco_item.name, eco_item.description, eco_item.price, eco_item.amount, eco_item.producer_id
         FROM eco_item_lookup
         INNER JOIN eco_item ON eco_item.id = eco_item_lookup.item_id
-        WHERE eco_item.guild_id = $1;
+        WHERE eco_item.guild_id = $1 AND eco_item.id > $2
+        ORDER BY eco_item.id
+        LIMIT $3;
         """
-        rows = await self.pool.fetch(query, ctx.guild.id)
-        if len(rows) == 0:
+        count_query = """
+        SELECT 1
+        FROM eco_item_lookup
+        INNER JOIN eco_item ON eco_item.id = eco_item_lookup.item_id
+        WHERE eco_item.guild_id = $1
+        """
+        source = KeysetEmbedSource(
+            self.pool,
+            query,
+            ctx.guild.id,
+            per_page=1,
+            count_query=count_query,
+            transform=lambda row: ItemPageEntry(row).to_dict(),  # type: ignore
+        )
+        await source.prepare()
+        if len(source.entries) == 0:
             await ctx.send("No items available")
             return
 
-        pages = ItemPages(entries=rows, ctx=ctx, per_page=1)
+        pages = ItemPages(source, ctx=ctx)
         await pages.start()
 
     @marketplace.command(name="buy", aliases=["purchase"], usage="amount: <int>")
@@ -15,6 +15,7 @@ from Libs.cog_utils.pins import (
     get_owned_pins,
     get_pin_content,
     get_pin_info,
+    invalidate_pins_cache,
     is_pins_enabled,
 )
 from Libs.ui.pins import (
@@ -24,7 +25,7 @@ from Libs.ui.pins import (
     PinPages,
     PurgePinView,
 )
-from Libs.utils import ConfirmEmbed, Embed, GuildContext
+from Libs.utils import ChangeEvent, ConfirmEmbed, Embed, GuildContext
 from typing_extensions import Annotated
 
 
@@ -58,6 +59,29 @@ class Pins(commands.Cog):
         self.pool = self.bot.pool
         self._reserved_tags_being_made: Dict[int, set[str]] = {}
 
+    async def cog_load(self) -> None:
+        # Catches pin changes made by other processes, or directly within the database.
+        # The cached lookups live in Redis and are shared by every process, so they are only
+        # dropped when the table is truncated, not whenever one process reconnects
+        self.bot.change_feed.subscribe(
+            "pin_lookup",
+            self.on_pin_change,
+            resync=self.drop_pins_cache,
+            resync_on_reconnect=False,
+        )
+
+    async def cog_unload(self) -> None:
+        self.bot.change_feed.unsubscribe(
+            "pin_lookup", self.on_pin_change, resync=self.drop_pins_cache
+        )
+
+    async def on_pin_change(self, event: ChangeEvent) -> None:
+        if event.key is not None:
+            await invalidate_pins_cache(event.key, self.bot.redis_pool)
+
+    async def drop_pins_cache(self) -> None:
+        await self.bot.cache.delete_matching_cache("cache:kumiko:*:pins:*")
+
     def is_tag_being_made(self, guild_id: int, name: str) -> bool:
         try:
             being_made = self._reserved_tags_being_made[guild_id]
@@ -96,7 +120,9 @@ class Pins(commands.Cog):
         self, ctx: GuildContext, *, name: Annotated[str, commands.clean_content]
     ):
         """Pin text for later retrieval"""
-        pin_text = await get_pin_content(ctx.guild.id, name, self.bot.pool)
+        pin_text = await get_pin_content(
+            ctx.guild.id, name, self.bot.pool, self.bot.redis_pool
+        )
         if isinstance(pin_text, list):
             await ctx.send(format_options(pin_text) or ".")
             return
@@ -121,6 +147,7 @@ class Pins(commands.Cog):
         guild_id = ctx.guild.id
         author_id = ctx.author.id
         status = await create_pin(author_id, guild_id, self.pool, name, content)
+        await invalidate_pins_cache(guild_id, self.bot.redis_pool)
         await ctx.send(status)
 
     @is_pins_enabled()
@@ -207,6 +234,7 @@ class Pins(commands.Cog):
             status = await create_pin(
                 ctx.author.id, ctx.guild.id, self.pool, name, clean_content
             )
+            await invalidate_pins_cache(ctx.guild.id, self.bot.redis_pool)
             await ctx.send(status)
         finally:
             self.remove_in_progress_tag(ctx.guild.id, name)
@@ -274,6 +302,7 @@ class Pins(commands.Cog):
                 )
                 return
             else:
+                await invalidate_pins_cache(ctx.guild.id, self.bot.redis_pool)
                 await ctx.send(f"Successfully aliased `{name}` to `{alias}`")
 
     @is_pins_enabled()
@@ -301,6 +330,7 @@ class Pins(commands.Cog):
                 )
                 return
             else:
+                await invalidate_pins_cache(ctx.guild.id, self.bot.redis_pool)
                 await ctx.send(f"Successfully removed alias `{alias}` from `{name}`")
 
     @is_pins_enabled()
@@ -376,6 +406,7 @@ class Pins(commands.Cog):
         if sql_res[-1] == "0":
             await ctx.send("Could not edit the pin. Are you sure you own it?")
         else:
+            await invalidate_pins_cache(ctx.guild.id, self.bot.redis_pool)
             await ctx.send("Successfully edited pin")
 
     @is_pins_enabled()
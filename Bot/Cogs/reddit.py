@@ -1,4 +1,4 @@
-from typing import Literal, Optional
+from typing import AsyncIterator, Literal, Optional
 
 import asyncpraw
 import orjson
@@ -9,9 +9,11 @@ from Libs.ui.reddit import (
     RedditEntry,
     RedditMemeEntry,
     RedditMemePages,
+    RedditPageEntry,
     RedditPages,
 )
 from Libs.utils import GuildContext, parse_subreddit
+from Libs.utils.pages import AsyncIteratorEmbedSource
 from yarl import URL
 
 
@@ -23,11 +25,51 @@ class Reddit(commands.Cog):
         self.session = self.bot.session
         self._REDDIT_ID = self.bot.config["REDDIT_ID"]
         self._REDDIT_SECRET = self.bot.config["REDDIT_SECRET"]
+        self.reddit_client: asyncpraw.Reddit
+
+    async def cog_load(self) -> None:
+        # One client is shared by every command, so it only authenticates once
+        # The client isn't closed on unload, as that would close the bot's session
+        self.reddit_client = asyncpraw.Reddit(
+            client_id=self._REDDIT_ID,
+            client_secret=self._REDDIT_SECRET,
+            user_agent="Kumiko (by /u/No767)",
+            requestor_kwargs={"session": self.bot.session},
+        )
 
     @property
     def display_emoji(self) -> PartialEmoji:
         return PartialEmoji.from_str("<:reddit:314349923103670272>")
 
+    async def _to_entries(self, posts: AsyncIterator) -> AsyncIterator[RedditEntry]:
+        async for post in posts:
+            yield RedditEntry(
+                title=post.title,
+                description=post.selftext,
+                image_url=post.url,
+                author=post.author,
+                upvotes=post.score,
+                nsfw=post.over_18,
+                flair=post.link_flair_text,
+                num_of_comments=post.num_comments,
+                post_permalink=post.permalink,
+                created_utc=post.created_utc,
+            )
+
+    async def _send_posts(self, ctx: GuildContext, posts: AsyncIterator) -> None:
+        source = AsyncIteratorEmbedSource(
+            self._to_entries(posts),
+            per_page=1,
+            transform=lambda entry: RedditPageEntry(entry).to_dict(),
+        )
+        await source.prepare()
+        if len(source.entries) == 0:
+            await ctx.send("No posts found")
+            return
+
+        pages = RedditPages(source, ctx=ctx)
+        await pages.start()
+
     @commands.hybrid_group(name="reddit")
     async def reddit(self, ctx: GuildContext) -> None:
         """Reddit search and utility commands"""
@@ -44,31 +86,8 @@ class Reddit(commands.Cog):
     ) -> None:
         """Searches for posts on Reddit"""
         await ctx.defer()
-        reddit = asyncpraw.Reddit(
-            client_id=self._REDDIT_ID,
-            client_secret=self._REDDIT_SECRET,
-            user_agent="Kumiko (by /u/No767)",
-            requestor_kwargs={"session": self.bot.session},
-        )
-        sub = await reddit.subreddit(parse_subreddit(subreddit))
-        sub_search = sub.search(search)
-        converted = [
-            RedditEntry(
-                title=post.title,
-                description=post.selftext,
-                image_url=post.url,
-                author=post.author,
-                upvotes=post.score,
-                nsfw=post.over_18,
-                flair=post.link_flair_text,
-                num_of_comments=post.num_comments,
-                post_permalink=post.permalink,
-                created_utc=post.created_utc,
-            )
-            async for post in sub_search
-        ]
-        pages = RedditPages(entries=converted, ctx=ctx)
-        await pages.start()
+        sub = await self.reddit_client.subreddit(parse_subreddit(subreddit))
+        await self._send_posts(ctx, sub.search(search))
 
     @reddit.command(name="feed")
     @app_commands.describe(
@@ -82,13 +101,7 @@ class Reddit(commands.Cog):
     ) -> None:
         """Gets a feed of posts from a subreddit"""
         await ctx.defer()
-        reddit = asyncpraw.Reddit(
-            client_id=self._REDDIT_ID,
-            client_secret=self._REDDIT_SECRET,
-            user_agent="Kumiko (by /u/No767)",
-            requestor_kwargs={"session": self.bot.session},
-        )
-        sub = await reddit.subreddit(parse_subreddit(subreddit))
+        sub = await self.reddit_client.subreddit(parse_subreddit(subreddit))
         sub_gen = (
             sub.new(limit=10)
             if filter == "New"
@@ -96,23 +109,7 @@ class Reddit(commands.Cog):
             if filter == "Hot"
             else sub.rising(limit=10)
         )
-        converted = [
-            RedditEntry(
-                title=post.title,
-                description=post.selftext,
-                image_url=post.url,
-                author=post.author,
-                upvotes=post.score,
-                nsfw=post.over_18,
-                flair=post.link_flair_text,
-                num_of_comments=post.num_comments,
-                post_permalink=post.permalink,
-                created_utc=post.created_utc,
-            )
-            async for post in sub_gen
-        ]
-        pages = RedditPages(entries=converted, ctx=ctx)
-        await pages.start()
+        await self._send_posts(ctx, sub_gen)
 
     @reddit.command(name="memes")
     @app_commands.describe(
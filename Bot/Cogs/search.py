@@ -1,13 +1,13 @@
 import datetime
+from pathlib import Path
 from typing import Dict, Optional
 from urllib.parse import quote_plus
 
 import ciso8601
-import orjson
 from dateutil.parser import parse
 from discord import PartialEmoji, app_commands
 from discord.ext import commands
-from gql import Client, gql
+from gql import gql
 from kumikocore import KumikoCore
 from Libs.ui.search import (
     AniListAnime,
@@ -18,11 +18,116 @@ from Libs.ui.search import (
     ModrinthPages,
     ModrinthProject,
 )
-from Libs.utils import AIOHTTPTransportExistingSession, GuildContext
+from Libs.utils import CachedSchemaClient, GuildContext
 from Libs.utils.pages import EmbedListSource, KumikoPages
 from typing_extensions import Annotated
 from yarl import URL
 
+ANILIST_SCHEMA_PATH = (
+    Path(__file__).parents[1].joinpath(".cache", "anilist_schema.json")
+)
+
+# Parsed once, instead of on every search
+ANIME_QUERY = gql(
+    """
+    query ($animeName: String!, $perPage: Int, $isAdult: Boolean!) {
+        Page (perPage: $perPage){
+            media(search: $animeName, isAdult: $isAdult, type: ANIME) {
+                title {
+                    native
+                    english
+                    romaji
+                }
+                status
+                description(asHtml: false)
+                format
+                status
+                startDate {
+                    day
+                    month
+                    year
+                }
+                endDate {
+                    day
+                    month
+                    year
+                }
+                episodes
+                duration
+                coverImage {
+                    extraLarge
+                    color
+                }
+                genres
+                tags {
+                    name
+                }
+                source
+                synonyms
+                idMal
+                siteUrl
+                averageScore
+                meanScore
+                popularity
+                trending
+                isAdult
+
+            }
+        }
+    }
+    """
+)
+
+MANGA_QUERY = gql(
+    """
+    query ($mangaName: String!, $perPage: Int, $isAdult: Boolean!) {
+        Page (perPage: $perPage){
+            media(search: $mangaName, isAdult: $isAdult, type: MANGA) {
+                title {
+                    native
+                    english
+                    romaji
+                }
+                status
+                description(asHtml: false)
+                format
+                status
+                startDate {
+                    day
+                    month
+                    year
+                }
+                endDate {
+                    day
+                    month
+                    year
+                }
+                chapters
+                volumes
+                coverImage {
+                    extraLarge
+                    color
+                }
+                genres
+                tags {
+                    name
+                }
+                source
+                synonyms
+                idMal
+                siteUrl
+                averageScore
+                meanScore
+                popularity
+                trending
+                isAdult
+
+            }
+        }
+    }
+    """
+)
+
 
 class ModrinthFlags(commands.FlagConverter):
     query: str = commands.flag(
@@ -50,6 +155,15 @@ class Searches(commands.Cog):
         self.session = self.bot.session
         self._TENOR_KEY = self.bot.config["TENOR_API_KEY"]
         self.api_url = "https://graphql.anilist.co/"
+        self.anilist = CachedSchemaClient(
+            self.api_url, self.session, ANILIST_SCHEMA_PATH
+        )
+
+    async def cog_load(self) -> None:
+        await self.anilist.start()
+
+    async def cog_unload(self) -> None:
+        await self.anilist.close()
 
     @property
     def display_emoji(self) -> PartialEmoji:
@@ -81,199 +195,87 @@ class Searches(commands.Cog):
     async def anime(self, ctx: GuildContext, *, name: str) -> None:
         """Searches up animes"""
         await ctx.defer()
-        async with Client(
-            transport=AIOHTTPTransportExistingSession(
-                url=self.api_url, client_session=self.session
-            ),
-            fetch_schema_from_transport=True,
-        ) as gql_session:
-            query = gql(
-                """
-            query ($animeName: String!, $perPage: Int, $isAdult: Boolean!) {
-                Page (perPage: $perPage){
-                    media(search: $animeName, isAdult: $isAdult, type: ANIME) {
-                        title {
-                            native
-                            english
-                            romaji
-                        }
-                        status
-                        description(asHtml: false)
-                        format
-                        status
-                        startDate {
-                            day
-                            month
-                            year
-                        }
-                        endDate {
-                            day
-                            month
-                            year
-                        }
-                        episodes
-                        duration
-                        coverImage {
-                            extraLarge
-                            color
-                        }
-                        genres
-                        tags {
-                            name
-                        }
-                        source
-                        synonyms
-                        idMal
-                        siteUrl
-                        averageScore
-                        meanScore
-                        popularity
-                        trending
-                        isAdult
-
-                    }
-                }
-            }
-            """
-            )
-
-            params = {"animeName": name, "perPage": 25, "isAdult": False}
-            data = await gql_session.execute(query, variable_values=params)
+        params = {"animeName": name, "perPage": 25, "isAdult": False}
+        data = await self.anilist.execute(ANIME_QUERY, variable_values=params)
 
-            if len(data["Page"]["media"]) == 0:
-                await ctx.send("The anime was not found")
-                return
+        if len(data["Page"]["media"]) == 0:
+            await ctx.send("The anime was not found")
+            return
 
-            converted = [
-                AniListAnime(
-                    title=AniListMediaTitle(
-                        native=anime["title"]["native"],
-                        english=anime["title"]["english"],
-                        romaji=anime["title"]["romaji"],
-                    ),
-                    status=anime["status"],
-                    description=anime["description"],
-                    format=anime["format"],
-                    start_date=self.parse_anilist_dates(anime["startDate"]),
-                    end_date=self.parse_anilist_dates(anime["endDate"]),
-                    episodes=anime["episodes"],
-                    duration=anime["duration"],
-                    cover_image=anime["coverImage"]["extraLarge"],
-                    cover_image_color=anime["coverImage"]["color"],
-                    genres=anime["genres"],
-                    tags=[tag["name"] for tag in anime["tags"]],
-                    synonyms=anime["synonyms"],
-                    mal_id=anime["idMal"],
-                    site_url=anime["siteUrl"],
-                    avg_score=anime["averageScore"],
-                    mean_score=anime["meanScore"],
-                    popularity=anime["popularity"],
-                    trending=anime["trending"],
-                    is_adult=anime["isAdult"],
-                )
-                for anime in data["Page"]["media"]
-            ]
-            pages = AniListAnimePages(converted, ctx=ctx)
-            await pages.start()
+        converted = [
+            AniListAnime(
+                title=AniListMediaTitle(
+                    native=anime["title"]["native"],
+                    english=anime["title"]["english"],
+                    romaji=anime["title"]["romaji"],
+                ),
+                status=anime["status"],
+                description=anime["description"],
+                format=anime["format"],
+                start_date=self.parse_anilist_dates(anime["startDate"]),
+                end_date=self.parse_anilist_dates(anime["endDate"]),
+                episodes=anime["episodes"],
+                duration=anime["duration"],
+                cover_image=anime["coverImage"]["extraLarge"],
+                cover_image_color=anime["coverImage"]["color"],
+                genres=anime["genres"],
+                tags=[tag["name"] for tag in anime["tags"]],
+                synonyms=anime["synonyms"],
+                mal_id=anime["idMal"],
+                site_url=anime["siteUrl"],
+                avg_score=anime["averageScore"],
+                mean_score=anime["meanScore"],
+                popularity=anime["popularity"],
+                trending=anime["trending"],
+                is_adult=anime["isAdult"],
+            )
+            for anime in data["Page"]["media"]
+        ]
+        pages = AniListAnimePages(converted, ctx=ctx)
+        await pages.start()
 
     @search.command(name="manga")
     @app_commands.describe(name="The name of the manga to search")
     async def manga(self, ctx: GuildContext, *, name: str):
         """Searches for manga on AniList"""
         await ctx.defer()
-        async with Client(
-            transport=AIOHTTPTransportExistingSession(
-                url=self.api_url, client_session=self.session
-            ),
-            fetch_schema_from_transport=True,
-        ) as gql_session:
-            query = gql(
-                """
-                query ($mangaName: String!, $perPage: Int, $isAdult: Boolean!) {
-                    Page (perPage: $perPage){
-                        media(search: $mangaName, isAdult: $isAdult, type: MANGA) {
-                            title {
-                                native
-                                english
-                                romaji
-                            }
-                            status
-                            description(asHtml: false)
-                            format
-                            status
-                            startDate {
-                                day
-                                month
-                                year
-                            }
-                            endDate {
-                                day
-                                month
-                                year
-                            }
-                            chapters
-                            volumes
-                            coverImage {
-                                extraLarge
-                                color
-                            }
-                            genres
-                            tags {
-                                name
-                            }
-                            source
-                            synonyms
-                            idMal
-                            siteUrl
-                            averageScore
-                            meanScore
-                            popularity
-                            trending
-                            isAdult
+        params = {"mangaName": name, "perPage": 25, "isAdult": False}
+        data = await self.anilist.execute(MANGA_QUERY, variable_values=params)
+        if len(data["Page"]["media"]) == 0:
+            await ctx.send("The manga(s) were not found")
+            return
 
-                        }
-                    }
-                }
-                """
+        converted = [
+            AniListManga(
+                title=AniListMediaTitle(
+                    native=manga["title"]["native"],
+                    english=manga["title"]["english"],
+                    romaji=manga["title"]["romaji"],
+                ),
+                status=manga["status"],
+                description=manga["description"],
+                format=manga["format"],
+                start_date=self.parse_anilist_dates(manga["startDate"]),
+                end_date=self.parse_anilist_dates(manga["endDate"]),
+                chapters=manga["chapters"],
+                volumes=manga["volumes"],
+                cover_image=manga["coverImage"]["extraLarge"],
+                cover_image_color=manga["coverImage"]["color"],
+                genres=manga["genres"],
+                tags=[tag["name"] for tag in manga["tags"]],
+                synonyms=manga["synonyms"],
+                mal_id=manga["idMal"],
+                site_url=manga["siteUrl"],
+                avg_score=manga["averageScore"],
+                mean_score=manga["meanScore"],
+                popularity=manga["popularity"],
+                trending=manga["trending"],
+                is_adult=manga["isAdult"],
             )
-
-            params = {"mangaName": name, "perPage": 25, "isAdult": False}
-            data = await gql_session.execute(query, variable_values=params)
-            if len(data["Page"]["media"]) == 0:
-                await ctx.send("The manga(s) were not found")
-                return
-
-            converted = [
-                AniListManga(
-                    title=AniListMediaTitle(
-                        native=manga["title"]["native"],
-                        english=manga["title"]["english"],
-                        romaji=manga["title"]["romaji"],
-                    ),
-                    status=manga["status"],
-                    description=manga["description"],
-                    format=manga["format"],
-                    start_date=self.parse_anilist_dates(manga["startDate"]),
-                    end_date=self.parse_anilist_dates(manga["endDate"]),
-                    chapters=manga["chapters"],
-                    volumes=manga["volumes"],
-                    cover_image=manga["coverImage"]["extraLarge"],
-                    cover_image_color=manga["coverImage"]["color"],
-                    genres=manga["genres"],
-                    tags=[tag["name"] for tag in manga["tags"]],
-                    synonyms=manga["synonyms"],
-                    mal_id=manga["idMal"],
-                    site_url=manga["siteUrl"],
-                    avg_score=manga["averageScore"],
-                    mean_score=manga["meanScore"],
-                    popularity=manga["popularity"],
-                    trending=manga["trending"],
-                    is_adult=manga["isAdult"],
-                )
-                for manga in data["Page"]["media"]
-            ]
-            pages = AniListMangaPages(converted, ctx=ctx)
-            await pages.start()
+            for manga in data["Page"]["media"]
+        ]
+        pages = AniListMangaPages(converted, ctx=ctx)
+        await pages.start()
 
     @search.command(name="gifs")
     @app_commands.describe(search="The search term to use")
@@ -287,19 +289,19 @@ class Searches(commands.Cog):
             "limit": 25,
             "media_filter": "minimal",
         }
-        async with self.session.get(url, params=params) as r:
-            data = await r.json(loads=orjson.loads)
-            if len(data["results"]) == 0 or r.status == 404:
-                await ctx.send("The gifs were not found")
-                return
-            else:
-                main_data = [
-                    {"image": item["media_formats"]["gif"]["url"]}
-                    for item in data["results"]
-                ]
-                embed_source = EmbedListSource(main_data, per_page=1)
-                pages = KumikoPages(source=embed_source, ctx=ctx)
-                await pages.start()
+        r = await self.bot.http_cache.get(url, params=params)
+        data = r.json()
+        if len(data["results"]) == 0 or r.status == 404:
+            await ctx.send("The gifs were not found")
+            return
+        else:
+            main_data = [
+                {"image": item["media_formats"]["gif"]["url"]}
+                for item in data["results"]
+            ]
+            embed_source = EmbedListSource(main_data, per_page=1)
+            pages = KumikoPages(source=embed_source, ctx=ctx)
+            await pages.start()
 
     @search.command(
         name="modrinth",
@@ -319,34 +321,34 @@ class Searches(commands.Cog):
             "limit": 25,
             "facets": f"[{','.join(list_facets).rstrip(',')}]",
         }
-        async with self.session.get(url, params=params) as r:
-            data = await r.json(loads=orjson.loads)
-            if data["total_hits"] == 0:
-                await ctx.send("The projects(s) were/was not found")
-                return
+        r = await self.bot.http_cache.get(url, params=params)
+        data = r.json()
+        if data["total_hits"] == 0:
+            await ctx.send("The projects(s) were/was not found")
+            return
 
-            converted = [
-                ModrinthProject(
-                    title=item["title"],
-                    description=item["description"],
-                    display_categories=item["display_categories"],
-                    client_side=item["client_side"],
-                    server_side=item["server_side"],
-                    project_type=item["project_type"],
-                    project_slug=item["slug"],
-                    downloads=item["downloads"],
-                    icon_url=item["icon_url"],
-                    author=item["author"],
-                    versions=item["versions"],
-                    latest_version=item["latest_version"],
-                    date_created=ciso8601.parse_datetime(item["date_created"]),
-                    date_updated=ciso8601.parse_datetime(item["date_modified"]),
-                    license=item["license"],
-                )
-                for item in data["hits"]
-            ]
-            pages = ModrinthPages(converted, ctx=ctx)
-            await pages.start()
+        converted = [
+            ModrinthProject(
+                title=item["title"],
+                description=item["description"],
+                display_categories=item["display_categories"],
+                client_side=item["client_side"],
+                server_side=item["server_side"],
+                project_type=item["project_type"],
+                project_slug=item["slug"],
+                downloads=item["downloads"],
+                icon_url=item["icon_url"],
+                author=item["author"],
+                versions=item["versions"],
+                latest_version=item["latest_version"],
+                date_created=ciso8601.parse_datetime(item["date_created"]),
+                date_updated=ciso8601.parse_datetime(item["date_modified"]),
+                license=item["license"],
+            )
+            for item in data["hits"]
+        ]
+        pages = ModrinthPages(converted, ctx=ctx)
+        await pages.start()
 
 
 async def setup(bot: KumikoCore) -> None:
@@ -1,5 +1,6 @@
 import random
-from typing import Optional
+from functools import partial
+from typing import List, Optional
 
 import orjson
 from discord import PartialEmoji, app_commands
@@ -10,6 +11,17 @@ from Libs.utils import Embed
 from Libs.utils.pages import EmbedListSource, KumikoPages
 from yarl import URL
 
+WAIFU_URL = URL("https://api.waifu.im/search/")
+WAIFU_TAGS = (
+    "uniform",
+    "maid",
+    "waifu",
+    "marin-kitagawa",
+    "mori-calliope",
+    "raiden-shogun",
+    "selfies",
+)
+
 
 class Waifu(commands.Cog):
     """Gives you random waifu pics"""
@@ -22,47 +34,48 @@ class Waifu(commands.Cog):
     def display_emoji(self) -> PartialEmoji:
         return PartialEmoji.from_str("<:UwU:1013221555003719772>")
 
-    @commands.hybrid_group(name="waifu", fallback="one")
-    async def waifu(self, ctx: commands.Context) -> None:
-        """Gives you a waifu"""
-        waifu_list = [
-            "uniform",
-            "maid",
-            "waifu",
-            "marin-kitagawa",
-            "mori-calliope",
-            "raiden-shogun",
-            "selfies",
-        ]
+    async def cog_load(self) -> None:
+        # Up to 30 images come back per request with `many`, so one request fills a buffer
+        for tag in WAIFU_TAGS:
+            self.bot.image_pool.register(
+                f"waifu:{tag}", partial(self._fetch_batch, tag), capacity=30
+            )
+
+    async def cog_unload(self) -> None:
+        self.bot.image_pool.unregister(*[f"waifu:{tag}" for tag in WAIFU_TAGS])
+
+    async def _fetch_batch(self, tag: str) -> List[str]:
         params = {
-            "included_tags": random.choice(waifu_list),
+            "included_tags": tag,
             "is_nsfw": "false",
             "excluded_tags": "oppai",
+            "many": "true",
         }
-        async with self.session.get("https://api.waifu.im/search/", params=params) as r:
+        async with self.session.get(WAIFU_URL, params=params) as r:
+            r.raise_for_status()
             data = await r.json(loads=orjson.loads)
-            embed = Embed().set_image(url=data["images"][0]["url"])
-            await ctx.send(embed=embed)
+            return [item["url"] for item in data["images"]]
+
+    @commands.hybrid_group(name="waifu", fallback="one")
+    async def waifu(self, ctx: commands.Context) -> None:
+        """Gives you a waifu"""
+        url = await self.bot.image_pool.get(f"waifu:{random.choice(WAIFU_TAGS)}")
+        if url is None:
+            await ctx.send("Could not get an image right now. Please try again later")
+            return
+        embed = Embed().set_image(url=url)
+        await ctx.send(embed=embed)
 
     @waifu.command(name="many")
     async def many_random_waifus(self, ctx: commands.Context) -> None:
         """Returns up to 30 random waifu pics"""
-        waifu_list = [
-            "uniform",
-            "maid",
-            "waifu",
-            "marin-kitagawa",
-            "mori-calliope",
-            "raiden-shogun",
-            "selfies",
-        ]
         params = {
-            "included_tags": random.choice(waifu_list),
+            "included_tags": random.choice(WAIFU_TAGS),
             "is_nsfw": "False",
             "excluded_tags": "oppai",
             "many": "true",
         }
-        async with self.session.get("https://api.waifu.im/search/", params=params) as r:
+        async with self.session.get(WAIFU_URL, params=params) as r:
             data = await r.json(loads=orjson.loads)
             converted_data = [{"image": item["url"]} for item in data["images"]]
             embed_source = EmbedListSource(converted_data, per_page=1)
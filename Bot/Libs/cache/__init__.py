@@ -1,3 +1,17 @@
 from .cp_manager import KumikoCPManager as KumikoCPManager
+from .decorators import (
+    invalidate_namespace as invalidate_namespace,
+    kumiko_cached as kumiko_cached,
+)
+from .http_cache import (
+    CachedResponse as CachedResponse,
+    HostPolicy as HostPolicy,
+    HTTPCache as HTTPCache,
+)
 from .key_builder import command_key_builder as command_key_builder
-from .redis_cache import KumikoCache as KumikoCache
+from .redis_cache import (
+    KumikoCache as KumikoCache,
+    KumikoCacheBatch as KumikoCacheBatch,
+    get_json_client as get_json_client,
+    get_redis_client as get_redis_client,
+)
@@ -0,0 +1,167 @@
+import asyncio
+import functools
+import inspect
+import logging
+import time
+import weakref
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+import msgspec
+from redis.asyncio.connection import ConnectionPool
+
+from .redis_cache import KumikoCache
+
+T = TypeVar("T")
+
+# Loads that are currently running, keyed by the Redis key.
+# Concurrent misses for the same key await the same task instead of each querying the database
+_inflight: Dict[str, "asyncio.Task[Any]"] = {}
+
+# Loads that were running when their key was invalidated. They read the value from before the write,
+# so their result is still returned to the callers already waiting, but not stored
+_invalidated: "weakref.WeakSet[asyncio.Task[Any]]" = weakref.WeakSet()
+
+
+def _discard_inflight(match: Callable[[str], bool]) -> None:
+    for cache_key in [cache_key for cache_key in _inflight if match(cache_key)]:
+        _invalidated.add(_inflight.pop(cache_key))
+
+
+class CachedEntry(msgspec.Struct):
+    value: msgspec.Raw
+    expires_at: float
+
+
+def _log_failed_refresh(task: "asyncio.Task[Any]") -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logging.getLogger("kumiko").warning(
+            "Failed to refresh cached value", exc_info=task.exception()
+        )
+
+
+def kumiko_cached(
+    ttl: int = 30,
+    *,
+    key: Callable[..., str],
+    stale_ttl: int = 0,
+    type: Any = Any,
+    pool_arg: str = "redis_pool",
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Read-through cache for coroutines, backed by `KumikoCache`
+
+    Return values are serialized with msgspec, and concurrent misses for the same key
+    are coalesced into a single call of the wrapped coroutine.
+    Once an entry is older than `ttl`, it is still served for another `stale_ttl` seconds
+    while one background task refreshes it (stale-while-revalidate).
+
+    The wrapped coroutine must take the Redis connection pool as an argument (named `redis_pool` by default).
+
+    Example:
+        ```py
+        @kumiko_cached(
+            ttl=60,
+            key=lambda id, name, **_: command_key_builder(
+                prefix="cache", namespace="kumiko", id=id, command=f"pins:{name}"
+            ),
+        )
+        async def get_pin(id: int, name: str, pool: asyncpg.Pool, redis_pool: ConnectionPool):
+            ...
+        ```
+
+    Args:
+        ttl (int): How long, in seconds, the value is considered fresh. Defaults to 30.
+        key (Callable[..., str]): Builds the Redis key. Called with all of the arguments of the wrapped coroutine as keyword arguments
+        stale_ttl (int): How long, in seconds, an expired value may still be served while it is refreshed. Defaults to 0.
+        type (Any): The return type of the wrapped coroutine, used to decode cached values. Defaults to Any.
+        pool_arg (str): The name of the argument holding the Redis connection pool. Defaults to "redis_pool".
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        signature = inspect.signature(func)
+
+        def resolve(*args: Any, partial: bool = False, **kwargs: Any):
+            if partial:
+                bound = signature.bind_partial(*args, **kwargs)
+            else:
+                bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            redis_pool: ConnectionPool = bound.arguments[pool_arg]
+            return KumikoCache(redis_pool), key(**bound.arguments)
+
+        async def fill(cache: KumikoCache, cache_key: str, args, kwargs) -> T:
+            result = await func(*args, **kwargs)
+            if asyncio.current_task() in _invalidated:
+                return result
+
+            entry = CachedEntry(
+                value=msgspec.Raw(msgspec.json.encode(result)),
+                expires_at=time.time() + ttl,
+            )
+            await cache.set_basic_cache(
+                key=cache_key,
+                value=msgspec.json.encode(entry),
+                ttl=ttl + stale_ttl,
+            )
+            return result
+
+        def load(cache: KumikoCache, cache_key: str, args, kwargs) -> "asyncio.Task[T]":
+            task = _inflight.get(cache_key)
+            if task is None:
+                task = asyncio.ensure_future(fill(cache, cache_key, args, kwargs))
+                _inflight[cache_key] = task
+                task.add_done_callback(
+                    lambda done: _inflight.pop(cache_key)
+                    if _inflight.get(cache_key) is done
+                    else None
+                )
+            return task
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            cache, cache_key = resolve(*args, **kwargs)
+            raw = await cache.get_basic_cache(cache_key)
+            if raw is None:
+                # Shielded so that one cancelled caller does not cancel the load for the others
+                return await asyncio.shield(load(cache, cache_key, args, kwargs))
+
+            entry = msgspec.json.decode(raw, type=CachedEntry)
+            if entry.expires_at <= time.time() and cache_key not in _inflight:
+                load(cache, cache_key, args, kwargs).add_done_callback(
+                    _log_failed_refresh
+                )
+            return msgspec.json.decode(entry.value, type=type)
+
+        async def invalidate(*args: Any, **kwargs: Any) -> None:
+            """Deletes the cached value for the given arguments
+
+            Only the arguments used by `key` and the Redis connection pool need to be given.
+            A load of the key that is still running won't store its result.
+            """
+            cache, cache_key = resolve(*args, partial=True, **kwargs)
+            _discard_inflight(lambda inflight_key: inflight_key == cache_key)
+            await cache.delete_basic_cache(cache_key)
+
+        wrapper.invalidate = invalidate  # type: ignore
+        return wrapper
+
+    return decorator
+
+
+async def invalidate_namespace(
+    redis_pool: ConnectionPool, id: Optional[int], command: str
+) -> None:
+    """Deletes every cached value under `cache:kumiko:{id}:{command}:*`
+
+    This is used when a write can affect more than one key (eg. renaming a pin).
+    Loads of those keys that are still running won't store their results.
+
+    Args:
+        redis_pool (ConnectionPool): Redis connection pool
+        id (Optional[int]): Discord User or Guild ID
+        command (str): The command part of the key
+    """
+    prefix = f"cache:kumiko:{id}:{command}:"
+    _discard_inflight(lambda cache_key: cache_key.startswith(prefix))
+
+    cache = KumikoCache(redis_pool)
+    await cache.delete_matching_cache(f"{prefix}*")
@@ -0,0 +1,206 @@
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Union
+
+import msgspec
+from aiohttp import ClientSession
+from redis.exceptions import RedisError
+from yarl import URL
+
+from .redis_cache import KumikoCache
+
+Params = Mapping[str, Union[str, int, float]]
+
+
+class HostPolicy(NamedTuple):
+    """How long the responses of a host are cached
+
+    `ttl` is how long, in seconds, a response is served without asking the host again.
+    After that, the response is kept for another `keep` seconds, so it can be revalidated with its ETag.
+    """
+
+    ttl: int
+    keep: int = 0
+
+
+DEFAULT_HOST_POLICIES: Dict[str, HostPolicy] = {
+    # Conditional requests answered with 304 don't count against GitHub's rate limit
+    "api.github.com": HostPolicy(ttl=60, keep=24 * 60 * 60),
+    "api.dictionaryapi.dev": HostPolicy(ttl=24 * 60 * 60),
+    "jisho.org": HostPolicy(ttl=24 * 60 * 60),
+    "api.modrinth.com": HostPolicy(ttl=10 * 60, keep=60 * 60),
+    "tenor.googleapis.com": HostPolicy(ttl=10 * 60),
+    "pronoundb.org": HostPolicy(ttl=10 * 60),
+    "en.pronouns.page": HostPolicy(ttl=60 * 60),
+}
+
+
+class CachedResponse(msgspec.Struct):
+    status: int
+    body: str
+    content_type: str = "application/json"
+    etag: Optional[str] = None
+    fetched_at: float = 0.0
+
+    def json(self) -> Any:
+        return msgspec.json.decode(self.body)
+
+
+class HTTPCache:
+    """Read-through cache of third-party API responses, stored in Redis through `KumikoCache`
+
+    Responses are keyed on the method, URL and query parameters, and cached for as long as the host's `HostPolicy` says.
+    Once a response expires, it is revalidated with `If-None-Match` if the host gave it an ETag,
+    so an unchanged resource only costs a 304.
+    Concurrent requests for the same key share one request, and only successful responses are cached.
+    If Redis is unavailable, requests go straight to the host.
+    """
+
+    def __init__(
+        self,
+        session: ClientSession,
+        cache: KumikoCache,
+        *,
+        policies: Optional[Dict[str, HostPolicy]] = None,
+        default_policy: HostPolicy = HostPolicy(ttl=5 * 60),
+    ) -> None:
+        self.session = session
+        self.cache = cache
+        self.policies = DEFAULT_HOST_POLICIES if policies is None else policies
+        self.default_policy = default_policy
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self._inflight: Dict[str, "asyncio.Task[CachedResponse]"] = {}
+        self.logger = logging.getLogger("kumiko")
+
+    def policy_for(self, url: URL) -> HostPolicy:
+        return self.policies.get(url.host or "", self.default_policy)
+
+    @staticmethod
+    def build_key(method: str, url: URL) -> str:
+        # Sorted, so the order the parameters were given in doesn't matter
+        normalized = url.with_query(sorted(url.query.items()))
+        digest = hashlib.sha256(f"{method} {normalized}".encode()).hexdigest()
+        return f"cache:kumiko:http:{digest}"
+
+    async def _load(self, key: str) -> Optional[CachedResponse]:
+        try:
+            raw = await self.cache.get_basic_cache(key)
+        except RedisError:
+            self.logger.warning("Could not read cached response %s", key)
+            return None
+        if raw is None:
+            return None
+
+        try:
+            return msgspec.json.decode(raw, type=CachedResponse)
+        except msgspec.DecodeError:
+            # Written in an older format. Refetching it overwrites the entry
+            self.logger.warning("Could not decode cached response %s", key)
+            return None
+
+    async def _store(
+        self, key: str, response: CachedResponse, policy: HostPolicy
+    ) -> None:
+        try:
+            await self.cache.set_basic_cache(
+                key=key,
+                value=msgspec.json.encode(response),
+                ttl=policy.ttl + policy.keep,
+            )
+        except RedisError:
+            self.logger.warning("Could not cache response %s", key)
+
+    async def _fetch(
+        self,
+        method: str,
+        url: URL,
+        headers: Optional[Mapping[str, str]],
+        key: str,
+        stale: Optional[CachedResponse],
+    ) -> CachedResponse:
+        request_headers = dict(headers or {})
+        if stale is not None and stale.etag is not None:
+            request_headers["If-None-Match"] = stale.etag
+
+        async with self.session.request(
+            method, url, headers=request_headers
+        ) as response:
+            if response.status == 304 and stale is not None:
+                self.revalidations += 1
+                result = CachedResponse(
+                    status=stale.status,
+                    body=stale.body,
+                    content_type=stale.content_type,
+                    etag=response.headers.get("ETag", stale.etag),
+                    fetched_at=time.time(),
+                )
+            else:
+                self.misses += 1
+                result = CachedResponse(
+                    status=response.status,
+                    body=await response.text(),
+                    content_type=response.content_type,
+                    etag=response.headers.get("ETag"),
+                    fetched_at=time.time(),
+                )
+
+        if result.status == 200:
+            await self._store(key, result, self.policy_for(url))
+        return result
+
+    async def request(
+        self,
+        method: str,
+        url: Union[str, URL],
+        *,
+        params: Optional[Params] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> CachedResponse:
+        """Sends a request, or answers it from the cache
+
+        Args:
+            method (str): The HTTP method
+            url (Union[str, URL]): The URL to request
+            params (Optional[Params]): Query parameters. Defaults to None
+            headers (Optional[Mapping[str, str]]): Request headers. These are not part of the key. Defaults to None
+
+        Returns:
+            CachedResponse: The status and body of the response
+        """
+        target = URL(url)
+        if params:
+            target = target.update_query(params)
+
+        key = self.build_key(method, target)
+        cached = await self._load(key)
+        if (
+            cached is not None
+            and time.time() - cached.fetched_at < self.policy_for(target).ttl
+        ):
+            self.hits += 1
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch(method, target, headers, key, cached)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shielded so that one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def get(
+        self,
+        url: Union[str, URL],
+        *,
+        params: Optional[Params] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> CachedResponse:
+        """Shorthand for `request("GET", ...)`"""
+        return await self.request("GET", url, params=params, headers=headers)
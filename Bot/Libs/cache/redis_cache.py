@@ -1,17 +1,154 @@
-from typing import Any, Dict, Optional, Union
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type, TypeVar, Union
 
 import msgspec
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
 from redis.asyncio.connection import ConnectionPool
 
 from .key_builder import command_key_builder
 
+BE = TypeVar("BE", bound=BaseException)
+
+# One client per connection pool, kept for the lifetime of the process.
+# The bot only ever creates one pool, so these never grow past a single entry
+_clients: Dict[ConnectionPool, redis.Redis] = {}
+_json_clients: Dict[ConnectionPool, Any] = {}
+
+
+def get_redis_client(connection_pool: ConnectionPool) -> redis.Redis:
+    """Obtains the long-lived client for a connection pool
+
+    Constructing a `redis.Redis` client is not free, so instead of making one per call,
+    one client is shared by everything that uses the same connection pool.
+
+    Args:
+        connection_pool (ConnectionPool): Redis connection pool
+
+    Returns:
+        redis.Redis: The shared client
+    """
+    client = _clients.get(connection_pool)
+    if client is None:
+        client = redis.Redis(connection_pool=connection_pool)
+        _clients[connection_pool] = client
+    return client
+
+
+def get_json_client(connection_pool: ConnectionPool) -> Any:
+    """Obtains the shared RedisJSON client (using msgspec as the encoder) for a connection pool
+
+    Args:
+        connection_pool (ConnectionPool): Redis connection pool
+
+    Returns:
+        Any: The shared RedisJSON client
+    """
+    json_client = _json_clients.get(connection_pool)
+    if json_client is None:
+        # Then again we know this works and redis-py 5.0 just broke things
+        json_client = get_redis_client(connection_pool).json(encoder=msgspec.json, decoder=msgspec.json)  # type: ignore # Assigning it the msgspec json encoders do work.
+        _json_clients[connection_pool] = json_client
+    return json_client
+
+
+class KumikoCacheBatch:
+    """Groups writes into a single pipeline flush
+
+    Commands are queued locally and sent all at once when the batch exits.
+    By default, the batch is wrapped in MULTI/EXEC, so either all of the writes are applied or none are.
+    Obtain this through `KumikoCache.batch()`.
+    """
+
+    def __init__(self, pipeline: Pipeline) -> None:
+        self.pipeline = pipeline
+        self.results: List[Any] = []
+
+    async def __aenter__(self) -> "KumikoCacheBatch":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BE]],
+        exc: Optional[BE],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is None:
+                self.results = await self.pipeline.execute()
+        finally:
+            await self.pipeline.reset()
+
+    def __len__(self) -> int:
+        return len(self.pipeline)
+
+    def set_basic_cache(
+        self, key: str, value: Union[str, bytes] = "", ttl: Optional[int] = 30
+    ) -> None:
+        self.pipeline.set(name=key, value=value, ex=ttl)
+
+    def set_json_cache(
+        self,
+        key: str,
+        value: Union[Dict[str, Any], Any],
+        path: str = "$",
+        ttl: Optional[int] = None,
+    ) -> None:
+        self.pipeline.execute_command("JSON.SET", key, path, msgspec.json.encode(value))
+        if isinstance(ttl, int):
+            self.pipeline.expire(name=key, time=ttl)
+
+    def merge_json_cache(
+        self,
+        key: str,
+        value: Union[Dict, Any],
+        path: str = "$",
+        ttl: Optional[int] = None,
+    ) -> None:
+        self.pipeline.execute_command(
+            "JSON.MERGE", key, path, msgspec.json.encode(value)
+        )
+        if isinstance(ttl, int):
+            self.pipeline.expire(name=key, time=ttl)
+
+    def expire(self, key: str, ttl: int) -> None:
+        self.pipeline.expire(name=key, time=ttl)
+
+    def delete(self, *keys: str) -> None:
+        self.pipeline.delete(*keys)
+
+    def delete_json_cache(self, key: str, path: str = "$") -> None:
+        self.pipeline.execute_command("JSON.DEL", key, path)
+
+    def publish(self, channel: str, message: str) -> None:
+        self.pipeline.publish(channel, message)
+
 
 class KumikoCache:
     """Kumiko's custom caching library. Uses Redis as the backend."""
 
     def __init__(self, connection_pool: ConnectionPool) -> None:
         self.connection_pool = connection_pool
+        self.client = get_redis_client(connection_pool)
+        self._json = get_json_client(connection_pool)
+
+    def batch(self, transaction: bool = True) -> KumikoCacheBatch:
+        """Groups set, merge, expire and delete operations into one round trip
+
+        Example:
+            ```py
+            async with cache.batch() as b:
+                b.set_json_cache(key, value)
+                b.expire(key, 60)
+            ```
+
+        Args:
+            transaction (bool): Whether to wrap the batch in MULTI/EXEC. Defaults to True
+
+        Returns:
+            KumikoCacheBatch: The batch context
+        """
+        return KumikoCacheBatch(self.client.pipeline(transaction=transaction))
 
     async def set_basic_cache(
         self,
@@ -28,8 +165,7 @@ class KumikoCache:
         default_key = command_key_builder(
             prefix="cache", namespace="kumiko", id=None, command=None
         )
-        conn: redis.Redis = redis.Redis(connection_pool=self.connection_pool)
-        await conn.set(
+        await self.client.set(
             name=key if key is not None else default_key, value=value, ex=ttl
         )
 
@@ -39,8 +175,7 @@ class KumikoCache:
         Args:
             key (str): Key to get from Redis
         """
-        conn: redis.Redis = redis.Redis(connection_pool=self.connection_pool)
-        res = await conn.get(key)
+        res = await self.client.get(key)
         return res
 
     async def delete_basic_cache(self, key: str) -> None:
@@ -49,8 +184,7 @@ class KumikoCache:
         Args:
             key (str): Key to use
         """
-        conn: redis.Redis = redis.Redis(connection_pool=self.connection_pool)
-        await conn.delete(key)
+        await self.client.delete(key)
 
     async def set_json_cache(
         self,
@@ -67,12 +201,13 @@ class KumikoCache:
             path (str): The path to look for or set. Defaults to "$"
             ttl (Union[int, None], optional): TTL of the key-value pair. If None, then the TTL will not be set. Defaults to None.
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.connection_pool)
-        await client.json(encoder=msgspec.json, decoder=msgspec.json).set(  # type: ignore # Assigning it the msgspec json encoders do work.
-            name=key, path=path, obj=value
-        )
-        if isinstance(ttl, int):
-            await client.expire(name=key, time=ttl)
+        if not isinstance(ttl, int):
+            await self._json.set(name=key, path=path, obj=value)
+            return
+
+        # JSON.SET has no EX option, so the expiry is sent within the same flush
+        async with self.batch() as b:
+            b.set_json_cache(key=key, value=value, path=path, ttl=ttl)
 
     # The output type comes from here: https://github.com/redis/redis-py/blob/9f503578d1ffed20d63e8023bcd8a7dccd15ecc5/redis/commands/json/_util.py#L3C1-L3C73
     async def get_json_cache(
@@ -88,11 +223,7 @@ class KumikoCache:
         Returns:
             Dict[str, Any]: The value of the key-value pair
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.connection_pool)
-        # Then again we know this works and redis-py 5.0 just broke things
-        value = await client.json(encoder=msgspec.json, decoder=msgspec.json).get(  # type: ignore
-            key, path
-        )
+        value = await self._json.get(key, path)
         if value is None:
             return None
         if value_only is True:
@@ -106,10 +237,9 @@ class KumikoCache:
             key (str): The key to use in Redis
             path (str): The path to look for. Defaults to "$" (root)
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.connection_pool)
         # With the upgrade to 5.0, they made it where the return value is an int
         # this basically breaks things
-        await client.json().delete(key=key, path=path)  # type: ignore
+        await self._json.delete(key=key, path=path)
 
     async def merge_json_cache(
         self,
@@ -128,11 +258,35 @@ class KumikoCache:
             path (str): The path to update. Defaults to "$"
             ttl (int): TTL. Usually leave this for perma cache. Defaults to None.
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.connection_pool)
-        # Then again we know this works and redis-py 5.0 just broke things
-        await client.json(encoder=msgspec.json, decoder=msgspec.json).merge(name=key, path=path, obj=value)  # type: ignore
-        if isinstance(ttl, int):
-            await client.expire(name=key, time=ttl)
+        if not isinstance(ttl, int):
+            await self._json.merge(name=key, path=path, obj=value)
+            return
+
+        async with self.batch() as b:
+            b.merge_json_cache(key=key, value=value, path=path, ttl=ttl)
+
+    async def delete_matching_cache(self, pattern: str) -> int:
+        """Deletes every key matching the glob-style pattern
+
+        Keys are found with SCAN (so Redis is never blocked like with KEYS),
+        and are deleted in batches.
+
+        Args:
+            pattern (str): Glob-style pattern to match (eg. `cache:kumiko:123:pins:*`)
+
+        Returns:
+            int: The amount of keys deleted
+        """
+        deleted = 0
+        keys = []
+        async for key in self.client.scan_iter(match=pattern, count=500):
+            keys.append(key)
+            if len(keys) >= 500:
+                deleted += await self.client.unlink(*keys)
+                keys.clear()
+        if keys:
+            deleted += await self.client.unlink(*keys)
+        return deleted
 
     async def cache_exists(self, key: str) -> bool:
         """Checks to make sure if the cache exists
@@ -143,6 +297,5 @@ class KumikoCache:
         Returns:
             bool: Whether the key exists or not
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.connection_pool)
-        key_exists = await client.exists(key) >= 1
+        key_exists = await self.client.exists(key) >= 1
         return True if key_exists else False
@@ -2,6 +2,7 @@ from .crud_utils import (
     add_more_to_auction as add_more_to_auction,
     create_auction as create_auction,
     delete_auction as delete_auction,
+    expire_auctions as expire_auctions,
     obtain_item_info as obtain_item_info,
     purchase_auction as purchase_auction,
 )
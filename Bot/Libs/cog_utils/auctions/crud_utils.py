@@ -303,3 +303,32 @@ async def obtain_item_info(
             return [dict(row) for row in new_res]
 
         return dict(res)
+
+
+async def expire_auctions(conn: Union[asyncpg.Pool, asyncpg.Connection]) -> int:
+    """Returns every listing older than 24 hours to the inventory of its seller
+
+    The expired listings are deleted and added back to `user_inv` within one statement.
+
+    Args:
+        conn (Union[asyncpg.Pool, asyncpg.Connection]): Asyncpg connection
+
+    Returns:
+        int: The amount of listings that expired
+    """
+    query = """
+    WITH expired AS (
+        DELETE FROM auction_house
+        WHERE listed_at < (NOW() AT TIME ZONE 'utc') - INTERVAL '24 HOURS'
+        RETURNING user_id, guild_id, item_id, amount_listed
+    ), returned AS (
+        INSERT INTO user_inv (owner_id, guild_id, item_id, amount_owned)
+        SELECT user_id, guild_id, item_id, amount_listed
+        FROM expired
+        ON CONFLICT (owner_id, item_id) DO UPDATE
+        SET amount_owned = user_inv.amount_owned + excluded.amount_owned
+        RETURNING 1
+    )
+    SELECT COUNT(*) FROM returned;
+    """
+    return await conn.fetchval(query) or 0
@@ -1,22 +1,20 @@
 from discord.ext import commands
-from Libs.config import GuildCacheHandler
 from Libs.errors import EconomyDisabledError
+from Libs.utils import KContext
 
 
-async def check_economy_enabled(ctx: commands.Context) -> bool:
+async def check_economy_enabled(ctx: KContext) -> bool:
     if ctx.guild is None:
         raise EconomyDisabledError
 
-    cache = GuildCacheHandler(ctx.guild.id, ctx.bot.redis_pool)
-    res = await cache.get_value(".config.local_economy")
-
-    if not isinstance(res, bool) or res is False:
+    guild_config = await ctx.get_guild_config()
+    if guild_config is None or guild_config.config.local_economy is not True:
         raise EconomyDisabledError
-    return res
+    return True
 
 
 def is_economy_enabled():
-    async def pred(ctx: commands.Context):
+    async def pred(ctx: KContext):
         return await check_economy_enabled(ctx)
 
     return commands.check(pred)
@@ -7,6 +7,7 @@ from .job_utils import (
     create_job as create_job,
     create_job_output_item as create_job_output_item,
     get_job as get_job,
+    pay_workers as pay_workers,
     submit_job_app as submit_job_app,
     update_job as update_job,
 )
@@ -1,6 +1,7 @@
 from typing import Dict, List, TypedDict, Union
 
 import asyncpg
+from Libs.utils import calc_rank
 
 
 class JobResults(TypedDict):
@@ -168,3 +169,50 @@ async def create_job_output_item(
         else:
             await tr.commit()
             return status
+
+
+async def pay_workers(
+    conn: Union[asyncpg.Connection, asyncpg.pool.PoolConnectionProxy]
+) -> int:
+    """Pays every worker the summed pay of their jobs
+
+    The pay of every worker is summed with one query, and all of them are paid with one UPDATE,
+    instead of two queries per user. Workers whose new balance reaches a higher rank (see `calc_rank`) are ranked up as well.
+
+    Args:
+        conn (Union[asyncpg.Connection, asyncpg.pool.PoolConnectionProxy]): Asyncpg connection
+
+    Returns:
+        int: The amount of workers paid
+    """
+    totals_query = """
+    SELECT eco_user.id, eco_user.rank, eco_user.petals, pay.total
+    FROM (
+        SELECT job_lookup.worker_id, SUM(job.pay_amount) AS total
+        FROM job_lookup
+        INNER JOIN job ON job.id = job_lookup.job_id
+        WHERE job_lookup.listed = False
+        GROUP BY job_lookup.worker_id
+        HAVING SUM(job.pay_amount) IS NOT NULL
+    ) AS pay
+    INNER JOIN eco_user ON eco_user.id = pay.worker_id
+    FOR UPDATE OF eco_user;
+    """
+    pay_query = """
+    UPDATE eco_user
+    SET petals = eco_user.petals + pay.total, rank = pay.rank
+    FROM unnest($1::bigint[], $2::bigint[], $3::int[]) AS pay(id, total, rank)
+    WHERE eco_user.id = pay.id;
+    """
+    async with conn.transaction():
+        rows = await conn.fetch(totals_query)
+        if not rows:
+            return 0
+
+        ids = [row["id"] for row in rows]
+        totals = [row["total"] for row in rows]
+        ranks = [
+            max(row["rank"], calc_rank(row["petals"] + row["total"])) for row in rows
+        ]
+        await conn.execute(pay_query, ids, totals, ranks)
+    return len(rows)
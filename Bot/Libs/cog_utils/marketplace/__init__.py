@@ -3,4 +3,5 @@ from .utils import (
     format_item_options as format_item_options,
     get_item as get_item,
     is_payment_valid as is_payment_valid,
+    restock_items as restock_items,
 )
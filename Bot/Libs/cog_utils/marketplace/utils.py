@@ -1,8 +1,64 @@
-from typing import Any, Dict, List, Union
+import time
+from typing import Any, Dict, List, NamedTuple, Union
 
 import asyncpg
 
 
+class RestockResult(NamedTuple):
+    items: int
+    batches: int
+    duration: float
+
+
+async def restock_items(pool: asyncpg.Pool, *, chunk_size: int = 2000) -> RestockResult:
+    """Adds the restock amount of every listed item to its stock
+
+    Items are restocked in batches of `chunk_size` ids, each committed on its own,
+    so row locks are only held for one batch at a time.
+    Purchases of an item then wait for at most one batch, instead of the whole catalog.
+
+    Args:
+        pool (asyncpg.Pool): Database pool
+        chunk_size (int): The amount of items to restock per batch. Defaults to 2000.
+
+    Returns:
+        RestockResult: The amount of items restocked, the amount of batches, and how long it took in seconds
+    """
+    query = """
+    WITH chunk AS (
+        SELECT eco_item.id
+        FROM eco_item
+        WHERE eco_item.id > $1 AND EXISTS (
+            SELECT 1 FROM eco_item_lookup WHERE eco_item_lookup.item_id = eco_item.id
+        )
+        ORDER BY eco_item.id
+        LIMIT $2
+    )
+    UPDATE eco_item
+    SET amount = eco_item.amount + eco_item.restock_amount
+    FROM chunk
+    WHERE eco_item.id = chunk.id
+    RETURNING eco_item.id;
+    """
+    start = time.perf_counter()
+    last_id = 0
+    items = 0
+    batches = 0
+    while True:
+        rows = await pool.fetch(query, last_id, chunk_size)
+        if not rows:
+            break
+
+        items += len(rows)
+        batches += 1
+        last_id = max(row["id"] for row in rows)
+        if len(rows) < chunk_size:
+            break
+    return RestockResult(
+        items=items, batches=batches, duration=time.perf_counter() - start
+    )
+
+
 async def get_item(
     id: int, item_name: str, pool: asyncpg.Pool
 ) -> Union[Dict, List[Dict[str, str]], None]:
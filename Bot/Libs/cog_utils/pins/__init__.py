@@ -10,4 +10,6 @@ from .pin_utils import (
     get_owned_pins as get_owned_pins,
     get_pin_content as get_pin_content,
     get_pin_info as get_pin_info,
+    invalidate_pins_cache as invalidate_pins_cache,
+    resolve_pin as resolve_pin,
 )
@@ -1,20 +1,20 @@
 from discord.ext import commands
-from Libs.config import GuildCacheHandler
 from Libs.errors import PinsDisabledError
+from Libs.utils import KContext
 
 
-async def check_pin_enabled(ctx: commands.Context):
+async def check_pin_enabled(ctx: KContext):
     if ctx.guild is None:
         raise PinsDisabledError
-    cache = GuildCacheHandler(ctx.guild.id, ctx.bot.redis_pool)
-    status = await cache.get_value(".config.pins")
-    if not isinstance(status, bool) or status is False:
+
+    guild_config = await ctx.get_guild_config()
+    if guild_config is None or guild_config.config.pins is not True:
         raise PinsDisabledError
-    return status
+    return True
 
 
 def is_pins_enabled():
-    async def pred(ctx: commands.Context):
+    async def pred(ctx: KContext):
         return await check_pin_enabled(ctx)
 
     return commands.check(pred)
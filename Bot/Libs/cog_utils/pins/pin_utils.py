@@ -1,45 +1,105 @@
 from typing import Dict, List, Union
 
 import asyncpg
-from Libs.cache import KumikoCache
+from Libs.cache import (
+    KumikoCache,
+    command_key_builder,
+    invalidate_namespace,
+    kumiko_cached,
+)
 from redis.asyncio.connection import ConnectionPool
 
+# Resolves a pin with one round trip. The first branch is the pin whose name or alias matches,
+# preferring the name. The suggestions branch only runs if there is no such pin (the NOT EXISTS is
+# evaluated once), and returns the names closest to the query.
+# Both branches are scoped to the guild, so the lookup only goes through the pins of that guild
+RESOLVE_PIN_QUERY = """
+WITH exact AS (
+    SELECT pin.content
+    FROM pin_lookup
+    INNER JOIN pin ON pin.id = pin_lookup.pin_id
+    WHERE pin_lookup.guild_id = $1
+        AND (LOWER(pin_lookup.name) = LOWER($2) OR pin_lookup.aliases @> ARRAY[LOWER($2)])
+    ORDER BY LOWER(pin_lookup.name) = LOWER($2) DESC
+    LIMIT 1
+)
+SELECT TRUE AS found, exact.content, NULL AS name
+FROM exact
+UNION ALL
+(
+    SELECT FALSE, NULL, pin_lookup.name
+    FROM pin_lookup
+    WHERE pin_lookup.guild_id = $1 AND pin_lookup.name % $2
+        AND NOT EXISTS (SELECT 1 FROM exact)
+    ORDER BY similarity(pin_lookup.name, $2) DESC
+    LIMIT 5
+);
+"""
 
-async def get_pin_content(
+
+async def resolve_pin(
     id: int, pin_name: str, pool: asyncpg.Pool
+) -> Union[str, List[Dict[str, str]], None]:
+    """Resolves a pin by its name or one of its aliases
+
+    The match and the suggestions are fetched with a single statement (see `RESOLVE_PIN_QUERY`),
+    which asyncpg prepares once per connection.
+
+    Args:
+        id (int): Guild ID
+        pin_name (str): Pin name or alias
+        pool (asyncpg.Pool): Database pool
+
+    Returns:
+        Union[str, List[Dict[str, str]], None]: The pin content, up to 5 similar pin names if it doesn't exist, or None if there are none
+    """
+    rows = await pool.fetch(RESOLVE_PIN_QUERY, id, pin_name)
+    if len(rows) == 0:
+        return None
+    if rows[0]["found"]:
+        return rows[0]["content"]
+    return [{"name": row["name"]} for row in rows]
+
+
+@kumiko_cached(
+    ttl=300,
+    stale_ttl=60,
+    key=lambda id, pin_name, **_: command_key_builder(
+        prefix="cache", namespace="kumiko", id=id, command=f"pins:{pin_name}"
+    ),
+    type=Union[str, List[Dict[str, str]], None],
+)
+async def get_pin_content(
+    id: int, pin_name: str, pool: asyncpg.Pool, redis_pool: ConnectionPool
 ) -> Union[str, List[Dict[str, str]], None]:
     """Gets a tag from the database.
 
+    Lookups are cached in Redis, and concurrent lookups of the same pin only query the database once.
+    See `resolve_pin` for how the pin is looked up.
+
     Args:
         id (int): Guild ID
         tag_name (str): Tag name
         pool (asyncpg.Pool): Database pool
+        redis_pool (ConnectionPool): Redis connection pool
 
     Returns:
         Union[str, None]: The tag content or None if it doesn't exist
     """
-    query = """
-    SELECT pin.content
-    FROM pin_lookup
-    INNER JOIN pin ON pin.id = pin_lookup.pin_id
-    WHERE pin_lookup.guild_id=$1 AND LOWER(pin_lookup.name)=$2 OR LOWER($2) = ANY(aliases); 
+    return await resolve_pin(id, pin_name, pool)
+
+
+async def invalidate_pins_cache(guild_id: int, redis_pool: ConnectionPool) -> None:
+    """Drops every cached pin lookup for a guild
+
+    Any write to a pin can change the exact match or the suggestions of many lookups,
+    so the whole guild is invalidated instead.
+
+    Args:
+        guild_id (int): Guild ID
+        redis_pool (ConnectionPool): Redis connection pool
     """
-    async with pool.acquire() as conn:
-        res = await conn.fetchval(query, id, pin_name)
-        if res is None:
-            query = """
-            SELECT     pin_lookup.name
-            FROM       pin_lookup
-            WHERE      pin_lookup.guild_id=$1 AND pin_lookup.name % $2 OR $2 = ANY(aliases)
-            ORDER BY   similarity(pin_lookup.name, $2) DESC
-            LIMIT 5;
-            """
-            new_res = await conn.fetch(query, id, pin_name)
-            if new_res is None or len(new_res) == 0:
-                return None
-
-            return [dict(row) for row in new_res]
-        return res
+    await invalidate_namespace(redis_pool, guild_id, "pins")
 
 
 async def get_pin_info(id: int, pin_name: str, pool: asyncpg.Pool) -> Union[Dict, None]:
@@ -57,7 +117,9 @@ async def get_pin_info(id: int, pin_name: str, pool: asyncpg.Pool) -> Union[Dict
     SELECT pin.name, pin.content, pin.created_at, pin.author_id, pin_lookup.aliases
     FROM pin_lookup
     INNER JOIN pin ON pin.id = pin_lookup.pin_id
-    WHERE pin_lookup.guild_id=$1 AND LOWER(pin_lookup.name)=$2 OR LOWER(pin_lookup.name) = ANY(aliases);
+    WHERE pin_lookup.guild_id=$1 AND (LOWER(pin_lookup.name)=LOWER($2) OR pin_lookup.aliases @> ARRAY[LOWER($2)])
+    ORDER BY LOWER(pin_lookup.name)=LOWER($2) DESC
+    LIMIT 1;
     """
     res = await pool.fetchrow(query, id, pin_name)
     if res is None:
@@ -9,6 +9,7 @@ from Libs.errors import RedirectsDisabledError
 
 if TYPE_CHECKING:
     from Bot.kumikocore import KumikoCore
+    from Libs.utils import KContext
 
 
 def check_if_thread(ctx: commands.Context):
@@ -24,15 +25,14 @@ def is_thread():
     return commands.check(pred)
 
 
-async def check_redirects_enabled(ctx: commands.Context):
+async def check_redirects_enabled(ctx: KContext):
     if ctx.guild is None:
         raise RedirectsDisabledError
 
-    cache = GuildCacheHandler(ctx.guild.id, ctx.bot.redis_pool)
-    status = await cache.get_value(".config.redirects")
-    if not isinstance(status, bool) or status is False:
+    guild_config = await ctx.get_guild_config()
+    if guild_config is None or guild_config.config.redirects is not True:
         raise RedirectsDisabledError
-    return status
+    return True
 
 
 async def check_redirects_menu(interaction: discord.Interaction):
@@ -1,4 +1,9 @@
 from .cache import GuildCacheHandler as GuildCacheHandler
+from .local_cache import (
+    CacheStats as CacheStats,
+    guild_config_cache as guild_config_cache,
+    listen_for_invalidations as listen_for_invalidations,
+)
 from .structs import (
     FullGuildConfig as FullGuildConfig,
     GuildConfig as GuildConfig,
@@ -1,11 +1,12 @@
 import re
 from enum import Enum
-from typing import Dict, TypeVar, Union
+from typing import Any, Dict, Optional, TypeVar, Union
 
 import msgspec
-import redis.asyncio as redis
+from Libs.cache import KumikoCache
 from redis.asyncio.connection import ConnectionPool
 
+from .local_cache import INVALIDATION_CHANNEL, guild_config_cache
 from .structs import FullGuildConfig, GuildConfig, LoggingGuildConfig
 
 T = TypeVar("T", str, bool, None)
@@ -20,26 +21,78 @@ def parse_json_key(key: str) -> str:
     return re.sub(r"^[.]|^[\$]", "", key, re.IGNORECASE)
 
 
+def resolve_config_path(config: FullGuildConfig, path: str) -> Any:
+    """Resolves a RedisJSON style path (eg `.config.pins`) against a decoded config
+
+    Args:
+        config (FullGuildConfig): The decoded config
+        path (str): Path to the value
+
+    Returns:
+        Any: The value, converted to builtins if it is a struct. None if the path does not exist
+    """
+    value = config
+    for part in parse_json_key(path).split("."):
+        if not part:
+            continue
+        value = getattr(value, part, None)
+        if value is None:
+            return None
+
+    if isinstance(value, msgspec.Struct):
+        return msgspec.to_builtins(value)
+    return value
+
+
 class GuildCacheHandler:
-    """First-class interface for handling guild config caches"""
+    """First-class interface for handling guild config caches
+
+    Reads are served from an in-process L1 cache (`guild_config_cache`) when possible,
+    and every write publishes an invalidation so other processes drop their copies.
+    """
 
     def __init__(self, guild_id: int, redis_pool: ConnectionPool) -> None:
         self.redis_pool = redis_pool
         self.guild_id = guild_id
         self.key = f"cache:kumiko:{guild_id}:guild_config"
-
-    async def _exists(self, client: redis.Redis, key: str) -> bool:
-        key_exists = await client.exists(key) >= 1
-        return True if key_exists else False
+        self.cache = KumikoCache(redis_pool)
 
     async def is_there(self):
-        client: redis.Redis = redis.Redis(connection_pool=self.redis_pool)
-        key_exists = await client.exists(self.key) >= 1
+        key_exists = await self.cache.client.exists(self.key) >= 1
         return True if key_exists else False
 
     async def invalidate(self):
-        client: redis.Redis = redis.Redis(connection_pool=self.redis_pool)
-        await client.delete(self.key)
+        async with self.cache.batch() as b:
+            b.delete(self.key)
+            b.publish(INVALIDATION_CHANNEL, str(self.guild_id))
+        guild_config_cache.drop(self.guild_id)
+
+    async def _fetch_full_config(self) -> Optional[FullGuildConfig]:
+        config = guild_config_cache.get(self.guild_id)
+        if config is not None:
+            return config
+
+        # Taken before the fetch, so an invalidation arriving during it isn't overwritten
+        generation = guild_config_cache.generation(self.guild_id)
+
+        # JSON.GET already returns nil for missing keys,
+        # so an EXISTS check beforehand would only cost an extra round trip
+        value = await self.cache.get_json_cache(self.key, path=".")
+        if value is None:
+            return None
+        config = msgspec.convert(value, type=FullGuildConfig)
+        guild_config_cache.set(self.guild_id, config, generation=generation)
+        return config
+
+    async def _write(self, path: str, value: Any, *, merge: bool = True) -> None:
+        # The write and the invalidation are sent within the same MULTI/EXEC
+        async with self.cache.batch() as b:
+            if merge:
+                b.merge_json_cache(key=self.key, value=value, path=path)
+            else:
+                b.set_json_cache(key=self.key, value=value, path=path)
+            b.publish(INVALIDATION_CHANNEL, str(self.guild_id))
+        guild_config_cache.drop(self.guild_id)
 
     async def cache_defaults(self) -> FullGuildConfig:
         """Cache the default settings
@@ -51,8 +104,7 @@ class GuildCacheHandler:
             config=GuildConfig(),
             logging_config=LoggingGuildConfig(),
         )
-        client: redis.Redis = redis.Redis(connection_pool=self.redis_pool)
-        await client.json(encoder=msgspec.json, decoder=msgspec.json).set(name=self.key, path="$", obj=config_set)  # type: ignore
+        await self._write("$", config_set, merge=False)
         return config_set
 
     async def get_config(self) -> Union[FullGuildConfig, None]:
@@ -61,26 +113,21 @@ class GuildCacheHandler:
         Returns:
             Union[FullGuildConfig, None]: The full config, or None if not found.
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.redis_pool)
-        if await self._exists(client, self.key) is False:
-            return None
-        json = await client.json(encoder=None, decoder=None).get(self.key)  # type: ignore
-        return msgspec.json.decode(json, type=FullGuildConfig)
+        return await self._fetch_full_config()
 
-    async def get_value(self, path: str) -> Union[str, bool, Dict]:
+    async def get_value(self, path: str) -> Union[str, bool, Dict, None]:
         """Gets the value given the path
 
         Args:
             path (str): Path to the value. This is also the key of the value
 
         Returns:
-            Union[str, bool, Dict]: The returned value from cache.
+            Union[str, bool, Dict, None]: The returned value from cache. None if the guild has no cached config.
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.redis_pool)
-
-        json = await client.json(encoder=..., decoder=...).get(self.key, path)  # type: ignore
-        decoded = msgspec.json.decode(json)
-        return decoded
+        config = await self._fetch_full_config()
+        if config is None:
+            return None
+        return resolve_config_path(config, path)
 
     async def merge_value(self, path: str, value: Union[str, bool, None]) -> None:
         """Merge (aka replace) the value at the given path
@@ -89,14 +136,12 @@ class GuildCacheHandler:
             path (str): Path to the value (aka the key)
             value (Union[str, bool, None]): New value to merge
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.redis_pool)
-        await client.json(encoder=msgspec.json, decoder=msgspec.json).merge(name=self.key, path=path, obj=value)  # type: ignore
+        await self._write(path, value)
 
     async def replace_config(
         self, path: str, value: Union[GuildConfig, LoggingGuildConfig]
     ) -> None:
-        client: redis.Redis = redis.Redis(connection_pool=self.redis_pool)
-        await client.json(encoder=msgspec.json, decoder=msgspec.json).merge(name=self.key, path=path, obj=value)  # type: ignore
+        await self._write(path, value)
 
     async def replace_full_config(self, config: FullGuildConfig) -> None:
         """Replace the whole entire cache with a new config
@@ -104,5 +149,5 @@ class GuildCacheHandler:
         Args:
             config (FullGuildConfig): New config
         """
-        client: redis.Redis = redis.Redis(connection_pool=self.redis_pool)
-        await client.json(encoder=msgspec.json, decoder=msgspec.json).set(name=self.key, path="$", obj=config)  # type: ignore
+        await self._write("$", config, merge=False)
+        guild_config_cache.set(self.guild_id, config)
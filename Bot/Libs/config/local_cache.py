@@ -0,0 +1,172 @@
+import asyncio
+import logging
+from typing import Dict, NamedTuple, Optional
+
+from Libs.cache import get_redis_client
+from lru import LRU
+from redis.asyncio.connection import ConnectionPool
+from redis.exceptions import RedisError
+
+from .structs import FullGuildConfig
+
+INVALIDATION_CHANNEL = "kumiko:guild_config:invalidate"
+
+# Sentinel published when every entry should be dropped (eg. a bulk reload)
+INVALIDATE_ALL = "*"
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+
+
+class GuildConfigLocalCache:
+    """Bounded in-process (L1) cache of decoded guild configs
+
+    This sits in front of `GuildCacheHandler`, so that checks such as
+    `is_pins_enabled` can be answered without a round trip to Redis.
+    Coherence across shards and processes is kept by listening for
+    invalidation messages on a Redis pub/sub channel.
+
+    A config fetched from Redis may already be stale by the time it is stored,
+    if an invalidation arrived while it was being fetched.
+    Callers take the guild's `generation` before fetching, and pass it to `set`,
+    which then skips storing the config if the guild was dropped in the meantime.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache: LRU = LRU(max_size, callback=self._on_evict)
+
+        # Bumped by every drop and clear. Guilds remember the last drop that affected them
+        self._clock = 0
+        self._cleared_at = 0
+        self._dropped_at: Dict[int, int] = {}
+
+    def _on_evict(self, key: int, value: FullGuildConfig) -> None:
+        self.evictions += 1
+
+    def get(self, guild_id: int) -> Optional[FullGuildConfig]:
+        """Gets the config for a guild, recording a hit or a miss
+
+        Args:
+            guild_id (int): Guild ID
+
+        Returns:
+            Optional[FullGuildConfig]: The cached config, or None if not cached
+        """
+        config = self._cache.get(guild_id)
+        if config is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return config
+
+    def generation(self, guild_id: int) -> int:
+        """The point of the last invalidation of a guild's config
+
+        Args:
+            guild_id (int): Guild ID
+
+        Returns:
+            int: The generation, to be passed to `set`
+        """
+        return max(self._dropped_at.get(guild_id, 0), self._cleared_at)
+
+    def set(
+        self,
+        guild_id: int,
+        config: FullGuildConfig,
+        *,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Stores the config of a guild
+
+        Args:
+            guild_id (int): Guild ID
+            config (FullGuildConfig): The config to store
+            generation (Optional[int]): The guild's `generation` from before the config was fetched.
+            If the guild has been invalidated since, the config is not stored. Defaults to None
+        """
+        if generation is not None and generation != self.generation(guild_id):
+            return
+        self._cache[guild_id] = config
+
+    def drop(self, guild_id: int) -> None:
+        self._clock += 1
+        self._dropped_at[guild_id] = self._clock
+
+        # Explicit drops are invalidations, not capacity evictions,
+        # so they are not counted
+        if guild_id in self._cache:
+            self._cache.pop(guild_id)
+
+    def clear(self) -> None:
+        self._clock += 1
+        self._cleared_at = self._clock
+        # Every guild is now past this generation
+        self._dropped_at.clear()
+        self._cache.clear()
+
+    def resize(self, max_size: int) -> None:
+        self._cache.set_size(max_size)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss and eviction counters of the cache
+
+        Returns:
+            CacheStats: The current counters
+        """
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._cache),
+            max_size=self._cache.get_size(),
+        )
+
+
+guild_config_cache = GuildConfigLocalCache()
+
+
+async def listen_for_invalidations(
+    redis_pool: ConnectionPool, *, retry_after: float = 5.0
+) -> None:
+    """Long-running task that keeps the L1 cache coherent
+
+    Whenever the subscription is (re)established, the whole L1 cache is cleared,
+    as messages may have been missed while disconnected.
+
+    Args:
+        redis_pool (ConnectionPool): Redis connection pool
+        retry_after (float): Seconds to wait before resubscribing after a failure. Defaults to 5.0
+    """
+    logger = logging.getLogger("kumiko")
+    while True:
+        client = get_redis_client(redis_pool)
+        try:
+            async with client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                guild_config_cache.clear()
+                async for message in pubsub.listen():
+                    data = message["data"]
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8")
+
+                    if data == INVALIDATE_ALL:
+                        guild_config_cache.clear()
+                    elif data.isdigit():
+                        guild_config_cache.drop(int(data))
+        except RedisError:
+            logger.exception(
+                "Guild config invalidation listener failed. Retrying in %s seconds",
+                retry_after,
+            )
+            guild_config_cache.clear()
+            await asyncio.sleep(retry_after)
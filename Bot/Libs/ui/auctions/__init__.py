@@ -3,3 +3,4 @@ from .pages import (
     AuctionSearchPages as AuctionSearchPages,
     OwnedAuctionPages as OwnedAuctionPages,
 )
+from .utils import AuctionItemPageEntry as AuctionItemPageEntry
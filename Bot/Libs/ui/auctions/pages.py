@@ -2,13 +2,11 @@ from typing import List
 
 import asyncpg
 from discord.ext import commands
-from Libs.utils.pages import EmbedListSource, KumikoPages
+from Libs.utils.pages import KeysetEmbedSource, KumikoPages
 
 from .base_pages import AuctionItemSearchBasePages, OwnedAuctionItemBasePages
 from .utils import (
-    AuctionItem,
     AuctionItemCompactPageEntry,
-    AuctionItemPageEntry,
     CompactAuctionItem,
     OwnedAuctionItem,
     OwnedAuctionItemPageEntry,
@@ -16,11 +14,13 @@ from .utils import (
 
 
 class AuctionPages(KumikoPages):
-    def __init__(
-        self, entries: List[AuctionItem], *, ctx: commands.Context, per_page: int = 1
-    ):
-        converted = [AuctionItemPageEntry(entry).to_dict() for entry in entries]
-        super().__init__(EmbedListSource(converted, per_page=per_page), ctx=ctx)
+    """Pages of the listings of the auction house
+
+    The listings are loaded as the pages are requested. The rows are converted with `AuctionItemPageEntry`.
+    """
+
+    def __init__(self, source: KeysetEmbedSource, *, ctx: commands.Context):
+        super().__init__(source, ctx=ctx)
 
 
 class OwnedAuctionPages(OwnedAuctionItemBasePages):
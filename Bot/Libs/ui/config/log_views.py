@@ -227,9 +227,8 @@ class PurgeLGConfirmation(KumikoView):
             )
             return
 
-        # Invalidate the cache so we can safely delete it
-        self.dispatcher.get_webhook_config.cache_invalidate()
         await self.pool.execute(delete_query, self.guild_id)
+        self.dispatcher.invalidate()
 
         await self.message.edit(content="Logging channels have been successfully deleted", embed=None, view=None, delete_after=15.0)  # type: ignore
         self.stop()
@@ -28,14 +28,18 @@ class DeletePrefixView(KumikoView):
     ) -> None:
         query = """
         UPDATE guild
-        SET prefix = ARRAY_REMOVE(prefix, $1)
+        SET prefix = ARRAY_REMOVE(
+            CASE WHEN cardinality(prefix) > 0 THEN prefix ELSE ARRAY[$3] END, $1
+        )
         WHERE id=$2;
         """
         guild_id = interaction.guild.id  # type: ignore # lying again
         # We will only delete it if the prefix is in the list of prefixes
         # This ensures that the prefix **must** be in the LRU cache
         if self.prefix in self.bot.prefixes[guild_id]:
-            await self.pool.execute(query, self.prefix, guild_id)
+            await self.pool.execute(
+                query, self.prefix, guild_id, self.bot.default_prefix
+            )
             self.bot.prefixes[guild_id].remove(
                 self.prefix
             )  # This makes the assumption that the guild is already in the LRU cache. This is not the best - Noelle
@@ -2,4 +2,5 @@ from .pages import (
     LeaderboardPages as LeaderboardPages,
     UserInvPages as UserInvPages,
 )
+from .utils import UserInvPageEntry as UserInvPageEntry
 from .views import RegisterView as RegisterView
@@ -3,7 +3,8 @@ from typing import Any, Dict
 import asyncpg
 import discord
 from discord.ext import commands
-from Libs.utils.pages import EmbedListSource, KumikoPages, SimplePageSource
+from discord.ext import menus
+from Libs.utils.pages import KumikoPages, SimplePageSource
 
 from .modals import UserInvAHListModal, UserInvRefundModal
 
@@ -18,11 +19,9 @@ class BasePages(KumikoPages):
 
 class UserInvBasePages(KumikoPages):
     def __init__(
-        self, entries, *, ctx: commands.Context, per_page: int = 1, pool: asyncpg.Pool
+        self, source: menus.PageSource, *, ctx: commands.Context, pool: asyncpg.Pool
     ):
-        super().__init__(
-            EmbedListSource(entries, per_page=per_page), ctx=ctx, compact=True
-        )
+        super().__init__(source, ctx=ctx, compact=True)
         self.ctx = ctx
         self.pool = pool
         self.add_item(self.ah_list)
@@ -2,14 +2,10 @@ from typing import List
 
 import asyncpg
 from discord.ext import commands
+from Libs.utils.pages import KeysetEmbedSource
 
 from .base_pages import BasePages, UserInvBasePages
-from .utils import (
-    LeaderboardEntry,
-    LeaderboardPageEntry,
-    UserInvEntry,
-    UserInvPageEntry,
-)
+from .utils import LeaderboardEntry, LeaderboardPageEntry
 
 
 class LeaderboardPages(BasePages):
@@ -25,13 +21,12 @@ class LeaderboardPages(BasePages):
 
 
 class UserInvPages(UserInvBasePages):
+    """Pages of the items within an user's inventory
+
+    The items are loaded as the pages are requested. The rows are converted with `UserInvPageEntry`.
+    """
+
     def __init__(
-        self,
-        entries: List[UserInvEntry],
-        *,
-        ctx: commands.Context,
-        per_page: int = 1,
-        pool: asyncpg.Pool
+        self, source: KeysetEmbedSource, *, ctx: commands.Context, pool: asyncpg.Pool
     ):
-        converted = [UserInvPageEntry(entry).to_dict() for entry in entries]
-        super().__init__(converted, per_page=per_page, ctx=ctx, pool=pool)
+        super().__init__(source, ctx=ctx, pool=pool)
@@ -3,7 +3,11 @@ from .modals import (
     CreateJobOutputItemModal as CreateJobOutputItemModal,
     UpdateJobModal as UpdateJobModal,
 )
-from .pages import JobPages as JobPages
+from .pages import (
+    JobListingPages as JobListingPages,
+    JobPageEntry as JobPageEntry,
+    JobPages as JobPages,
+)
 from .views import (
     DeleteJobViaIDView as DeleteJobViaIDView,
     DeleteJobView as DeleteJobView,
@@ -1,8 +1,8 @@
-from typing import List, TypedDict
+from typing import Any, Dict, List, TypedDict
 
 import discord
 from discord.ext.commands import Context
-from Libs.utils.pages import KumikoPages, SimplePageSource
+from Libs.utils.pages import KeysetPageSource, KumikoPages, SimplePageSource
 
 
 class SimplePages(KumikoPages):
@@ -37,8 +37,31 @@ class JobPageEntry:
     def __str__(self) -> str:
         return f"(ID: {self.id}) {self.name} (RR: {self.required_rank} | Pay: {self.pay_amount})"
 
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "title": self.name,
+            "description": self.description,
+            "fields": [
+                {"name": "ID", "value": self.id, "inline": True},
+                {"name": "Required Rank", "value": self.required_rank, "inline": True},
+                {"name": "Pay Amount", "value": self.pay_amount, "inline": True},
+            ],
+        }
+        return data
+
 
 class JobPages(SimplePages):
     def __init__(self, entries: List[JobEntry], *, ctx: Context, per_page: int = 10):
         converted = [JobPageEntry(entry) for entry in entries]
         super().__init__(converted, per_page=per_page, ctx=ctx)
+
+
+class JobListingPages(KumikoPages):
+    """Compact pages of the jobs listed within a guild
+
+    The jobs are loaded as the pages are requested. The rows are converted with `JobPageEntry`.
+    """
+
+    def __init__(self, source: KeysetPageSource, *, ctx: Context):
+        super().__init__(source, ctx=ctx)
+        self.embed = discord.Embed(colour=discord.Colour.og_blurple())
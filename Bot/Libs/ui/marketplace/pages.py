@@ -2,7 +2,12 @@ from typing import Any, Dict, List, TypedDict
 
 import discord
 from discord.ext.commands import Context
-from Libs.utils.pages import EmbedListSource, KumikoPages, SimplePageSource
+from Libs.utils.pages import (
+    EmbedListSource,
+    KeysetEmbedSource,
+    KumikoPages,
+    SimplePageSource,
+)
 
 
 class SimpleItemPages(KumikoPages):
@@ -52,10 +57,15 @@ class ItemPageEntry:
         return data
 
 
-class ItemPages(SimpleItemPages):
-    def __init__(self, entries: List[ItemEntry], *, ctx: Context, per_page: int = 1):
-        converted = [ItemPageEntry(entry).to_dict() for entry in entries]
-        super().__init__(converted, per_page=per_page, ctx=ctx)
+class ItemPages(KumikoPages):
+    """Pages of the items listed on the marketplace
+
+    The items are loaded as the pages are requested. The rows are converted with `ItemPageEntry`.
+    """
+
+    def __init__(self, source: KeysetEmbedSource, *, ctx: Context):
+        super().__init__(source, ctx=ctx)
+        self.embed = discord.Embed(colour=discord.Colour.og_blurple())
 
 
 class SimplePages(KumikoPages):
@@ -1,7 +1,7 @@
 import asyncpg
 import discord
 from discord.ext import commands
-from Libs.cog_utils.pins import edit_pin
+from Libs.cog_utils.pins import edit_pin, invalidate_pins_cache
 from Libs.utils import KumikoModal
 
 
@@ -57,6 +57,9 @@ class CreatePin(KumikoModal, title="Create Pin"):
                 await interaction.response.send_message("Could not create pin.")
             else:
                 await tr.commit()
+                await invalidate_pins_cache(
+                    interaction.guild.id, self.ctx.bot.redis_pool  # type: ignore
+                )
                 await interaction.response.send_message(
                     f"Pin {self.name} successfully created."
                 )
@@ -89,4 +92,5 @@ class PinEditModal(KumikoModal, title="Edit Pin"):
             )
             self.stop()
         else:
+            await invalidate_pins_cache(guild_id, self.ctx.bot.redis_pool)
             await interaction.response.send_message("Successfully edited pin")
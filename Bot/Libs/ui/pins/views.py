@@ -1,6 +1,7 @@
 import asyncpg
 import discord
 from discord.ext import commands
+from Libs.cog_utils.pins import invalidate_pins_cache
 from Libs.utils import ErrorEmbed, KumikoView, SuccessEmbed
 
 
@@ -45,6 +46,9 @@ class DeletePinView(KumikoView):
                         embed=error_embed, view=self, delete_after=20.0
                     )
                 else:
+                    await invalidate_pins_cache(
+                        interaction.guild.id, self.ctx.bot.redis_pool  # type: ignore
+                    )
                     success_embed = SuccessEmbed()
                     success_embed.description = (
                         f"Deleted the following pin: `{self.name}`"
@@ -95,6 +99,9 @@ class PurgePinView(KumikoView):
                         embed=error_embed, view=self, delete_after=20.0
                     )
                 else:
+                    await invalidate_pins_cache(
+                        interaction.guild.id, self.ctx.bot.redis_pool  # type: ignore
+                    )
                     success_embed = SuccessEmbed()
                     success_embed.description = (
                         f"Fully purged all pins belonging to {interaction.user.mention}"
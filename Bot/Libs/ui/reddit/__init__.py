@@ -6,3 +6,4 @@ from .structs import (
     RedditEntry as RedditEntry,
     RedditMemeEntry as RedditMemeEntry,
 )
+from .utils import RedditPageEntry as RedditPageEntry
@@ -2,16 +2,20 @@ from typing import List
 
 import discord
 from discord.ext.commands import Context
-from Libs.utils.pages import EmbedListSource, KumikoPages
+from Libs.utils.pages import AsyncIteratorEmbedSource, EmbedListSource, KumikoPages
 
-from .structs import RedditEntry, RedditMemeEntry
-from .utils import RedditMemePageEntry, RedditPageEntry
+from .structs import RedditMemeEntry
+from .utils import RedditMemePageEntry
 
 
 class RedditPages(KumikoPages):
-    def __init__(self, entries: List[RedditEntry], *, ctx: Context, per_page: int = 1):
-        converted = [RedditPageEntry(entry).to_dict() for entry in entries]
-        super().__init__(EmbedListSource(converted, per_page=per_page), ctx=ctx)
+    """Pages of Reddit posts, shown as they are downloaded
+
+    The source should convert the `RedditEntry` with `RedditPageEntry`.
+    """
+
+    def __init__(self, source: AsyncIteratorEmbedSource, *, ctx: Context):
+        super().__init__(source, ctx=ctx)
         self.embed = discord.Embed(colour=discord.Colour.from_rgb(255, 125, 212))
 
 
@@ -1,4 +1,12 @@
-from .blacklist import get_blacklist as get_blacklist
+from .blacklist import (
+    BlacklistCache as BlacklistCache,
+    get_blacklist as get_blacklist,
+)
+from .change_feed import (
+    CHANGE_FEED_CHANNEL as CHANGE_FEED_CHANNEL,
+    ChangeEvent as ChangeEvent,
+    ChangeFeed as ChangeFeed,
+)
 from .checks import (
     is_admin as is_admin,
     is_manager as is_manager,
@@ -15,16 +23,19 @@ from .embeds import (
     ErrorEmbed as ErrorEmbed,
     SuccessEmbed as SuccessEmbed,
 )
+from .fan_out import FanOut as FanOut, FanOutResult as FanOutResult
 from .help import KumikoHelpPaginated as KumikoHelpPaginated
+from .image_pool import ImagePool as ImagePool, ImagePoolStats as ImagePoolStats
 from .kumiko_logger import KumikoLogger as KumikoLogger
 from .message_constants import MessageConstants as MessageConstants
 from .modal import KumikoModal as KumikoModal
 from .pg_init_codecs import init_codecs as init_codecs
-from .prefix import get_prefix as get_prefix
+from .prefix import PrefixBackfill as PrefixBackfill, get_prefix as get_prefix
 from .rank_utils import calc_petals as calc_petals, calc_rank as calc_rank
 from .time import format_dt as format_dt, human_timedelta as human_timedelta
 from .transport import (
     AIOHTTPTransportExistingSession as AIOHTTPTransportExistingSession,
+    CachedSchemaClient as CachedSchemaClient,
 )
 from .tree import KumikoCommandTree as KumikoCommandTree
 from .utils import (
@@ -37,7 +48,12 @@ from .utils import (
     read_env as read_env,
 )
 from .view import KumikoView as KumikoView
+from .webhook_logs import (
+    LogSenderStats as LogSenderStats,
+    WebhookLogSender as WebhookLogSender,
+)
 from .webhooks import (
     WebhookConfig as WebhookConfig,
     WebhookDispatcher as WebhookDispatcher,
+    webhook_config_cache as webhook_config_cache,
 )
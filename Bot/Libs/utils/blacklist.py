@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from typing import Optional, Union
+from typing import Optional, Set, Union
 
 import asyncpg
 from async_lru import alru_cache
 
+from .change_feed import ChangeEvent
+
 
 class BlacklistEntity:
     __slots__ = ("id", "blacklist_status", "unknown_entity")
@@ -39,3 +41,54 @@ async def get_blacklist(
     if record is None:
         return BlacklistEntity()
     return BlacklistEntity(record=record)
+
+
+class BlacklistCache:
+    """In-memory set of every blacklisted ID
+
+    The whole table is loaded at startup, so the global checks can be answered without any I/O.
+    Changes are received through the change feed (see `ChangeFeed`),
+    and the table is loaded again whenever the feed reconnects.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Set[int] = set()
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(self, id: int) -> None:
+        self._ids.add(id)
+
+    def discard(self, id: int) -> None:
+        self._ids.discard(id)
+
+    async def load(self, connection: Union[asyncpg.Connection, asyncpg.Pool]) -> int:
+        """Replaces the set with the contents of the blacklist table
+
+        Args:
+            connection (Union[asyncpg.Connection, asyncpg.Pool]): Asyncpg connection
+
+        Returns:
+            int: The amount of blacklisted IDs
+        """
+        records = await connection.fetch("SELECT id FROM blacklist;")
+        self._ids = {record["id"] for record in records}
+        return len(self._ids)
+
+    def handle_change(self, event: ChangeEvent) -> None:
+        """Applies a change of the blacklist table received from the change feed
+
+        Args:
+            event (ChangeEvent): The change
+        """
+        if event.key is None:
+            return
+
+        if event.op == "DELETE":
+            self.discard(event.key)
+        else:
+            self.add(event.key)
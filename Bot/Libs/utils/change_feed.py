@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union
+
+import asyncpg
+import msgspec
+
+# Channel that the change feed triggers notify on. See the rev5 -> rev6 migration
+CHANGE_FEED_CHANNEL = "kumiko_change_feed"
+
+
+class ChangeEvent(msgspec.Struct, frozen=True):
+    """A row change within one of the tables that the change feed watches
+
+    `key` is the guild (or user, for the blacklist) ID of the row,
+    and is None for TRUNCATE.
+    """
+
+    table: str
+    op: str
+    key: Optional[int] = None
+
+
+ChangeHandler = Callable[[ChangeEvent], Union[Awaitable[Any], Any]]
+ResyncHandler = Callable[[], Union[Awaitable[Any], Any]]
+
+
+async def _maybe_await(result: Any) -> None:
+    if inspect.isawaitable(result):
+        await result
+
+
+class ChangeFeed:
+    """Fans out row changes from Postgres to in-process caches
+
+    Triggers on the watched tables send a notification for every changed row.
+    One dedicated connection (outside of the pool, so it never takes a slot from queries) LISTENs for them,
+    and each one is handed to the handlers subscribed to its table, in order.
+
+    When the feed (re)connects, or a table is truncated, the `resync` handlers are called instead,
+    as there is no way of knowing what was missed. Caches should drop or reload everything then.
+    Caches shared between processes (eg. in Redis) can opt out of the reconnect resync,
+    so that every process reconnecting doesn't drop them all over again.
+    """
+
+    def __init__(self, dsn: str) -> None:
+        self.dsn = dsn
+        self._handlers: Dict[str, List[ChangeHandler]] = defaultdict(list)
+        self._resync: Dict[str, List[ResyncHandler]] = defaultdict(list)
+        self._truncate_only: Set[ResyncHandler] = set()
+        self._queue: asyncio.Queue[ChangeEvent] = asyncio.Queue()
+        self.logger = logging.getLogger("kumiko")
+
+    def subscribe(
+        self,
+        table: str,
+        handler: ChangeHandler,
+        *,
+        resync: Optional[ResyncHandler] = None,
+        resync_on_reconnect: bool = True,
+    ) -> None:
+        """Registers a handler for the changes of a table
+
+        Handlers can either be regular functions or coroutines.
+
+        Args:
+            table (str): The table to watch (eg. "pin_lookup")
+            handler (ChangeHandler): Called with every `ChangeEvent` of the table
+            resync (Optional[ResyncHandler]): Called whenever changes may have been missed. Defaults to None
+            resync_on_reconnect (bool): Whether `resync` is called when the feed (re)connects, or only when the table is truncated. Defaults to True
+        """
+        self._handlers[table].append(handler)
+        if resync is not None:
+            self._resync[table].append(resync)
+            if not resync_on_reconnect:
+                self._truncate_only.add(resync)
+
+    def unsubscribe(
+        self,
+        table: str,
+        handler: ChangeHandler,
+        *,
+        resync: Optional[ResyncHandler] = None,
+    ) -> None:
+        if handler in self._handlers[table]:
+            self._handlers[table].remove(handler)
+        if resync is not None and resync in self._resync[table]:
+            self._resync[table].remove(resync)
+            self._truncate_only.discard(resync)
+
+    def _on_notify(
+        self, conn: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        try:
+            event = msgspec.json.decode(payload, type=ChangeEvent)
+        except msgspec.DecodeError:
+            self.logger.warning("Received a malformed change feed event: %s", payload)
+            return
+        self._queue.put_nowait(event)
+
+    async def _resync_tables(self, tables: Optional[List[str]] = None) -> None:
+        # Without any tables given, this is a reconnect
+        reconnect = tables is None
+        for table in tables or list(self._resync.keys()):
+            for resync in self._resync[table]:
+                if reconnect and resync in self._truncate_only:
+                    continue
+                try:
+                    await _maybe_await(resync())
+                except Exception:
+                    self.logger.exception("Failed to resync the cache for %s", table)
+
+    async def _dispatch(self, event: ChangeEvent) -> None:
+        if event.op == "TRUNCATE":
+            await self._resync_tables([event.table])
+            return
+
+        for handler in self._handlers[event.table]:
+            try:
+                await _maybe_await(handler(event))
+            except Exception:
+                self.logger.exception("Change feed handler failed for %s", event)
+
+    async def _consume(self) -> None:
+        while True:
+            event = await self._queue.get()
+            await self._dispatch(event)
+
+    async def run(self, *, retry_after: float = 5.0) -> None:
+        """Long-running task that listens for changes and dispatches them
+
+        Args:
+            retry_after (float): Seconds to wait before listening again after a failure. Defaults to 5.0
+        """
+        loop = asyncio.get_running_loop()
+        consumer = loop.create_task(self._consume())
+        try:
+            while True:
+                lost: asyncio.Future[None] = loop.create_future()
+
+                def on_terminate(conn: asyncpg.Connection) -> None:
+                    if not lost.done():
+                        lost.set_result(None)
+
+                try:
+                    conn = await asyncpg.connect(dsn=self.dsn)
+                    try:
+                        conn.add_termination_listener(on_terminate)
+                        await conn.add_listener(CHANGE_FEED_CHANNEL, self._on_notify)
+                        await self._resync_tables()
+                        await lost
+                    finally:
+                        conn.remove_termination_listener(on_terminate)
+                        await conn.close()
+                except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError):
+                    self.logger.exception(
+                        "Change feed listener failed. Retrying in %s seconds",
+                        retry_after,
+                    )
+                    await asyncio.sleep(retry_after)
+        finally:
+            consumer.cancel()
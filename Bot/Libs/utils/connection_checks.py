@@ -2,7 +2,7 @@ import logging
 from typing import Literal
 
 import asyncpg
-import redis.asyncio as redis
+from Libs.cache import get_redis_client
 from redis.asyncio.connection import ConnectionPool
 
 
@@ -33,7 +33,7 @@ async def ensure_redis_conn(redis_pool: ConnectionPool) -> Literal[True]:
         Literal[True]: If successful, the coroutine will return True, otherwise it will raise an exception
     """
     logger = logging.getLogger("kumiko")
-    r: redis.Redis = redis.Redis(connection_pool=redis_pool)
+    r = get_redis_client(redis_pool)
     res = await r.ping()
     if res:
         logger.info("Successfully connected to the Redis server")
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, Optional
 
 import discord
 from discord.ext import commands
+from Libs.config import FullGuildConfig, GuildCacheHandler
 
 from .utils import produce_error_embed
 
@@ -89,6 +90,25 @@ class KContext(commands.Context):
         self.pool = self.bot.pool
         self.redis_pool = self.bot.redis_pool
         self.session = self.bot.session
+        self._guild_config: Optional[FullGuildConfig] = discord.utils.MISSING
+
+    async def get_guild_config(self) -> Optional[FullGuildConfig]:
+        """Obtains the config of the guild this command was invoked in
+
+        The config is loaded at most once per invocation.
+        Every check and the command body itself then read from the same snapshot,
+        instead of each doing their own round trip to Redis.
+
+        Returns:
+            Optional[FullGuildConfig]: The guild's config, or `None` if outside of a guild or not cached
+        """
+        if self.guild is None:
+            return None
+
+        if self._guild_config is discord.utils.MISSING:
+            cache = GuildCacheHandler(self.guild.id, self.redis_pool)
+            self._guild_config = await cache.get_config()
+        return self._guild_config
 
     async def prompt(
         self, message: str, *, timeout: float = 60.0, delete_after: bool = True
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from yarl import URL
+
+FanOutCall = Callable[[], Awaitable[Any]]
+
+
+class FanOutResult(NamedTuple):
+    """The outcome of one call made through `FanOut.gather`
+
+    Exactly one of `value` and `error` is set. Calls that did not finish in time
+    have an `asyncio.TimeoutError` as their error.
+    """
+
+    value: Any = None
+    error: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class FanOut:
+    """Runs a set of HTTP calls concurrently, so they take as long as the slowest one
+
+    Calls to the same host share a semaphore of `per_host` slots,
+    so one command fanning out can't flood a single API.
+    All of the calls of one `gather` share a single timeout. The ones still running when it passes are cancelled.
+    A call failing doesn't affect the others, and every call gets its own `FanOutResult`,
+    so a command can still show what it did get back.
+    """
+
+    def __init__(self, *, per_host: int = 4, timeout: float = 10.0) -> None:
+        self.per_host = per_host
+        self.timeout = timeout
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, url: Union[str, URL]) -> asyncio.Semaphore:
+        host = URL(url).host or ""
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self.per_host)
+        return semaphore
+
+    async def _run(self, url: Union[str, URL], call: FanOutCall) -> Any:
+        async with self._semaphore(url):
+            return await call()
+
+    async def gather(
+        self,
+        *calls: Tuple[Union[str, URL], FanOutCall],
+        timeout: Optional[float] = None,
+    ) -> List[FanOutResult]:
+        """Runs the calls concurrently, and waits for all of them or the timeout
+
+        Args:
+            calls (Tuple[Union[str, URL], FanOutCall]): Pairs of the URL requested (used to pick the host's semaphore) and a function starting the call
+            timeout (Optional[float]): Seconds to wait for every call. Defaults to `FanOut.timeout`
+
+        Returns:
+            List[FanOutResult]: The result of each call, in the order they were given
+        """
+        tasks = [asyncio.ensure_future(self._run(url, call)) for url, call in calls]
+        if not tasks:
+            return []
+
+        try:
+            _, pending = await asyncio.wait(
+                tasks, timeout=self.timeout if timeout is None else timeout
+            )
+        except asyncio.CancelledError:
+            # No call outlives the command that made it
+            for task in tasks:
+                task.cancel()
+            raise
+
+        for task in pending:
+            task.cancel()
+        # Lets the calls that ran out of time unwind, and release their connections
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        results: List[FanOutResult] = []
+        for task in tasks:
+            if task.cancelled():
+                results.append(FanOutResult(error=asyncio.TimeoutError()))
+            elif task.exception() is not None:
+                results.append(FanOutResult(error=task.exception()))
+            else:
+                results.append(FanOutResult(value=task.result()))
+        return results
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, NamedTuple, Optional
+
+ImageFetcher = Callable[[], Awaitable[List[str]]]
+
+
+def _percentile(latencies: List[float], pct: float) -> float:
+    if not latencies:
+        return 0.0
+    return latencies[min(len(latencies) - 1, int(len(latencies) * pct))] * 1000
+
+
+class ImagePoolStats(NamedTuple):
+    size: int
+    capacity: int
+    served: int
+    misses: int
+    failures: int
+    fetch_p50: float
+    fetch_p95: float
+
+
+class _ImageBuffer:
+    __slots__ = (
+        "fetch",
+        "images",
+        "low_water",
+        "task",
+        "served",
+        "misses",
+        "failures",
+        "latencies",
+    )
+
+    def __init__(self, fetch: ImageFetcher, capacity: int, low_water: int) -> None:
+        self.fetch = fetch
+        self.images: Deque[str] = deque(maxlen=capacity)
+        self.low_water = low_water
+        self.task: Optional[asyncio.Task] = None
+        self.served = 0
+        self.misses = 0
+        self.failures = 0
+
+        # Seconds taken by each upstream fetch
+        self.latencies: Deque[float] = deque(maxlen=256)
+
+
+class ImagePool:
+    """Keeps image URLs of random-image APIs ready ahead of time
+
+    Each category (for example, the "hug" action) has a ring buffer of up to `capacity` URLs.
+    Commands take a URL from memory, and whenever a buffer drops below `low_water`,
+    it is refilled in the background with batches from its fetcher.
+    Only a command arriving at an empty buffer waits on the API, and it shares the refill already running.
+
+    Every URL is handed out once, so the images are as random as asking the API each time.
+    """
+
+    def __init__(self, *, capacity: int = 20, low_water: int = 5) -> None:
+        self.capacity = capacity
+        self.low_water = low_water
+        self._buffers: Dict[str, _ImageBuffer] = {}
+        self.logger = logging.getLogger("kumiko")
+
+    def register(
+        self,
+        category: str,
+        fetch: ImageFetcher,
+        *,
+        capacity: Optional[int] = None,
+        low_water: Optional[int] = None,
+    ) -> None:
+        """Adds a category, and starts filling its buffer
+
+        Args:
+            category (str): Name of the category
+            fetch (ImageFetcher): Returns a batch of image URLs from the API
+            capacity (Optional[int]): Overrides `ImagePool.capacity`. Defaults to None
+            low_water (Optional[int]): Overrides `ImagePool.low_water`. Defaults to None
+        """
+        buffer = _ImageBuffer(
+            fetch,
+            capacity=capacity or self.capacity,
+            low_water=self.low_water if low_water is None else low_water,
+        )
+        self.unregister(category)
+        self._buffers[category] = buffer
+        self._schedule_refill(buffer)
+
+    def unregister(self, *categories: str) -> None:
+        for category in categories:
+            buffer = self._buffers.pop(category, None)
+            if buffer is not None and buffer.task is not None:
+                buffer.task.cancel()
+
+    async def _refill(self, buffer: _ImageBuffer) -> None:
+        while len(buffer.images) < buffer.images.maxlen:  # type: ignore
+            start = time.perf_counter()
+            try:
+                batch = await buffer.fetch()
+            except Exception:
+                buffer.failures += 1
+                self.logger.exception("Failed to prefetch images")
+                return
+            buffer.latencies.append(time.perf_counter() - start)
+
+            if not batch:
+                return
+            buffer.images.extend(batch)
+
+    def _schedule_refill(self, buffer: _ImageBuffer) -> asyncio.Task:
+        if buffer.task is None or buffer.task.done():
+            buffer.task = asyncio.create_task(self._refill(buffer))
+        return buffer.task
+
+    async def get(self, category: str) -> Optional[str]:
+        """Takes an image URL out of the category's buffer
+
+        Args:
+            category (str): Name of the category
+
+        Returns:
+            Optional[str]: The image URL, or None if the buffer is empty and could not be refilled
+        """
+        buffer = self._buffers[category]
+        if not buffer.images:
+            buffer.misses += 1
+            # Shielded so that a cancelled command doesn't stop the refill for the others
+            await asyncio.shield(self._schedule_refill(buffer))
+
+        if not buffer.images:
+            return None
+
+        buffer.served += 1
+        url = buffer.images.popleft()
+        if len(buffer.images) < buffer.low_water:
+            self._schedule_refill(buffer)
+        return url
+
+    async def close(self) -> None:
+        """Stops every refill that is still running"""
+        tasks = [buffer.task for buffer in self._buffers.values() if buffer.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    @property
+    def stats(self) -> Dict[str, ImagePoolStats]:
+        """Fill level, hit counters and upstream latency of each category
+
+        The latencies are in milliseconds, over the last 256 fetches of the category.
+
+        Returns:
+            Dict[str, ImagePoolStats]: The current metrics of each category
+        """
+        stats = {}
+        for category, buffer in self._buffers.items():
+            latencies = sorted(buffer.latencies)
+            stats[category] = ImagePoolStats(
+                size=len(buffer.images),
+                capacity=buffer.images.maxlen,  # type: ignore
+                served=buffer.served,
+                misses=buffer.misses,
+                failures=buffer.failures,
+                fetch_p50=_percentile(latencies, 0.5),
+                fetch_p95=_percentile(latencies, 0.95),
+            )
+        return stats
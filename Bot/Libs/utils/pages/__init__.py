@@ -1,5 +1,10 @@
 from .paginator import KumikoPages as KumikoPages
 from .sources import (
+    AsyncIteratorEmbedSource as AsyncIteratorEmbedSource,
+    AsyncIteratorPageSource as AsyncIteratorPageSource,
     EmbedListSource as EmbedListSource,
+    KeysetEmbedSource as KeysetEmbedSource,
+    KeysetPageSource as KeysetPageSource,
+    KeysetSimpleSource as KeysetSimpleSource,
     SimplePageSource as SimplePageSource,
 )
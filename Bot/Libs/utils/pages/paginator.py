@@ -115,8 +115,11 @@ class KumikoPages(discord.ui.View):
             elif max_pages > page_number >= 0:
                 await self.show_page(interaction, page_number)
         except IndexError:
-            # An error happened that can be handled, so ignore it.
-            pass
+            # Sources that load lazily may have less pages than they estimated (or didn't know of),
+            # which is only known once they go past the end
+            last_page = self.source.get_max_pages()
+            if last_page is not None and page_number >= last_page:
+                await self.show_page(interaction, last_page - 1)
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
         if interaction.user and interaction.user.id in (
@@ -197,7 +200,7 @@ class KumikoPages(discord.ui.View):
     ):
         """go to the last page"""
         # The call here is safe because it's guarded by skip_if
-        await self.show_page(interaction, self.source.get_max_pages() - 1)  # type: ignore
+        await self.show_checked_page(interaction, self.source.get_max_pages() - 1)  # type: ignore
 
     @discord.ui.button(label="Skip to page...", style=discord.ButtonStyle.grey)
     async def numbered_page(
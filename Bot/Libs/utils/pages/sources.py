@@ -1,14 +1,30 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
 
+import asyncpg
 import discord
+import msgspec
 from discord.ext import menus
 
 from ..embeds import Embed
 from .paginator import KumikoPages
 
 
+def _entry_to_embed(entries: Dict[str, Any]) -> discord.Embed:
+    embed = Embed()
+    embed.title = entries["title"] if "title" in entries else ""
+    embed.description = entries["description"] if "description" in entries else ""
+    embed.set_image(url=entries["image"]) if "image" in entries else ...
+    embed.set_thumbnail(url=entries["thumbnail"]) if "thumbnail" in entries else ...
+    if "fields" in entries:
+        for item in entries["fields"]:
+            embed.add_field(name=item["name"] or ..., value=item["value"] or ...)
+    return embed
+
+
 class EmbedListSource(menus.ListPageSource):
     """Source for taking contents of an Embed, and formatting them into a page"""
 
@@ -45,15 +61,8 @@ class EmbedListSource(menus.ListPageSource):
             discord.Embed: An embed with the formatted entries
         """
         maximum = self.get_max_pages()
-        embed = Embed()
-        embed.title = entries["title"] if "title" in entries else ""
-        embed.description = entries["description"] if "description" in entries else ""
-        embed.set_image(url=entries["image"]) if "image" in entries else ...
-        embed.set_thumbnail(url=entries["thumbnail"]) if "thumbnail" in entries else ...
+        embed = _entry_to_embed(entries)
         embed.set_footer(text=f"Page {menu.current_page + 1}/{maximum}")
-        if "fields" in entries:
-            for item in entries["fields"]:
-                embed.add_field(name=item["name"] or ..., value=item["value"] or ...)
         return embed
 
 
@@ -72,3 +81,257 @@ class SimplePageSource(menus.ListPageSource):
 
         menu.embed.description = "\n".join(pages)
         return menu.embed
+
+
+class KeysetPageSource(menus.PageSource):
+    """Source that loads its entries on demand, with keyset pagination
+
+    Instead of fetching every row up front, rows are fetched as the pages are requested.
+    The query is given `args`, then the last key seen (`start` for the first page) and the amount of rows to fetch.
+    It must filter on the key, and order by it. For example:
+
+    ```sql
+    SELECT id, name
+    FROM eco_item
+    WHERE guild_id = $1 AND id > $2
+    ORDER BY id
+    LIMIT $3;
+    ```
+
+    Loaded rows are kept, so going back to a page never queries again.
+    The amount of pages is estimated from the planner's row estimate of `count_query` (through EXPLAIN),
+    which is much cheaper than a COUNT(*). It becomes exact once the last row has been loaded.
+
+    `prepare` must be awaited before the source is given to `KumikoPages`, which also tells whether there are any entries.
+    """
+
+    def __init__(
+        self,
+        pool: Union[asyncpg.Pool, asyncpg.Connection],
+        query: str,
+        *args: Any,
+        per_page: int,
+        count_query: Optional[str] = None,
+        key: str = "id",
+        start: Any = 0,
+        transform: Optional[Callable[[Dict[str, Any]], Any]] = None,
+    ):
+        self.pool = pool
+        self.query = query
+        self.args = args
+        self.per_page = per_page
+        self.count_query = count_query
+        self.key = key
+        self.transform = transform
+        self.entries: List[Any] = []
+        self.estimate = 0
+        self.exhausted = False
+        self._last_key = start
+        self._prepared = False
+
+    async def _estimate(self) -> int:
+        if self.count_query is None:
+            return 0
+
+        plan = await self.pool.fetchval(
+            f"EXPLAIN (FORMAT JSON) {self.count_query}", *self.args
+        )
+        if plan is None:
+            return 0
+        if isinstance(plan, str):
+            plan = msgspec.json.decode(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def _load(self, amount: int) -> None:
+        # Keyset pagination can't skip ahead, so the rows up to the requested page are loaded with one query.
+        # One extra row is asked for, so a load ending exactly on the last row still knows it was the last
+        rows = await self.pool.fetch(self.query, *self.args, self._last_key, amount + 1)
+        if len(rows) <= amount:
+            self.exhausted = True
+        rows = rows[:amount]
+        if rows:
+            self._last_key = rows[-1][self.key]
+
+        for row in rows:
+            record = dict(row)
+            self.entries.append(self.transform(record) if self.transform else record)
+
+    async def prepare(self) -> None:
+        if self._prepared:
+            return
+        self._prepared = True
+        self.estimate = await self._estimate()
+        await self._load(self.per_page)
+
+    @property
+    def approximate(self) -> bool:
+        """Whether the amount of pages is an estimate"""
+        return not self.exhausted
+
+    @property
+    def total(self) -> int:
+        """The amount of entries. Only an estimate until every row has been loaded"""
+        if self.exhausted:
+            return len(self.entries)
+
+        # At least one more row exists, as the last load was full
+        return max(self.estimate, len(self.entries) + 1)
+
+    def is_paginating(self) -> bool:
+        return self.total > self.per_page
+
+    def get_max_pages(self) -> int:
+        pages, left_over = divmod(self.total, self.per_page)
+        if left_over:
+            pages += 1
+        return max(pages, 1)
+
+    async def get_page(self, page_number: int) -> Any:
+        base = page_number * self.per_page
+        missing = base + self.per_page - len(self.entries)
+        if missing > 0 and not self.exhausted:
+            await self._load(missing)
+
+        if page_number < 0 or (base >= len(self.entries) and page_number != 0):
+            raise IndexError("The page is past the last entry")
+
+        if self.per_page == 1:
+            return self.entries[base] if self.entries else None
+        return self.entries[base : base + self.per_page]
+
+    def _footer(self, menu: KumikoPages) -> str:
+        maximum = self.get_max_pages()
+        if self.approximate:
+            return f"Page {menu.current_page + 1}/~{maximum}"
+        return f"Page {menu.current_page + 1}/{maximum}"
+
+
+class KeysetEmbedSource(KeysetPageSource):
+    """Keyset version of `EmbedListSource`. The entries have the same structure"""
+
+    async def format_page(
+        self, menu: KumikoPages, entries: Dict[str, Any]
+    ) -> discord.Embed:
+        embed = _entry_to_embed(entries)
+        embed.set_footer(text=self._footer(menu))
+        return embed
+
+
+class KeysetSimpleSource(KeysetPageSource):
+    """Keyset version of `SimplePageSource`"""
+
+    async def format_page(self, menu, entries):
+        pages = []
+        for index, entry in enumerate(entries, start=menu.current_page * self.per_page):
+            pages.append(f"{index + 1}. {entry}")
+
+        if self.get_max_pages() > 1:
+            total = f"~{self.total}" if self.approximate else str(self.total)
+            menu.embed.set_footer(text=f"{self._footer(menu)} ({total} entries)")
+
+        menu.embed.description = "\n".join(pages)
+        return menu.embed
+
+
+class AsyncIteratorPageSource(menus.PageSource):
+    """Source that pulls its entries from an async iterator, as the pages are requested
+
+    The first page is shown as soon as its entries arrive, instead of waiting for the whole iterator.
+    Whenever a page is shown, the next `prefetch` pages are pulled in the background,
+    so paginating forward rarely waits on the iterator.
+
+    The amount of pages is unknown (None) until the iterator is exhausted.
+    """
+
+    def __init__(
+        self,
+        iterator: AsyncIterator[Any],
+        *,
+        per_page: int,
+        prefetch: int = 1,
+        transform: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.iterator = iterator
+        self.per_page = per_page
+        self.prefetch = prefetch
+        self.transform = transform
+        self.entries: List[Any] = []
+        self.exhausted = False
+        self._lock = asyncio.Lock()
+        self._prefetch_task: Optional[asyncio.Task] = None
+        self._prepared = False
+        self.logger = logging.getLogger("kumiko")
+
+    async def _fill(self, amount: int) -> None:
+        # Async generators can't be iterated concurrently
+        async with self._lock:
+            while len(self.entries) < amount and not self.exhausted:
+                try:
+                    entry = await self.iterator.__anext__()
+                except StopAsyncIteration:
+                    self.exhausted = True
+                    break
+                self.entries.append(self.transform(entry) if self.transform else entry)
+
+    async def _prefetch(self, amount: int) -> None:
+        try:
+            await self._fill(amount)
+        except Exception:
+            # The iterator can't be resumed after it raises, so what was loaded so far is all there is
+            self.exhausted = True
+            self.logger.exception("Failed to prefetch the next pages")
+
+    def _schedule_prefetch(self, page_number: int) -> None:
+        if self.exhausted or (self._prefetch_task and not self._prefetch_task.done()):
+            return
+
+        # One more entry than needed tells whether there is a page after those
+        amount = (page_number + 1 + self.prefetch) * self.per_page + 1
+        if len(self.entries) < amount:
+            self._prefetch_task = asyncio.create_task(self._prefetch(amount))
+
+    async def prepare(self) -> None:
+        if self._prepared:
+            return
+        self._prepared = True
+        await self._fill(self.per_page + 1)
+
+    def is_paginating(self) -> bool:
+        return not self.exhausted or len(self.entries) > self.per_page
+
+    def get_max_pages(self) -> Optional[int]:
+        if not self.exhausted:
+            return None
+        pages, left_over = divmod(len(self.entries), self.per_page)
+        if left_over:
+            pages += 1
+        return max(pages, 1)
+
+    async def get_page(self, page_number: int) -> Any:
+        base = page_number * self.per_page
+        await self._fill(base + self.per_page)
+
+        if page_number < 0 or (base >= len(self.entries) and page_number != 0):
+            raise IndexError("The page is past the last entry")
+
+        self._schedule_prefetch(page_number)
+        if self.per_page == 1:
+            return self.entries[base] if self.entries else None
+        return self.entries[base : base + self.per_page]
+
+    def _footer(self, menu: KumikoPages) -> str:
+        maximum = self.get_max_pages()
+        if maximum is None:
+            return f"Page {menu.current_page + 1}"
+        return f"Page {menu.current_page + 1}/{maximum}"
+
+
+class AsyncIteratorEmbedSource(AsyncIteratorPageSource):
+    """Async iterator version of `EmbedListSource`. The entries have the same structure"""
+
+    async def format_page(
+        self, menu: KumikoPages, entries: Dict[str, Any]
+    ) -> discord.Embed:
+        embed = _entry_to_embed(entries)
+        embed.set_footer(text=self._footer(menu))
+        return embed
@@ -4,7 +4,8 @@ import msgspec
 
 async def init_codecs(conn: asyncpg.connection.Connection):
     def _encode_jsonb(value):
-        return msgspec.json.encode(value)
+        # Text codecs have to give asyncpg a str
+        return msgspec.json.encode(value).decode("utf-8")
 
     def _decode_jsonb(value):
         return msgspec.json.decode(value)
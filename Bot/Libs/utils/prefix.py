@@ -1,34 +1,101 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List, Union
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Dict, List, Set, Union
 
+import asyncpg
 import discord
 
 if TYPE_CHECKING:
     from Bot.kumikocore import KumikoCore
 
+# Lookups that are currently running, keyed by guild ID.
+# Concurrent messages from the same uncached guild wait on the same lookup
+_inflight: Dict[int, "asyncio.Task[Union[str, List[str]]]"] = {}
+
+
+class PrefixBackfill:
+    """Writes the default prefix for guilds that have none, in batches
+
+    This keeps all writes out of `get_prefix`, which runs on every message.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, default_prefix: str) -> None:
+        self.pool = pool
+        self.default_prefix = default_prefix
+        self._pending: Set[int] = set()
+
+    def add(self, guild_id: int) -> None:
+        self._pending.add(guild_id)
+
+    async def flush(self) -> int:
+        """Writes all of the pending guilds with one query
+
+        Returns:
+            int: The amount of guilds that were pending
+        """
+        if not self._pending:
+            return 0
+
+        guild_ids = list(self._pending)
+        self._pending.clear()
+        query = """
+        UPDATE guild
+        SET prefix = $1
+        WHERE id = ANY($2::bigint[]) AND (prefix IS NULL OR cardinality(prefix) = 0);
+        """
+        try:
+            await self.pool.execute(query, [self.default_prefix], guild_ids)
+        except Exception:
+            # Try again on the next flush
+            self._pending.update(guild_ids)
+            raise
+        return len(guild_ids)
+
+    async def run(self, interval: float = 30.0) -> None:
+        """Long-running task that flushes the pending guilds every `interval` seconds
+
+        Args:
+            interval (float): Seconds between flushes. Defaults to 30.0
+        """
+        logger = logging.getLogger("kumiko")
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.flush()
+            except (OSError, asyncpg.PostgresError):
+                logger.exception("Failed to backfill the default prefixes")
+
+
+async def _fetch_prefix(bot: KumikoCore, guild_id: int) -> Union[str, List[str]]:
+    query = """
+    SELECT prefix FROM guild WHERE id = $1;
+    """
+    prefix = await bot.pool.fetchval(query, guild_id)
+    if not prefix:
+        # Cached as the default, so the guild isn't looked up again on every message
+        bot.prefix_backfill.add(guild_id)
+        prefix = bot.default_prefix
+    bot.prefixes[guild_id] = prefix
+    return prefix
+
 
 async def get_prefix(bot: KumikoCore, msg: discord.Message) -> Union[str, List[str]]:
     if msg.guild is None:
         return bot.default_prefix
     cached_prefix = bot.prefixes.get(msg.guild.id)
-    if cached_prefix is None:
-        async with bot.pool.acquire() as conn:
-            query = """
-            SELECT prefix FROM guild WHERE id = $1;
-            """
-            update_query = """
-            UPDATE guild
-            SET prefix = $1
-            WHERE id = $2;
-            """
-            fetch_prefix = await conn.fetchval(query, msg.guild.id)
-            if fetch_prefix:
-                bot.prefixes[msg.guild.id] = fetch_prefix
-                return bot.prefixes[msg.guild.id]
-            else:
-                await conn.execute(update_query, [bot.default_prefix], msg.guild.id)
-                bot.prefixes[msg.guild.id] = bot.default_prefix
-                return bot.prefixes[msg.guild.id]
-    else:
-        return bot.prefixes[msg.guild.id]
+    if cached_prefix is not None:
+        bot.prefix_hits += 1
+        return cached_prefix
+
+    bot.prefix_misses += 1
+    guild_id = msg.guild.id
+    task = _inflight.get(guild_id)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_prefix(bot, guild_id))
+        _inflight[guild_id] = task
+        task.add_done_callback(lambda _: _inflight.pop(guild_id, None))
+
+    # Shielded so that one cancelled message handler does not cancel the lookup for the others
+    return await asyncio.shield(task)
@@ -8,10 +8,14 @@ file, You can obtain one at http://mozilla.org/MPL/2.0/.
 
 from __future__ import annotations
 
+import abc
+import functools
 import heapq
 import re
+from collections import Counter
 from difflib import SequenceMatcher
 from typing import (
+    Any,
     Callable,
     Generator,
     Iterable,
@@ -35,17 +39,23 @@ def quick_ratio(a: str, b: str) -> int:
     return int(round(100 * m.quick_ratio()))
 
 
-def partial_ratio(a: str, b: str) -> int:
-    short, long = (a, b) if len(a) <= len(b) else (b, a)
+def _partial_ratio(short: str, long: str) -> int:
     m = SequenceMatcher(None, short, long)
+    o = SequenceMatcher(None, short, "")
 
     blocks = m.get_matching_blocks()
 
     scores: list[float] = []
+    seen: set[int] = set()
     for i, j, n in blocks:
         start = max(j - i, 0)
+        # blocks often line up to the same window, which would score the same
+        if start in seen:
+            continue
+        seen.add(start)
+
         end = start + len(short)
-        o = SequenceMatcher(None, short, long[start:end])
+        o.set_seq2(long[start:end])
         r = o.ratio()
 
         if 100 * r > 99:
@@ -55,9 +65,15 @@ def partial_ratio(a: str, b: str) -> int:
     return int(round(100 * max(scores)))
 
 
+def partial_ratio(a: str, b: str) -> int:
+    short, long = (a, b) if len(a) <= len(b) else (b, a)
+    return _partial_ratio(short, long)
+
+
 _word_regex = re.compile(r"\W", re.IGNORECASE)
 
 
+@functools.lru_cache(maxsize=16384)
 def _sort_tokens(a: str) -> str:
     a = _word_regex.sub(" ", a).lower().strip()
     return " ".join(sorted(a.split()))
@@ -81,6 +97,187 @@ def partial_token_sort_ratio(a: str, b: str) -> int:
     return partial_ratio(a, b)
 
 
+def _to_score(r: float) -> int:
+    return int(round(100 * r))
+
+
+def _calculate_ratio(matches: int, length: int) -> float:
+    # Same as difflib's, so the scores are identical
+    return 2.0 * matches / length if length else 1.0
+
+
+def _common_count(query_counts: Counter[str], choice: str) -> int:
+    # The amount of characters both have in common, ignoring order.
+    # This is what SequenceMatcher.quick_ratio is based on
+    counts = Counter(choice)
+    return sum(min(n, counts[c]) for c, n in query_counts.items())
+
+
+class BatchScorer(abc.ABC):
+    """Scores one query against many choices
+
+    The query is prepared once, and choices that provably score below `minimum`
+    can be skipped using cheap bounds (lengths, character counts) before any full scoring is done.
+    Every score that is returned must be the same as the one from the pairwise scorer.
+
+    Register an implementation with `register_batch_scorer` for `extract` and friends to use it.
+    """
+
+    def prepare(self, query: str) -> Any:
+        return query
+
+    @abc.abstractmethod
+    def score(self, prepared: Any, choice: str, minimum: int) -> Optional[int]:
+        """Scores a single choice
+
+        Args:
+            prepared (Any): The query, as returned by `prepare`
+            choice (str): The choice to score
+            minimum (int): The lowest score that would be kept
+
+        Returns:
+            Optional[int]: The score, or None if it is known to be below `minimum`
+        """
+        ...
+
+
+class _RatioScorer(BatchScorer):
+    # ratio <= quick_ratio <= real_quick_ratio, so each bound is checked
+    # from the cheapest to the most expensive
+    def __init__(self, *, quick: bool = False, tokens: bool = False) -> None:
+        self.quick = quick
+        self.tokens = tokens
+
+    def prepare(self, query: str) -> Any:
+        if self.tokens:
+            query = _sort_tokens(query)
+        return query, Counter(query), SequenceMatcher(None, query, "")
+
+    def score(self, prepared: Any, choice: str, minimum: int) -> Optional[int]:
+        query, counts, matcher = prepared
+        if self.tokens:
+            choice = _sort_tokens(choice)
+
+        length = len(query) + len(choice)
+        if (
+            minimum > 0
+            and _to_score(_calculate_ratio(min(len(query), len(choice)), length))
+            < minimum
+        ):
+            return None
+
+        quick = _to_score(_calculate_ratio(_common_count(counts, choice), length))
+        if self.quick:
+            return quick
+        if quick < minimum:
+            return None
+
+        matcher.set_seq2(choice)
+        return _to_score(matcher.ratio())
+
+
+class _PartialRatioScorer(BatchScorer):
+    def __init__(self, *, tokens: bool = False) -> None:
+        self.tokens = tokens
+
+    def prepare(self, query: str) -> Any:
+        if self.tokens:
+            query = _sort_tokens(query)
+        return query, Counter(query)
+
+    def score(self, prepared: Any, choice: str, minimum: int) -> Optional[int]:
+        query, counts = prepared
+        if self.tokens:
+            choice = _sort_tokens(choice)
+
+        short, long = (query, choice) if len(query) <= len(choice) else (choice, query)
+        if minimum > 0:
+            # Every window of `long` is compared against `short`, and shares at most `common` characters with it.
+            # The best possible ratio is when the window is made of exactly those characters
+            common = _common_count(counts, choice)
+            if _to_score(_calculate_ratio(common, len(short) + common)) < minimum:
+                return None
+
+        return _partial_ratio(short, long)
+
+
+_batch_scorers: dict[Callable[[str, str], int], BatchScorer] = {
+    ratio: _RatioScorer(),
+    quick_ratio: _RatioScorer(quick=True),
+    token_sort_ratio: _RatioScorer(tokens=True),
+    quick_token_sort_ratio: _RatioScorer(quick=True, tokens=True),
+    partial_ratio: _PartialRatioScorer(),
+    partial_token_sort_ratio: _PartialRatioScorer(tokens=True),
+}
+
+
+def register_batch_scorer(
+    scorer: Callable[[str, str], int], batch_scorer: BatchScorer
+) -> None:
+    """Registers the batched implementation of a scorer
+
+    Args:
+        scorer (Callable[[str, str], int]): The pairwise scorer, as passed to `extract`
+        batch_scorer (BatchScorer): The batched implementation
+    """
+    _batch_scorers[scorer] = batch_scorer
+
+
+def _batch_extract(
+    query: str,
+    choices: Sequence[str],
+    batch_scorer: BatchScorer,
+    score_cutoff: int,
+    limit: Optional[int],
+) -> list[tuple[int, int]]:
+    # Returns (score, index) pairs in the same order a stable sort by score would
+    if limit is not None and limit <= 0:
+        return []
+
+    prepared = batch_scorer.prepare(query)
+    # Min-heap of (score, -index), so the first to be evicted is the lowest score that came last
+    top: list[tuple[int, int]] = []
+    for idx, choice in enumerate(choices):
+        minimum = score_cutoff
+        if limit is not None and len(top) >= limit:
+            # A later choice needs to score strictly higher to replace one
+            minimum = max(minimum, top[0][0] + 1)
+
+        score = batch_scorer.score(prepared, choice, minimum)
+        if score is None or score < minimum:
+            continue
+
+        if limit is None or len(top) < limit:
+            heapq.heappush(top, (score, -idx))
+        else:
+            heapq.heapreplace(top, (score, -idx))
+
+    return sorted(((score, -idx) for score, idx in top), key=lambda t: (-t[0], t[1]))
+
+
+def _extract(
+    query: str,
+    choices: dict[str, T] | Sequence[str],
+    scorer: Callable[[str, str], int],
+    score_cutoff: int,
+    limit: Optional[int],
+) -> Optional[list[tuple[str, int]] | list[tuple[str, int, T]]]:
+    batch_scorer = _batch_scorers.get(scorer)
+    if batch_scorer is None:
+        return None
+
+    if isinstance(choices, dict):
+        keys = list(choices.keys())
+        values = list(choices.values())
+        ranked = _batch_extract(query, keys, batch_scorer, score_cutoff, limit)
+        return [(keys[idx], score, values[idx]) for score, idx in ranked]
+
+    # Sets, dict views and generators can't be indexed (and generators only read once)
+    choices = list(choices)
+    ranked = _batch_extract(query, choices, batch_scorer, score_cutoff, limit)
+    return [(choices[idx], score) for score, idx in ranked]
+
+
 @overload
 def _extraction_generator(
     query: str,
@@ -151,6 +348,10 @@ def extract(
     score_cutoff: int = 0,
     limit: Optional[int] = 10,
 ) -> list[tuple[str, int]] | list[tuple[str, int, T]]:
+    batched = _extract(query, choices, scorer, score_cutoff, limit)
+    if batched is not None:
+        return batched
+
     it = _extraction_generator(query, choices, scorer, score_cutoff)
 
     def key(t):
@@ -190,6 +391,10 @@ def extract_one(
     scorer: Callable[[str, str], int] = quick_ratio,
     score_cutoff: int = 0,
 ) -> Optional[tuple[str, int]] | Optional[tuple[str, int, T]]:
+    batched = _extract(query, choices, scorer, score_cutoff, 1)
+    if batched is not None:
+        return batched[0] if batched else None
+
     it = _extraction_generator(query, choices, scorer, score_cutoff)
 
     def key(t):
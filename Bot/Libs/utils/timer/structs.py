@@ -1,7 +1,8 @@
 import datetime
-from typing import Any, Dict, NamedTuple, Optional, Sequence
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
 
 import asyncpg
+import msgspec
 from discord import app_commands
 from discord.utils import format_dt
 from typing_extensions import Self
@@ -65,6 +66,28 @@ class Timer:
         return f"<Timer created={self.created_at} expires={self.expires} event={self.event}>"
 
 
+class ShortTimer(msgspec.Struct):
+    """A near-term timer, as stored within the Redis sorted set"""
+
+    uid: str
+    event: str
+    args: List[Any]
+    kwargs: Dict[str, Any]
+    expires: datetime.datetime
+    created: datetime.datetime
+    timezone: str
+
+    def to_timer(self) -> Timer:
+        return Timer.temporary(
+            expires=self.expires,
+            created=self.created,
+            event=self.event,
+            args=self.args,
+            kwargs=self.kwargs,
+            timezone=self.timezone,
+        )
+
+
 class TimeZone(NamedTuple):
     label: str
     key: str
@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import asyncio
 import datetime
-from typing import TYPE_CHECKING, Any, Optional
+import heapq
+import itertools
+import uuid
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import asyncpg
 import dateutil.tz
 import discord
-import fuzzy_utils as fuzzy
+import msgspec
 from async_lru import alru_cache
 from dateutil.zoneinfo import get_zonefile_instance
+from redis.exceptions import RedisError
 
-from .structs import Timer, TimeZone
-from .utils import MaybeAcquireConnection
+from .structs import ShortTimer, Timer, TimeZone
+from .tz_index import TimezoneIndex
 
 if TYPE_CHECKING:
     from Bot.kumikocore import KumikoCore
@@ -56,10 +60,31 @@ class TimerScheduler:
         "cnsha",  # Asia/Shanghai
     )
 
+    # How far ahead timers are loaded from the database into memory at once
+    WINDOW = datetime.timedelta(hours=1)
+
+    # How often due timers are claimed even when none are due locally.
+    # This picks up the timers that other (possibly dead) processes had scheduled
+    CLAIM_INTERVAL = datetime.timedelta(seconds=60)
+
+    # Timers within this amount of seconds are kept in Redis instead of Postgres
+    SHORT_TIMER_THRESHOLD = 60
+
+    # Sorted set holding the short timers, scored by their expiry as an UNIX timestamp
+    SHORT_TIMERS_KEY = "kumiko:timers:short"
+
     def __init__(self, bot: KumikoCore):
         self.bot = bot
-        self._have_data = asyncio.Event()
-        self._current_timer: Optional[Timer] = None
+        # Min-heap of (expires, insertion order, key) for every timer within the loaded window.
+        # The key is the row ID for timers in Postgres, or the sorted set member for short timers
+        self._heap: list[tuple[datetime.datetime, int, Union[int, str]]] = []
+        # Keys of the timers that are still pending within the heap.
+        # Deleted timers are dropped from here and skipped once they are popped
+        self._queued: set[Union[int, str]] = set()
+        self._counter = itertools.count()
+        self._loaded_until = datetime.datetime.min
+        self._next_claim = datetime.datetime.min
+        self._wakeup = asyncio.Event()
         self._task = bot.loop.create_task(self.dispatch_timers())
         self.valid_timezones: set[str] = set(get_zonefile_instance().zones)
         # User-friendly timezone names, some manual and most from the CLDR database.
@@ -78,6 +103,9 @@ class TimerScheduler:
             "MDT": "America/Denver",
             "PDT": "America/Los_Angeles",
         }
+        # Built once, as autocomplete searches these on every keystroke
+        self._timezone_index = TimezoneIndex(self.valid_timezones)
+        self._alias_index = TimezoneIndex(self._timezone_aliases.keys())
 
     @alru_cache(maxsize=128)
     async def get_timezone(self, user_id: int, /) -> Optional[str]:
@@ -91,88 +119,236 @@ class TimerScheduler:
             return datetime.timezone.utc
         return dateutil.tz.gettz(tz) or datetime.timezone.utc
 
-    def find_timezones(self, query: str) -> list[TimeZone]:
+    def find_timezones(
+        self, query: str, *, limit: Optional[int] = 25
+    ) -> list[TimeZone]:
         # A bit hacky, but if '/' is in the query then it's looking for a raw identifier
         # otherwise it's looking for a CLDR alias
         if "/" in query:
             return [
                 TimeZone(key=a, label=a)
-                for a in fuzzy.finder(query, self.valid_timezones)
+                for a in self._timezone_index.search(query, limit=limit)
             ]
 
-        keys = fuzzy.finder(query, self._timezone_aliases.keys())
+        keys = self._alias_index.search(query, limit=limit)
         return [TimeZone(label=k, key=self._timezone_aliases[k]) for k in keys]
 
-    async def get_active_timer(
-        self, *, connection: Optional[asyncpg.Connection] = None, days: int = 7
-    ) -> Optional[Timer]:
+    async def get_active_timers(
+        self,
+        until: datetime.datetime,
+        *,
+        connection: Optional[asyncpg.Connection] = None,
+    ) -> list[Timer]:
         query = """
             SELECT * FROM timers
-            WHERE (expires AT TIME ZONE 'UTC' AT TIME ZONE timezone) < (CURRENT_TIMESTAMP + $1::interval)
-            ORDER BY expires
-            LIMIT 1;
+            WHERE expires < $1
+            ORDER BY expires;
         """
         con = connection or self.bot.pool
 
-        record = await con.fetchrow(query, datetime.timedelta(days=days))
-        return Timer(record=record) if record else None
+        records = await con.fetch(query, until)
+        return [Timer(record=record) for record in records]
 
-    async def wait_for_active_timers(
-        self, *, connection: Optional[asyncpg.Connection] = None, days: int = 7
-    ) -> Timer:
-        async with MaybeAcquireConnection(
-            connection=connection, pool=self.bot.pool
-        ) as con:
-            timer = await self.get_active_timer(connection=con, days=days)
-            if timer is not None:
-                self._have_data.set()
-                return timer
+    def _push(self, expires: datetime.datetime, key: Union[int, str]) -> None:
+        if key in self._queued:
+            return
+        self._queued.add(key)
+        heapq.heappush(self._heap, (expires, next(self._counter), key))
+
+    def _schedule(self, expires: datetime.datetime, key: Union[int, str]) -> None:
+        # timers past the loaded window are picked up by the next refill
+        if expires < self._loaded_until:
+            self._push(expires, key)
+
+            # only wake the dispatcher if this is now the earliest timer
+            if self._heap[0][2] == key:
+                self._wakeup.set()
+
+    @staticmethod
+    def _to_score(when: datetime.datetime) -> float:
+        return when.replace(tzinfo=datetime.timezone.utc).timestamp()
+
+    async def get_short_timers(self, until: datetime.datetime) -> list[str]:
+        return await self.bot.cache.client.zrangebyscore(
+            self.SHORT_TIMERS_KEY, "-inf", self._to_score(until)
+        )
+
+    async def _find_short_timer(
+        self, event: str, kwargs: dict[str, Any]
+    ) -> Optional[tuple[str, ShortTimer]]:
+        # The sorted set only holds timers for the next minute, so a linear scan is fine
+        members = await self.bot.cache.client.zrange(self.SHORT_TIMERS_KEY, 0, -1)
+        for member in members:
+            entry = msgspec.json.decode(member, type=ShortTimer)
+            if entry.event == event and all(
+                str(entry.kwargs.get(key)) == str(value)
+                for key, value in kwargs.items()
+            ):
+                return member, entry
+        return None
+
+    async def refill(self, now: datetime.datetime) -> None:
+        """Loads every timer that expires within the next window into the heap.
+
+        Parameters
+        -----------
+        now: datetime.datetime
+            The current time, in naive UTC.
+        """
+        # The window is moved before querying, so a timer created while the query runs
+        # is pushed by create_timer instead of waiting for the next refill.
+        # Any duplicates are skipped by _push
+        self._loaded_until = now + self.WINDOW
+        for timer in await self.get_active_timers(self._loaded_until):
+            self._push(timer.expires, timer.id)
+
+        # Short timers survive restarts through Redis
+        for member in await self.get_short_timers(self._loaded_until):
+            entry = msgspec.json.decode(member, type=ShortTimer)
+            self._push(entry.expires, member)
+
+    async def claim_due_timers(
+        self, now: datetime.datetime, *, limit: int = 500
+    ) -> list[Timer]:
+        """Deletes and returns a batch of timers that are due.
+
+        Rows locked by another process claiming them at the same time are skipped,
+        so multiple instances can share the table without firing a timer twice.
+
+        Parameters
+        -----------
+        now: datetime.datetime
+            The current time, in naive UTC.
+        limit: int
+            The maximum amount of timers to claim at once.
+
+        Returns
+        --------
+        List[:class:`Timer`]
+            The claimed timers, sorted by expiry.
+        """
+        query = """
+            WITH due AS (
+                SELECT id FROM timers
+                WHERE expires <= $1
+                ORDER BY expires
+                LIMIT $2
+                FOR UPDATE SKIP LOCKED
+            )
+            DELETE FROM timers
+            USING due
+            WHERE timers.id = due.id
+            RETURNING timers.*;
+        """
+        records = await self.bot.pool.fetch(query, now, limit)
+        timers = [Timer(record=record) for record in records]
+        timers.sort(key=lambda timer: timer.expires)
+        return timers
 
-            self._have_data.clear()
-            self._current_timer = None
-            await self._have_data.wait()
+    async def claim_due_short_timers(self, now: datetime.datetime) -> list[Timer]:
+        """Removes and returns the short timers that are due from Redis.
 
-            # At this point we always have data
-            return await self.get_active_timer(connection=con, days=days)  # type: ignore
+        Both commands run within MULTI/EXEC, so each timer is only claimed by one process.
 
-    async def call_timer(self, timer: Timer) -> None:
-        # delete the timer
-        query = "DELETE FROM reminders WHERE id=$1;"
-        await self.bot.pool.execute(query, timer.id)
+        Parameters
+        -----------
+        now: datetime.datetime
+            The current time, in naive UTC.
 
-        # dispatch the event
-        event_name = f"{timer.event}_timer_complete"
-        self.bot.dispatch(event_name, timer)
+        Returns
+        --------
+        List[:class:`Timer`]
+            The claimed timers, sorted by expiry.
+        """
+        score = self._to_score(now)
+        async with self.bot.cache.client.pipeline(transaction=True) as pipe:
+            pipe.zrangebyscore(self.SHORT_TIMERS_KEY, "-inf", score)
+            pipe.zremrangebyscore(self.SHORT_TIMERS_KEY, "-inf", score)
+            members, _ = await pipe.execute()
+
+        # ZRANGEBYSCORE already returns them in order of expiry
+        return [
+            msgspec.json.decode(member, type=ShortTimer).to_timer()
+            for member in members
+        ]
+
+    def call_timers(self, timers: list[Timer]) -> None:
+        for timer in timers:
+            # dispatch the event
+            event_name = f"{timer.event}_timer_complete"
+            self.bot.dispatch(event_name, timer)
+
+    async def call_due_timers(
+        self, now: datetime.datetime, *, limit: int = 500
+    ) -> None:
+        while True:
+            timers = await self.claim_due_timers(now, limit=limit)
+            self.call_timers(timers)
+
+            if len(timers) < limit:
+                return
 
     async def dispatch_timers(self) -> None:
         try:
             while not self.bot.is_closed():
-                # can only asyncio.sleep for up to ~48 days reliably
-                # so we're gonna cap it off at 40 days
-                # see: http://bugs.python.org/issue20493
-                timer = self._current_timer = await self.wait_for_active_timers(days=40)
                 now = datetime.datetime.utcnow()
-
-                if timer.expires >= now:
-                    to_sleep = (timer.expires - now).total_seconds()
-                    await asyncio.sleep(to_sleep)
-
-                await self.call_timer(timer)
+                if now >= self._loaded_until:
+                    await self.refill(now)
+
+                # The heap only decides when to wake up. The due timers themselves are claimed
+                # from Postgres and Redis, which also picks up the ones created by other processes
+                pending_long = pending_short = now >= self._next_claim
+                if pending_long:
+                    self._next_claim = now + self.CLAIM_INTERVAL
+
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, key = heapq.heappop(self._heap)
+                    if key in self._queued:
+                        self._queued.discard(key)
+                        if isinstance(key, str):
+                            pending_short = True
+                        else:
+                            pending_long = True
+
+                if pending_short:
+                    self.call_timers(await self.claim_due_short_timers(now))
+
+                if pending_long:
+                    await self.call_due_timers(now)
+
+                # Sleep until the next timer is due, the window needs to be refilled,
+                # the next periodic claim, or an earlier timer gets created
+                self._wakeup.clear()
+                wake_at = min(self._loaded_until, self._next_claim)
+                if self._heap and self._heap[0][0] < wake_at:
+                    wake_at = self._heap[0][0]
+
+                to_sleep = (wake_at - datetime.datetime.utcnow()).total_seconds()
+                try:
+                    await asyncio.wait_for(
+                        self._wakeup.wait(), timeout=max(to_sleep, 0)
+                    )
+                except asyncio.TimeoutError:
+                    pass
         except asyncio.CancelledError:
             raise
-        except (OSError, discord.ConnectionClosed, asyncpg.PostgresConnectionError):
+        except (
+            OSError,
+            discord.ConnectionClosed,
+            asyncpg.PostgresConnectionError,
+            RedisError,
+        ):
+            # Timers may have been missed, so the window is reloaded and claimed right away
+            self._loaded_until = datetime.datetime.min
+            self._next_claim = datetime.datetime.min
             self._task.cancel()
             self._task = self.bot.loop.create_task(self.dispatch_timers())
 
-    async def short_timer_optimisation(self, seconds: float, timer: Timer) -> None:
-        await asyncio.sleep(seconds)
-        event_name = f"{timer.event}_timer_complete"
-        self.bot.dispatch(event_name, timer)
-
     async def get_timer(self, event: str, /, **kwargs: Any) -> Optional[Timer]:
         r"""Gets a timer from the database.
 
         Note you cannot find a database by its expiry or creation time.
+        Short timers are looked up within Redis instead.
 
         Parameters
         -----------
@@ -193,12 +369,17 @@ class TimerScheduler:
         ]  # nosec # In this case it is actually needed for this to be shoved in a f-string. there is simply no way around it
         query = f"SELECT * FROM timers WHERE event = $1 AND {' AND '.join(filtered_clause)} LIMIT 1"  # nosec # see above
         record = await self.bot.pool.fetchrow(query, event, *kwargs.values())
-        return Timer(record=record) if record else None
+        if record is not None:
+            return Timer(record=record)
+
+        found = await self._find_short_timer(event, kwargs)
+        return found[1].to_timer() if found else None
 
     async def delete_timer(self, event: str, /, **kwargs: Any) -> None:
         r"""Deletes a timer from the database.
 
         Note you cannot find a database by its expiry or creation time.
+        Short timers are deleted from Redis instead.
 
         Parameters
         -----------
@@ -215,15 +396,16 @@ class TimerScheduler:
         query = f"DELETE FROM timers WHERE event = $1 AND {' AND '.join(filtered_clause)} RETURNING id"  # nosec # see above
         record: Any = await self.bot.pool.fetchrow(query, event, *kwargs.values())
 
-        # if the current timer is being deleted
-        if (
-            record is not None
-            and self._current_timer
-            and self._current_timer.id == record["id"]
+        # if the timer is waiting in the heap, it gets skipped once popped
+        if record is not None:
+            self._queued.discard(record["id"])
+            return
+
+        found = await self._find_short_timer(event, kwargs)
+        if found is not None and await self.bot.cache.client.zrem(
+            self.SHORT_TIMERS_KEY, found[0]
         ):
-            # cancel the task and re-run it
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
+            self._queued.discard(found[0])
 
     async def create_timer(
         self, when: datetime.datetime, event: str, /, *args: Any, **kwargs: Any
@@ -282,10 +464,28 @@ class TimerScheduler:
             timezone=timezone_name,
         )
         delta = (when - now).total_seconds()
-        if delta <= 60:
-            # a shortcut for small timers
-            self.bot.loop.create_task(self.short_timer_optimisation(delta, timer))
-            return timer
+        if delta <= self.SHORT_TIMER_THRESHOLD:
+            # a shortcut for small timers, which skips Postgres entirely
+            entry = ShortTimer(
+                uid=uuid.uuid4().hex,
+                event=event,
+                args=list(args),
+                kwargs=kwargs,
+                expires=when,
+                created=now,
+                timezone=timezone_name,
+            )
+            member = msgspec.json.encode(entry).decode("utf-8")
+            try:
+                await self.bot.cache.client.zadd(
+                    self.SHORT_TIMERS_KEY, {member: self._to_score(when)}
+                )
+            except RedisError:
+                # Fall back to storing it within Postgres
+                pass
+            else:
+                self._schedule(when, member)
+                return timer
 
         query = """INSERT INTO timers (event, extra, expires, created, timezone)
                    VALUES ($1, $2::jsonb, $3, $4, $5)
@@ -296,15 +496,5 @@ class TimerScheduler:
             query, event, {"args": args, "kwargs": kwargs}, when, now, timezone_name
         )
         timer.id = row[0]
-
-        # only set the data check if it can be waited on
-        if delta <= (86400 * 40):  # 40 days
-            self._have_data.set()
-
-        # check if this timer is earlier than our currently run timer
-        if self._current_timer and when < self._current_timer.expires:
-            # cancel the task and re-run it
-            self._task.cancel()
-            self._task = self.bot.loop.create_task(self.dispatch_timers())
-
+        self._schedule(when, timer.id)
         return timer
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import heapq
+import re
+from typing import Iterable, Optional
+
+from lru import LRU
+
+
+class TimezoneIndex:
+    """Precomputed search index over timezone names
+
+    This returns the same results, in the same order, as `fuzzy.finder`,
+    but without running the regex over every name on each keystroke.
+
+    Each name gets a bitmask of the characters it contains,
+    so names missing any character of the query are skipped before the regex is ran.
+    The names that matched a query are kept, so a longer query typed after it (eg. "amer" after "ame")
+    only has to look through those.
+    """
+
+    def __init__(self, names: Iterable[str], *, cache_size: int = 256) -> None:
+        self._names = sorted(set(names))
+        self._bits: dict[str, int] = {}
+        self._masks = [self._to_mask(name.lower(), learn=True) for name in self._names]
+        self._everything = list(range(len(self._names)))
+
+        # (query, limit) -> results
+        self._results: LRU = LRU(cache_size)
+
+        # query -> indexes of the names that matched it
+        self._matched: LRU = LRU(cache_size)
+
+    def _to_mask(self, text: str, *, learn: bool = False) -> Optional[int]:
+        mask = 0
+        for char in text:
+            bit = self._bits.get(char)
+            if bit is None:
+                if not learn:
+                    # No name contains this character, so nothing can match
+                    return None
+                bit = self._bits[char] = 1 << len(self._bits)
+            mask |= bit
+        return mask
+
+    def _candidates(self, text: str) -> list[int]:
+        # Any name matching the query also matches every prefix of it
+        for end in range(len(text) - 1, 0, -1):
+            matched = self._matched.get(text[:end])
+            if matched is not None:
+                return matched
+        return self._everything
+
+    def search(self, query: str, *, limit: Optional[int] = 25) -> list[str]:
+        """Finds the names containing all of the characters of the query, in order
+
+        Args:
+            query (str): The query to search with
+            limit (Optional[int]): The maximum amount of results. Defaults to 25.
+
+        Returns:
+            list[str]: The matching names, best matches first
+        """
+        text = str(query).lower()
+        cached = self._results.get((text, limit))
+        if cached is not None:
+            return list(cached)
+
+        mask = self._to_mask(text)
+        suggestions: list[tuple[int, int, str]] = []
+        matched: list[int] = []
+        if mask is not None:
+            regex = re.compile(".*?".join(map(re.escape, text)), flags=re.IGNORECASE)
+            for idx in self._candidates(text):
+                if self._masks[idx] & mask != mask:  # type: ignore
+                    continue
+
+                name = self._names[idx]
+                r = regex.search(name)
+                if r:
+                    suggestions.append((len(r.group()), r.start(), name))
+                    matched.append(idx)
+
+        self._matched[text] = matched
+        if limit is not None:
+            ranked = heapq.nsmallest(limit, suggestions)
+        else:
+            ranked = sorted(suggestions)
+
+        results = [name for _, _, name in ranked]
+        self._results[(text, limit)] = results
+        return list(results)
@@ -1,5 +1,20 @@
-from aiohttp import ClientSession
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, cast
+
+import orjson
+from aiohttp import ClientError, ClientSession
+from gql import Client, gql
+from gql.client import AsyncClientSession
 from gql.transport.aiohttp import AIOHTTPTransport
+from gql.transport.exceptions import TransportError, TransportQueryError
+from graphql import DocumentNode, IntrospectionQuery, get_introspection_query
+
+INTROSPECTION_QUERY = gql(get_introspection_query())
 
 
 class AIOHTTPTransportExistingSession(AIOHTTPTransport):
@@ -12,3 +27,114 @@ class AIOHTTPTransportExistingSession(AIOHTTPTransport):
 
     async def close(self) -> None:
         pass
+
+
+class CachedSchemaClient:
+    """Long-lived GraphQL client, whose schema is cached on disk
+
+    The schema is introspected once and written to `schema_path`.
+    Later startups load it from there, and only introspect again once it is older than `max_age` seconds.
+    If introspecting fails, the cached schema is used no matter its age,
+    so the client still starts without network access.
+    Queries are validated against the schema locally, and only the query itself is sent.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        session: ClientSession,
+        schema_path: Path,
+        *,
+        max_age: float = 7 * 24 * 60 * 60,
+    ) -> None:
+        self.transport = AIOHTTPTransportExistingSession(
+            url=url, client_session=session
+        )
+        self.schema_path = schema_path
+        self.max_age = max_age
+        self.client: Optional[Client] = None
+        self._session: Optional[AsyncClientSession] = None
+        self._start_lock = asyncio.Lock()
+        self.logger = logging.getLogger("kumiko")
+
+    def _read_cache(self) -> Optional[IntrospectionQuery]:
+        try:
+            return orjson.loads(self.schema_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return None
+
+    def _write_cache(self, introspection: IntrospectionQuery) -> None:
+        self.schema_path.parent.mkdir(parents=True, exist_ok=True)
+        self.schema_path.write_bytes(orjson.dumps(introspection))
+
+    def _is_stale(self) -> bool:
+        try:
+            return time.time() - self.schema_path.stat().st_mtime > self.max_age
+        except OSError:
+            return True
+
+    async def _introspect(self) -> IntrospectionQuery:
+        result = await self.transport.execute(INTROSPECTION_QUERY)
+        if result.errors or result.data is None:
+            raise TransportQueryError(str(result.errors))
+        return cast(IntrospectionQuery, result.data)
+
+    async def _load_introspection(self) -> Optional[IntrospectionQuery]:
+        loop = asyncio.get_running_loop()
+        introspection = None
+        if not self._is_stale():
+            introspection = await loop.run_in_executor(None, self._read_cache)
+            if introspection is not None:
+                return introspection
+
+        try:
+            introspection = await self._introspect()
+        except (TransportError, ClientError, OSError, asyncio.TimeoutError):
+            self.logger.warning(
+                "Could not fetch the schema of %s. Using the cached schema instead",
+                self.transport.url,
+            )
+            return await loop.run_in_executor(None, self._read_cache)
+
+        try:
+            await loop.run_in_executor(None, self._write_cache, introspection)
+        except OSError:
+            self.logger.warning("Could not cache the schema to %s", self.schema_path)
+        return introspection
+
+    async def start(self) -> None:
+        """Loads the schema, and connects the client"""
+        async with self._start_lock:
+            if self._session is None:
+                await self._start()
+
+    async def _start(self) -> None:
+        introspection = await self._load_introspection()
+        if introspection is None:
+            self.logger.warning(
+                "No schema is available for %s. Queries will not be validated locally",
+                self.transport.url,
+            )
+        self.client = Client(transport=self.transport, introspection=introspection)
+        self._session = await self.client.connect_async()
+
+    async def execute(
+        self, document: DocumentNode, variable_values: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Executes a parsed query
+
+        Args:
+            document (DocumentNode): The query, parsed with `gql` ahead of time
+            variable_values (Optional[Dict[str, Any]]): Variables of the query. Defaults to None
+
+        Returns:
+            Dict[str, Any]: The data of the result
+        """
+        if self._session is None:
+            await self.start()
+        return await self._session.execute(document, variable_values=variable_values)  # type: ignore
+
+    async def close(self) -> None:
+        if self.client is not None and self._session is not None:
+            await self.client.close_async()
+        self._session = None
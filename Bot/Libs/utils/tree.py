@@ -10,8 +10,6 @@ from .message_constants import MessageConstants
 if TYPE_CHECKING:
     from Bot.kumikocore import KumikoCore
 
-    from .blacklist import get_blacklist
-
 
 class KumikoCommandTree(CommandTree):
     async def interaction_check(self, interaction: discord.Interaction) -> bool:
@@ -20,9 +18,7 @@ class KumikoCommandTree(CommandTree):
         if bot.owner_id == user.id or bot.application_id == user.id:
             return True
 
-        blacklist = await get_blacklist(user.id)
-
-        if blacklist.blacklist_status is not None or blacklist.blacklist_status is True:
+        if user.id in bot.blacklist:
             await interaction.response.send_message(
                 f"My fellow user, {user.mention}, you just got the L. {MessageConstants.BLACKLIST_APPEAL_MSG.value}",
                 suppress_embeds=True,
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Deque, Dict, List, NamedTuple, Optional, Tuple, Union
+
+import asyncpg
+import discord
+from aiohttp import ClientSession
+
+from .embeds import Embed
+from .webhooks import webhook_config_cache
+
+# Limits of a single webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_EMBED_CHARS_PER_MESSAGE = 6000
+
+
+class LogSenderStats(NamedTuple):
+    queued: int
+    guilds: int
+    sent_messages: int
+    sent_embeds: int
+    dropped: int
+    flush_p50: float
+    flush_p95: float
+
+
+class _GuildLogBuffer:
+    __slots__ = ("queue", "task", "dropped")
+
+    def __init__(self, max_size: int) -> None:
+        self.queue: asyncio.Queue[Tuple[float, discord.Embed]] = asyncio.Queue(
+            maxsize=max_size
+        )
+        self.task: Optional[asyncio.Task] = None
+        self.dropped = 0
+
+
+def _split_messages(embeds: List[discord.Embed]) -> List[List[discord.Embed]]:
+    messages: List[List[discord.Embed]] = []
+    current: List[discord.Embed] = []
+    chars = 0
+    for embed in embeds:
+        size = len(embed)
+        if current and (
+            len(current) >= MAX_EMBEDS_PER_MESSAGE
+            or chars + size > MAX_EMBED_CHARS_PER_MESSAGE
+        ):
+            messages.append(current)
+            current, chars = [], 0
+        current.append(embed)
+        chars += size
+
+    if current:
+        messages.append(current)
+    return messages
+
+
+class WebhookLogSender:
+    """Buffered sender for the events logging webhooks
+
+    Each guild gets its own queue and worker. The worker waits up to `flush_interval` seconds
+    for more events after the first one, and sends them together as one message of up to 10 embeds,
+    so that a raid or a mass ban only takes a handful of requests.
+    Sending one message at a time per webhook lets discord.py's webhook adapter
+    follow the rate limit headers, instead of many requests racing into 429s.
+
+    When a guild's queue is full, new events are dropped,
+    and a summary of how many were dropped is sent with the next message.
+    Workers of idle guilds exit after `idle_timeout` seconds.
+    """
+
+    def __init__(
+        self,
+        pool: Union[asyncpg.Connection, asyncpg.Pool],
+        session: ClientSession,
+        *,
+        flush_interval: float = 2.0,
+        max_queue_size: int = 500,
+        idle_timeout: float = 60.0,
+    ) -> None:
+        self.pool = pool
+        self.session = session
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.idle_timeout = idle_timeout
+        self._buffers: Dict[int, _GuildLogBuffer] = {}
+        self.sent_messages = 0
+        self.sent_embeds = 0
+        self.dropped = 0
+
+        # Seconds between the oldest event of a message being queued and the message being sent
+        self._flush_latencies: Deque[float] = deque(maxlen=1024)
+        self.logger = logging.getLogger("kumiko")
+
+    def send(self, guild_id: int, embed: discord.Embed) -> bool:
+        """Queues an embed to be sent to the logging webhook of a guild
+
+        Args:
+            guild_id (int): Guild ID
+            embed (discord.Embed): The log entry
+
+        Returns:
+            bool: Whether the embed was queued. False if the guild's queue is full
+        """
+        buffer = self._buffers.get(guild_id)
+        if buffer is None:
+            buffer = self._buffers[guild_id] = _GuildLogBuffer(self.max_queue_size)
+            buffer.task = asyncio.create_task(self._worker(guild_id, buffer))
+
+        try:
+            buffer.queue.put_nowait((time.monotonic(), embed))
+        except asyncio.QueueFull:
+            buffer.dropped += 1
+            self.dropped += 1
+            return False
+        return True
+
+    async def _get_webhook(self, guild_id: int) -> Optional[discord.Webhook]:
+        return await webhook_config_cache.get_webhook(guild_id, self.pool, self.session)
+
+    async def _collect(
+        self, buffer: _GuildLogBuffer
+    ) -> Optional[List[Tuple[float, discord.Embed]]]:
+        try:
+            first = await asyncio.wait_for(
+                buffer.queue.get(), timeout=self.idle_timeout
+            )
+        except asyncio.TimeoutError:
+            return None
+
+        batch = [first]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < MAX_EMBEDS_PER_MESSAGE:
+            if not buffer.queue.empty():
+                batch.append(buffer.queue.get_nowait())
+                continue
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(buffer.queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _flush(
+        self,
+        guild_id: int,
+        buffer: _GuildLogBuffer,
+        batch: List[Tuple[float, discord.Embed]],
+    ) -> None:
+        embeds = [embed for _, embed in batch]
+        if buffer.dropped:
+            embeds.append(
+                Embed(
+                    title="Events dropped",
+                    description=f"{buffer.dropped} events were not logged, as too many happened at once.",
+                )
+            )
+            buffer.dropped = 0
+
+        webhook = await self._get_webhook(guild_id)
+        if webhook is None:
+            self.dropped += len(batch)
+            return
+
+        sent = 0
+        for message in _split_messages(embeds):
+            try:
+                await webhook.send(embeds=message)
+            except (discord.NotFound, discord.Forbidden):
+                # The webhook was deleted, so the config is stale
+                webhook_config_cache.drop(guild_id)
+                self.dropped += len(embeds) - sent
+                return
+
+            sent += len(message)
+            self.sent_messages += 1
+            self.sent_embeds += len(message)
+
+        self._flush_latencies.append(time.monotonic() - batch[0][0])
+
+    async def _worker(self, guild_id: int, buffer: _GuildLogBuffer) -> None:
+        try:
+            while True:
+                batch = await self._collect(buffer)
+                if batch is None:
+                    # Nothing is awaited between the check and the removal,
+                    # so an event is either in the queue, or creates a new worker
+                    if buffer.queue.empty():
+                        return
+                    continue
+
+                try:
+                    await self._flush(guild_id, buffer, batch)
+                except Exception:
+                    # One bad batch (eg. an embed Discord rejects) shouldn't stop the guild's logs
+                    self.dropped += len(batch)
+                    self.logger.exception(
+                        "Failed to send %s log events for guild %s",
+                        len(batch),
+                        guild_id,
+                    )
+        finally:
+            # Also runs if the worker is cancelled or fails, so that the next event starts a new one
+            if self._buffers.get(guild_id) is buffer:
+                del self._buffers[guild_id]
+
+    async def close(self) -> None:
+        """Stops every worker. Events that are still queued are dropped"""
+        tasks = [buffer.task for buffer in self._buffers.values() if buffer.task]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._buffers.clear()
+
+    @property
+    def stats(self) -> LogSenderStats:
+        """Queue depth, throughput and flush latency of the sender
+
+        The latencies are in milliseconds, over the last 1024 messages.
+
+        Returns:
+            LogSenderStats: The current metrics
+        """
+        latencies = sorted(self._flush_latencies)
+
+        def percentile(pct: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(len(latencies) * pct))] * 1000
+
+        return LogSenderStats(
+            queued=sum(buffer.queue.qsize() for buffer in self._buffers.values()),
+            guilds=len(self._buffers),
+            sent_messages=self.sent_messages,
+            sent_embeds=self.sent_embeds,
+            dropped=self.dropped,
+            flush_p50=percentile(0.5),
+            flush_p95=percentile(0.95),
+        )
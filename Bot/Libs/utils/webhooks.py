@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional, TypedDict
+from typing import TYPE_CHECKING, Optional, TypedDict, Union
 
+import asyncpg
 import discord
-from async_lru import alru_cache
+from aiohttp import ClientSession
+from Libs.config import CacheStats
+from lru import LRU
+
+from .change_feed import ChangeEvent
 
 if TYPE_CHECKING:
     from Bot.kumikocore import KumikoCore
@@ -15,6 +20,129 @@ class WebhookConfig(TypedDict):
     locked: bool
 
 
+class _WebhookEntry:
+    __slots__ = ("config", "webhook")
+
+    def __init__(self, config: Optional[WebhookConfig]) -> None:
+        self.config = config
+        self.webhook: Optional[discord.Webhook] = None
+
+
+class WebhookConfigCache:
+    """Bounded in-process cache of the logging webhook config of each guild
+
+    Guilds without logging webhooks are cached as well, as most guilds never set them up.
+    The `discord.Webhook` built from the URL is kept along with the config,
+    so it is only built once per guild instead of once per message sent.
+    Entries are dropped whenever `logging_webhooks` changes (see `handle_change`).
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._cache: LRU = LRU(max_size, callback=self._on_evict)
+
+    def _on_evict(self, key: int, value: _WebhookEntry) -> None:
+        self.evictions += 1
+
+    async def _get_entry(
+        self, guild_id: int, connection: Union[asyncpg.Connection, asyncpg.Pool]
+    ) -> _WebhookEntry:
+        entry = self._cache.get(guild_id)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        query = """
+        SELECT channel_id, broadcast_url, locked
+        FROM logging_webhooks
+        WHERE id = $1;
+        """
+        rows = await connection.fetchrow(query, guild_id)
+        entry = _WebhookEntry(None if rows is None else WebhookConfig(**dict(rows)))
+        self._cache[guild_id] = entry
+        return entry
+
+    async def get(
+        self, guild_id: int, connection: Union[asyncpg.Connection, asyncpg.Pool]
+    ) -> Optional[WebhookConfig]:
+        """Gets the webhook config of a guild, loading it if needed
+
+        Args:
+            guild_id (int): Guild ID
+            connection (Union[asyncpg.Connection, asyncpg.Pool]): Asyncpg connection
+
+        Returns:
+            Optional[WebhookConfig]: The config, or None if the guild has no logging webhooks
+        """
+        entry = await self._get_entry(guild_id, connection)
+        return entry.config
+
+    async def get_webhook(
+        self,
+        guild_id: int,
+        connection: Union[asyncpg.Connection, asyncpg.Pool],
+        session: ClientSession,
+    ) -> Optional[discord.Webhook]:
+        """Gets the logging webhook of a guild, reusing the same object across calls
+
+        Args:
+            guild_id (int): Guild ID
+            connection (Union[asyncpg.Connection, asyncpg.Pool]): Asyncpg connection
+            session (ClientSession): The session used to send the webhook
+
+        Returns:
+            Optional[discord.Webhook]: The webhook, or None if the guild has no logging webhooks
+        """
+        entry = await self._get_entry(guild_id, connection)
+        if entry.config is None:
+            return None
+
+        if entry.webhook is None:
+            entry.webhook = discord.Webhook.from_url(
+                url=entry.config["broadcast_url"], session=session
+            )
+        return entry.webhook
+
+    def drop(self, guild_id: int) -> None:
+        # Explicit drops are invalidations, not capacity evictions,
+        # so they are not counted
+        if guild_id in self._cache:
+            self._cache.pop(guild_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def handle_change(self, event: ChangeEvent) -> None:
+        """Drops the config of the guild whose `logging_webhooks` row changed
+
+        Args:
+            event (ChangeEvent): The change
+        """
+        if event.key is not None:
+            self.drop(event.key)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hit, miss and eviction counters of the cache
+
+        Returns:
+            CacheStats: The current counters
+        """
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            size=len(self._cache),
+            max_size=self._cache.get_size(),
+        )
+
+
+webhook_config_cache = WebhookConfigCache()
+
+
 class WebhookDispatcher:
     def __init__(self, bot: KumikoCore, guild_id: int):
         self.bot = bot
@@ -30,26 +158,35 @@ class WebhookDispatcher:
         return guild and guild.get_channel(conf["channel_id"])  # type: ignore
 
     async def get_webhook(self) -> Optional[discord.Webhook]:
-        conf = await self.get_webhook_config()
-        if conf is None:
-            return None
-        return discord.Webhook.from_url(url=conf["broadcast_url"], session=self.session)
+        return await webhook_config_cache.get_webhook(
+            self.guild_id, self.pool, self.session
+        )
 
-    @alru_cache()
     async def get_webhook_config(self) -> Optional[WebhookConfig]:
         """Obtains the webhook configuration for a given guild
 
         This is used internally in order to fetch, and later send webhooks.
+        The config is shared by every dispatcher through `webhook_config_cache`.
         """
+        return await webhook_config_cache.get(self.guild_id, self.pool)
 
-        query = """
-        SELECT channel_id, broadcast_url, locked
-        FROM logging_webhooks
-        WHERE id = $1;
+    def send(self, embed: discord.Embed) -> bool:
+        """Queues an embed to be sent to the guild's logging webhook
+
+        Embeds are batched by `bot.log_sender` (see `WebhookLogSender`).
+
+        Args:
+            embed (discord.Embed): The log entry
+
+        Returns:
+            bool: Whether the embed was queued. False if too many are already queued
         """
-        rows = await self.pool.fetchrow(query, self.guild_id)
-        if rows is None:
-            return None
+        return self.bot.log_sender.send(self.guild_id, embed)
+
+    def invalidate(self) -> None:
+        """Drops the cached webhook configuration of the guild
 
-        config = WebhookConfig(**dict(rows))
-        return config
+        This should be called after writing to `logging_webhooks`.
+        Other processes are told through the change feed.
+        """
+        webhook_config_cache.drop(self.guild_id)
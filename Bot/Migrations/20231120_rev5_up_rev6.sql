@@ -0,0 +1,54 @@
+-- Change feed: every row change on these tables is sent to the kumiko_change_feed channel,
+-- so that in-process caches can drop their copies without polling
+CREATE OR REPLACE FUNCTION kumiko_notify_change() RETURNS TRIGGER AS $$
+DECLARE
+    key BIGINT;
+BEGIN
+    IF TG_OP = 'DELETE' THEN
+        key := (to_jsonb(OLD) ->> TG_ARGV[0])::BIGINT;
+    ELSIF TG_OP IN ('INSERT', 'UPDATE') THEN
+        key := (to_jsonb(NEW) ->> TG_ARGV[0])::BIGINT;
+    END IF;
+
+    PERFORM pg_notify(
+        'kumiko_change_feed',
+        json_build_object('table', TG_TABLE_NAME, 'op', TG_OP, 'key', key)::TEXT
+    );
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS guild_change_feed ON guild;
+CREATE TRIGGER guild_change_feed AFTER INSERT OR UPDATE OR DELETE ON guild
+    FOR EACH ROW EXECUTE FUNCTION kumiko_notify_change('id');
+DROP TRIGGER IF EXISTS guild_change_feed_truncate ON guild;
+CREATE TRIGGER guild_change_feed_truncate AFTER TRUNCATE ON guild
+    FOR EACH STATEMENT EXECUTE FUNCTION kumiko_notify_change('id');
+
+DROP TRIGGER IF EXISTS logging_config_change_feed ON logging_config;
+CREATE TRIGGER logging_config_change_feed AFTER INSERT OR UPDATE OR DELETE ON logging_config
+    FOR EACH ROW EXECUTE FUNCTION kumiko_notify_change('guild_id');
+DROP TRIGGER IF EXISTS logging_config_change_feed_truncate ON logging_config;
+CREATE TRIGGER logging_config_change_feed_truncate AFTER TRUNCATE ON logging_config
+    FOR EACH STATEMENT EXECUTE FUNCTION kumiko_notify_change('guild_id');
+
+DROP TRIGGER IF EXISTS logging_webhooks_change_feed ON logging_webhooks;
+CREATE TRIGGER logging_webhooks_change_feed AFTER INSERT OR UPDATE OR DELETE ON logging_webhooks
+    FOR EACH ROW EXECUTE FUNCTION kumiko_notify_change('id');
+DROP TRIGGER IF EXISTS logging_webhooks_change_feed_truncate ON logging_webhooks;
+CREATE TRIGGER logging_webhooks_change_feed_truncate AFTER TRUNCATE ON logging_webhooks
+    FOR EACH STATEMENT EXECUTE FUNCTION kumiko_notify_change('id');
+
+DROP TRIGGER IF EXISTS blacklist_change_feed ON blacklist;
+CREATE TRIGGER blacklist_change_feed AFTER INSERT OR UPDATE OR DELETE ON blacklist
+    FOR EACH ROW EXECUTE FUNCTION kumiko_notify_change('id');
+DROP TRIGGER IF EXISTS blacklist_change_feed_truncate ON blacklist;
+CREATE TRIGGER blacklist_change_feed_truncate AFTER TRUNCATE ON blacklist
+    FOR EACH STATEMENT EXECUTE FUNCTION kumiko_notify_change('id');
+
+DROP TRIGGER IF EXISTS pin_lookup_change_feed ON pin_lookup;
+CREATE TRIGGER pin_lookup_change_feed AFTER INSERT OR UPDATE OR DELETE ON pin_lookup
+    FOR EACH ROW EXECUTE FUNCTION kumiko_notify_change('guild_id');
+DROP TRIGGER IF EXISTS pin_lookup_change_feed_truncate ON pin_lookup;
+CREATE TRIGGER pin_lookup_change_feed_truncate AFTER TRUNCATE ON pin_lookup
+    FOR EACH STATEMENT EXECUTE FUNCTION kumiko_notify_change('guild_id');
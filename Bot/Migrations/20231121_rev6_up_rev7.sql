@@ -0,0 +1,2 @@
+-- Used by the auction expiry sweep, which deletes every listing older than 24 hours
+CREATE INDEX IF NOT EXISTS auction_house_listed_at_idx ON auction_house (listed_at);
@@ -0,0 +1,3 @@
+-- Used by the keyset paginated listings, which page through the rows of a guild by ID
+CREATE INDEX IF NOT EXISTS eco_item_guild_id_id_idx ON eco_item (guild_id, id);
+CREATE INDEX IF NOT EXISTS auction_house_guild_id_id_idx ON auction_house (guild_id, id);
@@ -43,6 +43,7 @@ async def main() -> None:
             config=read_env(ENV_PATH),
             session=session,
             pool=pool,
+            postgres_uri=POSTGRES_URI,
             redis_pool=redis_pool,
             ipc_secret_key=IPC_SECRET_KEY,
             ipc_host=IPC_HOST,
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import signal
 from pathlib import Path as SyncPath
@@ -8,16 +9,25 @@ import discord
 from aiohttp import ClientSession
 from Cogs import EXTENSIONS, VERSION
 from discord.ext import commands, ipcx
+from Libs.cache import HTTPCache, KumikoCache
+from Libs.config import CacheStats, guild_config_cache, listen_for_invalidations
 from Libs.errors import send_error_embed
 from Libs.utils import (
+    BlacklistCache,
+    ChangeEvent,
+    ChangeFeed,
+    FanOut,
+    ImagePool,
     KContext,
     KumikoCommandTree,
     KumikoHelpPaginated,
     MessageConstants,
+    PrefixBackfill,
+    WebhookLogSender,
     ensure_postgres_conn,
     ensure_redis_conn,
-    get_blacklist,
     get_prefix,
+    webhook_config_cache,
 )
 from lru import LRU
 from redis.asyncio.connection import ConnectionPool
@@ -39,6 +49,7 @@ class KumikoCore(commands.Bot):
         config: Dict[str, Optional[str]],
         session: ClientSession,
         pool: asyncpg.Pool,
+        postgres_uri: str,
         redis_pool: ConnectionPool,
         ipc_secret_key: str,
         ipc_host: str,
@@ -64,12 +75,45 @@ class KumikoCore(commands.Bot):
         self._ipc_host = ipc_host
         self._pool = pool
         self._redis_pool = redis_pool
-        self._prefixes: LRU = LRU(self.lru_size)
+        self._cache = KumikoCache(connection_pool=redis_pool)
+        self._prefixes: LRU = LRU(self.lru_size, callback=self._on_prefix_evict)
+        self._prefixes_warmed = False
+        self.prefix_hits = 0
+        self.prefix_misses = 0
+        self.prefix_evictions = 0
         self.default_prefix = ">"
+        self.prefix_backfill = PrefixBackfill(pool, self.default_prefix)
+        self._prefix_backfill_task: Optional[asyncio.Task] = None
         self.ipc = ipcx.Server(
             self, host=self._ipc_host, secret_key=self._ipc_secret_key
         )
         self.logger: logging.Logger = logging.getLogger("kumiko")
+        self._invalidation_listener: Optional[asyncio.Task] = None
+        self.blacklist = BlacklistCache()
+        self.log_sender = WebhookLogSender(pool, session)
+        self.http_cache = HTTPCache(session, self._cache)
+        self.fan_out = FanOut()
+        self.image_pool = ImagePool()
+
+        # Created here so that cogs can subscribe to it within cog_load
+        self.change_feed = ChangeFeed(postgres_uri)
+        self.change_feed.subscribe(
+            "blacklist", self.blacklist.handle_change, resync=self._reload_blacklist
+        )
+        self.change_feed.subscribe(
+            "guild", self._on_guild_change, resync=self._drop_guild_caches
+        )
+        self.change_feed.subscribe(
+            "logging_config",
+            self._on_logging_config_change,
+            resync=guild_config_cache.clear,
+        )
+        self.change_feed.subscribe(
+            "logging_webhooks",
+            webhook_config_cache.handle_change,
+            resync=webhook_config_cache.clear,
+        )
+        self._change_feed_task: Optional[asyncio.Task] = None
 
     @property
     def config(self) -> Dict[str, Optional[str]]:
@@ -111,6 +155,17 @@ class KumikoCore(commands.Bot):
         """
         return self._redis_pool
 
+    @property
+    def cache(self) -> KumikoCache:
+        """A global object managed throughout the lifetime of Kumiko
+
+        Holds the long-lived Redis client that is shared by everything using `redis_pool`
+
+        Returns:
+            KumikoCache: Kumiko's Redis cache
+        """
+        return self._cache
+
     @property
     def version(self) -> str:
         """The version of Kumiko
@@ -141,6 +196,67 @@ class KumikoCore(commands.Bot):
         """
         return self._prefixes
 
+    @property
+    def prefix_stats(self) -> CacheStats:
+        """Hit, miss and eviction counters of the prefix LRU cache
+
+        Returns:
+            CacheStats: The current counters
+        """
+        return CacheStats(
+            hits=self.prefix_hits,
+            misses=self.prefix_misses,
+            evictions=self.prefix_evictions,
+            size=len(self._prefixes),
+            max_size=self._prefixes.get_size(),
+        )
+
+    def _on_prefix_evict(self, key: int, value: Optional[list]) -> None:
+        self.prefix_evictions += 1
+
+    def _on_guild_change(self, event: ChangeEvent) -> None:
+        if event.key is None:
+            return
+        if event.key in self._prefixes:
+            self._prefixes.pop(event.key)
+        guild_config_cache.drop(event.key)
+
+    def _on_logging_config_change(self, event: ChangeEvent) -> None:
+        if event.key is not None:
+            guild_config_cache.drop(event.key)
+
+    def _drop_guild_caches(self) -> None:
+        self._prefixes.clear()
+        guild_config_cache.clear()
+
+    async def _reload_blacklist(self) -> None:
+        await self.blacklist.load(self._pool)
+
+    async def warm_prefixes(self) -> int:
+        """Loads the prefixes of every guild this shard can see into the LRU cache
+
+        This is done with one query, instead of one per guild on their first message after a restart.
+        If there are more guilds than `lru_size`, the cache is grown to fit all of them,
+        as a shard can only see a bounded amount of guilds anyways.
+
+        Returns:
+            int: The amount of prefixes loaded
+        """
+        guild_ids = [guild.id for guild in self.guilds]
+        if len(guild_ids) > self._prefixes.get_size():
+            self._prefixes.set_size(len(guild_ids))
+
+        query = """
+        SELECT id, prefix FROM guild WHERE id = ANY($1::bigint[]);
+        """
+        rows = await self._pool.fetch(query, guild_ids)
+        loaded = 0
+        for row in rows:
+            if row["prefix"]:
+                self._prefixes[row["id"]] = row["prefix"]
+                loaded += 1
+        return loaded
+
     async def _fs_watcher(self) -> None:
         cogs_path = SyncPath(__file__).parent.joinpath("Cogs")
         async for changes in awatch(cogs_path):
@@ -167,9 +283,7 @@ class KumikoCore(commands.Bot):
         if bot.owner_id == ctx.author.id or bot.application_id == ctx.author.id:
             return True
 
-        blacklist = await get_blacklist(ctx.author.id, bot.pool)
-
-        if blacklist.blacklist_status is not None or blacklist.blacklist_status is True:
+        if ctx.author.id in bot.blacklist:
             # Get RickRolled lol
             # While implementing this, I was listening to Rick Astley
             await ctx.send(
@@ -199,13 +313,44 @@ class KumikoCore(commands.Bot):
         await ensure_postgres_conn(self._pool)
         await ensure_redis_conn(self._redis_pool)
 
+        # Loaded before any command can run, then kept in sync through the change feed
+        await self.blacklist.load(self._pool)
+        self._change_feed_task = self.loop.create_task(self.change_feed.run())
+
+        # Keeps the in-process guild config cache coherent across processes
+        self._invalidation_listener = self.loop.create_task(
+            listen_for_invalidations(self._redis_pool)
+        )
+        self._prefix_backfill_task = self.loop.create_task(self.prefix_backfill.run())
+
         if self.dev_mode is True and _fsw is True:
             self.logger.info("Dev mode is enabled. Loading Jishaku and FSWatcher")
             self.loop.create_task(self._fs_watcher())
 
+    async def close(self) -> None:
+        if self._invalidation_listener is not None:
+            self._invalidation_listener.cancel()
+        if self._change_feed_task is not None:
+            self._change_feed_task.cancel()
+        await self.log_sender.close()
+        await self.image_pool.close()
+        if self._prefix_backfill_task is not None:
+            self._prefix_backfill_task.cancel()
+            try:
+                await self.prefix_backfill.flush()
+            except (OSError, asyncpg.PostgresError):
+                self.logger.exception("Failed to backfill the default prefixes")
+        await super().close()
+
     async def on_ready(self):
         if not hasattr(self, "uptime"):
             self.uptime = discord.utils.utcnow()
+
+        # on_ready can be fired again on reconnects, so this is only done once
+        if not self._prefixes_warmed:
+            self._prefixes_warmed = True
+            loaded = await self.warm_prefixes()
+            self.logger.info("Warmed up the prefix cache with %s guilds", loaded)
         curr_user = None if self.user is None else self.user.name
         self.logger.info(f"{curr_user} is fully ready!")
 
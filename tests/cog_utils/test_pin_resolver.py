@@ -0,0 +1,114 @@
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterator
+
+import asyncpg
+import msgspec
+import pytest
+import pytest_asyncio
+from dotenv import load_dotenv
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.cog_utils.pins import resolve_pin
+from Libs.cog_utils.pins.pin_utils import RESOLVE_PIN_QUERY
+
+load_dotenv(dotenv_path=path.joinpath(".env"))
+
+POSTGRES_URI = os.environ["POSTGRES_URI"]
+
+GUILDS = 50
+PINS_PER_GUILD = 200
+
+# Temporary copies of the pin tables and their indexes, so the test doesn't touch real pins
+SCHEMA = """
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE TEMPORARY TABLE pin (
+    id SERIAL PRIMARY KEY,
+    author_id BIGINT,
+    name VARCHAR(255),
+    content TEXT,
+    guild_id BIGINT
+);
+
+CREATE TEMPORARY TABLE pin_lookup (
+    id SERIAL PRIMARY KEY,
+    name TEXT,
+    aliases TEXT[],
+    guild_id BIGINT,
+    owner_id BIGINT,
+    pin_id INTEGER REFERENCES pin (id) ON DELETE CASCADE
+);
+
+CREATE INDEX ON pin_lookup USING GIN (aliases);
+CREATE INDEX ON pin_lookup (guild_id);
+CREATE INDEX ON pin_lookup USING GIN (name gin_trgm_ops);
+CREATE INDEX ON pin_lookup (LOWER(name));
+CREATE UNIQUE INDEX ON pin_lookup (LOWER(name), guild_id);
+"""
+
+
+@pytest_asyncio.fixture
+async def conn():
+    conn = await asyncpg.connect(dsn=POSTGRES_URI)
+    await conn.execute(SCHEMA)
+    await conn.execute(
+        """
+        INSERT INTO pin (id, author_id, name, content, guild_id)
+        SELECT idx, 1, 'pin ' || idx, 'content ' || idx, idx % $1
+        FROM generate_series(1, $2) AS idx;
+        """,
+        GUILDS,
+        GUILDS * PINS_PER_GUILD,
+    )
+    await conn.execute(
+        """
+        INSERT INTO pin_lookup (name, aliases, guild_id, owner_id, pin_id)
+        SELECT name, ARRAY['alias ' || id], guild_id, author_id, id
+        FROM pin;
+        """
+    )
+    await conn.execute("ANALYZE pin; ANALYZE pin_lookup;")
+    try:
+        yield conn
+    finally:
+        await conn.close()
+
+
+def walk(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from walk(child)
+
+
+@pytest.mark.asyncio
+async def test_resolve_pin(conn):
+    # pin 101 belongs to guild 1
+    assert await resolve_pin(1, "PIN 101", conn) == "content 101"
+    assert await resolve_pin(1, "alias 101", conn) == "content 101"
+
+    # Aliases are only matched within the guild of the pin
+    assert await resolve_pin(2, "alias 101", conn) is None
+
+    suggestions = await resolve_pin(1, "pin 10", conn)
+    assert isinstance(suggestions, list) and 0 < len(suggestions) <= 5
+    assert await resolve_pin(1, "nothing like it", conn) is None
+
+
+@pytest.mark.asyncio
+async def test_resolve_pin_uses_indexes(conn):
+    raw = await conn.fetchval(f"EXPLAIN (FORMAT JSON) {RESOLVE_PIN_QUERY}", 1, "pin 1")
+    plan = msgspec.json.decode(raw)[0]["Plan"]
+    nodes = list(walk(plan))
+
+    # Neither the match nor the suggestions read the pins of other guilds
+    scanned = {
+        node["Relation Name"]
+        for node in nodes
+        if node["Node Type"] == "Seq Scan" and "Relation Name" in node
+    }
+    assert "pin_lookup" not in scanned
+    assert any("Index" in node["Node Type"] for node in nodes)
@@ -0,0 +1,76 @@
+"""Micro-benchmark for KumikoCache against a local Redis
+
+Compares the old style of constructing a new client (and JSON wrapper) per call
+and sending the expiry as a separate round trip, against the shared client and batched writes.
+
+Run with: python tests/redis/bench_redis_cache.py [iterations]
+"""
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import msgspec
+import redis.asyncio as redis
+from redis.asyncio.connection import ConnectionPool
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.cache import KumikoCache
+
+REDIS_URI = os.getenv("REDIS_URI", "redis://localhost:6379/0")
+VALUE = {"message": "Hello World", "pins": True, "local_economy": False}
+
+
+async def per_call_client(pool: ConnectionPool, iterations: int) -> float:
+    start = time.perf_counter()
+    for idx in range(iterations):
+        key = f"bench:kumiko:{idx}:per_call"
+        client: redis.Redis = redis.Redis(connection_pool=pool)
+        await client.json(encoder=msgspec.json, decoder=msgspec.json).set(  # type: ignore
+            name=key, path="$", obj=VALUE
+        )
+        await client.expire(name=key, time=60)
+    return iterations / (time.perf_counter() - start)
+
+
+async def shared_client(pool: ConnectionPool, iterations: int) -> float:
+    cache = KumikoCache(connection_pool=pool)
+    start = time.perf_counter()
+    for idx in range(iterations):
+        await cache.set_json_cache(
+            key=f"bench:kumiko:{idx}:shared", value=VALUE, ttl=60
+        )
+    return iterations / (time.perf_counter() - start)
+
+
+async def batched(pool: ConnectionPool, iterations: int, size: int = 100) -> float:
+    cache = KumikoCache(connection_pool=pool)
+    start = time.perf_counter()
+    for chunk in range(0, iterations, size):
+        async with cache.batch(transaction=False) as b:
+            for idx in range(chunk, min(chunk + size, iterations)):
+                b.set_json_cache(key=f"bench:kumiko:{idx}:batched", value=VALUE, ttl=60)
+    return iterations / (time.perf_counter() - start)
+
+
+async def main(iterations: int) -> None:
+    pool = ConnectionPool().from_url(REDIS_URI)
+    try:
+        results = {
+            "per-call client": await per_call_client(pool, iterations),
+            "shared client": await shared_client(pool, iterations),
+            "batched (100/flush)": await batched(pool, iterations),
+        }
+    finally:
+        await pool.disconnect()
+
+    baseline = results["per-call client"]
+    for name, ops in results.items():
+        print(f"{name:<20} {ops:>10.0f} ops/sec ({ops / baseline:.2f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000))
@@ -0,0 +1,83 @@
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+from redis.asyncio.connection import ConnectionPool
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.cache import KumikoCache, command_key_builder, kumiko_cached
+
+REDIS_URI = "redis://localhost:6379/0"
+
+calls = []
+
+
+@kumiko_cached(
+    ttl=1,
+    stale_ttl=30,
+    key=lambda id, **_: command_key_builder(
+        prefix="cache", namespace="kumiko", id=id, command="decorator"
+    ),
+    type=int,
+)
+async def load_value(id: str, redis_pool: ConnectionPool) -> int:
+    calls.append(id)
+    await asyncio.sleep(0.1)
+    return len(calls)
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    id = str(uuid.uuid4())
+    conn_pool = ConnectionPool().from_url(REDIS_URI)
+    results = await asyncio.gather(*[load_value(id, conn_pool) for _ in range(10)])
+    assert calls.count(id) == 1 and len(set(results)) == 1  # nosec
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate():
+    id = str(uuid.uuid4())
+    conn_pool = ConnectionPool().from_url(REDIS_URI)
+    first = await load_value(id, conn_pool)
+    await asyncio.sleep(1.1)
+
+    # The stale value is served while the refresh happens in the background
+    assert await load_value(id, conn_pool) == first  # nosec
+    await asyncio.sleep(0.2)
+    assert calls.count(id) == 2 and await load_value(id, conn_pool) != first  # nosec
+
+
+@pytest.mark.asyncio
+async def test_invalidate():
+    id = str(uuid.uuid4())
+    conn_pool = ConnectionPool().from_url(REDIS_URI)
+    await load_value(id, conn_pool)
+    await load_value.invalidate(id=id, redis_pool=conn_pool)  # type: ignore
+
+    key = command_key_builder(
+        prefix="cache", namespace="kumiko", id=id, command="decorator"
+    )
+    assert await KumikoCache(conn_pool).cache_exists(key) is False  # nosec
+
+
+@pytest.mark.asyncio
+async def test_invalidate_during_load():
+    id = str(uuid.uuid4())
+    conn_pool = ConnectionPool().from_url(REDIS_URI)
+    key = command_key_builder(
+        prefix="cache", namespace="kumiko", id=id, command="decorator"
+    )
+
+    # The load read the value from before the write, so it isn't stored
+    load = asyncio.ensure_future(load_value(id, conn_pool))
+    await asyncio.sleep(0.05)
+    await load_value.invalidate(id=id, redis_pool=conn_pool)  # type: ignore
+    stale = await load
+
+    assert await KumikoCache(conn_pool).cache_exists(key) is False  # nosec
+    assert await load_value(id, conn_pool) != stale  # nosec
+    assert await KumikoCache(conn_pool).cache_exists(key) is True  # nosec
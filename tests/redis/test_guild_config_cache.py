@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+
+import pytest
+from redis.asyncio.connection import ConnectionPool
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.config import (
+    FullGuildConfig,
+    GuildCacheHandler,
+    GuildConfig,
+    LoggingGuildConfig,
+    guild_config_cache,
+)
+from Libs.config.cache import resolve_config_path
+from Libs.config.local_cache import GuildConfigLocalCache
+
+REDIS_URI = "redis://localhost:6379/0"
+
+CONFIG = FullGuildConfig(config=GuildConfig(), logging_config=LoggingGuildConfig())
+
+
+def test_local_cache_counters():
+    cache = GuildConfigLocalCache(max_size=2)
+    assert cache.get(1) is None
+
+    cache.set(1, CONFIG)
+    cache.set(2, CONFIG)
+    assert cache.get(1) is CONFIG
+
+    # Guild 2 is the least recently used entry, so it gets evicted
+    cache.set(3, CONFIG)
+    assert cache.get(2) is None
+
+    stats = cache.stats
+    assert stats.hits == 1 and stats.misses == 2 and stats.evictions == 1
+    assert stats.size == 2 and stats.max_size == 2
+
+
+def test_local_cache_drop():
+    cache = GuildConfigLocalCache()
+    cache.set(1, CONFIG)
+    cache.drop(1)
+    cache.drop(2)
+    assert cache.get(1) is None and cache.stats.evictions == 0
+
+
+def test_local_cache_generation():
+    cache = GuildConfigLocalCache()
+
+    # Invalidated while the config was being fetched, so it is not stored
+    generation = cache.generation(1)
+    cache.drop(1)
+    cache.set(1, CONFIG, generation=generation)
+    assert cache.get(1) is None
+
+    generation = cache.generation(1)
+    cache.clear()
+    cache.set(1, CONFIG, generation=generation)
+    assert cache.get(1) is None
+
+    # Dropping another guild doesn't affect this one
+    generation = cache.generation(1)
+    cache.drop(2)
+    cache.set(1, CONFIG, generation=generation)
+    assert cache.get(1) is CONFIG
+
+
+def test_resolve_config_path():
+    assert resolve_config_path(CONFIG, ".config.pins") is True
+    assert resolve_config_path(CONFIG, "$.logging_config.eco") is False
+    assert resolve_config_path(CONFIG, ".config") == {
+        "logs": True,
+        "local_economy": False,
+        "redirects": True,
+        "pins": True,
+    }
+    assert resolve_config_path(CONFIG, ".config.unknown") is None
+
+
+@pytest.mark.asyncio
+async def test_get_value_uses_local_cache():
+    guild_id = 987654321
+    cache = GuildCacheHandler(guild_id, ConnectionPool().from_url(REDIS_URI))
+    await cache.replace_full_config(CONFIG)
+
+    hits = guild_config_cache.stats.hits
+    assert await cache.get_value(".config.pins") is True
+    assert guild_config_cache.stats.hits == hits + 1
+
+    await cache.merge_value(".config.pins", False)
+    assert guild_config_cache.get(guild_id) is None
+    assert await cache.get_value(".config.pins") is False
+
+    await cache.invalidate()
+    assert await cache.get_value(".config.pins") is None
@@ -0,0 +1,118 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from redis.asyncio.connection import ConnectionPool
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.cache import HostPolicy, HTTPCache, KumikoCache
+
+REDIS_URI = "redis://localhost:6379/0"
+
+
+class Upstream:
+    """Local stand-in for a third-party API, counting the requests it gets"""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.not_modified = 0
+        self.app = web.Application()
+        self.app.router.add_get("/item", self.item)
+        self.app.router.add_get("/slow", self.slow)
+        self.app.router.add_get("/missing", self.missing)
+
+    async def item(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if request.headers.get("If-None-Match") == '"v1"':
+            self.not_modified += 1
+            return web.Response(status=304)
+        return web.json_response({"name": "kumiko"}, headers={"ETag": '"v1"'})
+
+    async def slow(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await asyncio.sleep(0.1)
+        return web.json_response({"slow": True})
+
+    async def missing(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        return web.json_response({"message": "Not Found"}, status=404)
+
+
+async def create_cache(session: aiohttp.ClientSession, policy: HostPolicy):
+    cache = KumikoCache(connection_pool=ConnectionPool().from_url(REDIS_URI))
+    return HTTPCache(session, cache, policies={}, default_policy=policy)
+
+
+@pytest.mark.asyncio
+async def test_cached_response():
+    upstream = Upstream()
+    async with TestServer(upstream.app) as server, aiohttp.ClientSession() as session:
+        http_cache = await create_cache(session, HostPolicy(ttl=60))
+        url = server.make_url("/item")
+
+        first = await http_cache.get(url, params={"b": 2, "a": 1})
+        second = await http_cache.get(url, params={"a": 1, "b": 2})
+        assert first.json() == second.json() == {"name": "kumiko"}
+        assert upstream.requests == 1
+        assert http_cache.hits == 1 and http_cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_revalidate_with_etag():
+    upstream = Upstream()
+    async with TestServer(upstream.app) as server, aiohttp.ClientSession() as session:
+        # Expires right away, but is kept around to be revalidated
+        http_cache = await create_cache(session, HostPolicy(ttl=0, keep=60))
+        url = server.make_url("/item")
+
+        await http_cache.get(url)
+        response = await http_cache.get(url)
+        assert response.status == 200 and response.json() == {"name": "kumiko"}
+        assert upstream.requests == 2 and upstream.not_modified == 1
+        assert http_cache.revalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight():
+    upstream = Upstream()
+    async with TestServer(upstream.app) as server, aiohttp.ClientSession() as session:
+        http_cache = await create_cache(session, HostPolicy(ttl=60))
+        url = server.make_url("/slow")
+
+        responses = await asyncio.gather(*[http_cache.get(url) for _ in range(10)])
+        assert all(response.json() == {"slow": True} for response in responses)
+        assert upstream.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_not_cached():
+    upstream = Upstream()
+    async with TestServer(upstream.app) as server, aiohttp.ClientSession() as session:
+        http_cache = await create_cache(session, HostPolicy(ttl=60))
+        url = server.make_url("/missing")
+
+        assert (await http_cache.get(url)).status == 404
+        assert (await http_cache.get(url)).status == 404
+        assert upstream.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_outdated_entry_refetched():
+    upstream = Upstream()
+    async with TestServer(upstream.app) as server, aiohttp.ClientSession() as session:
+        http_cache = await create_cache(session, HostPolicy(ttl=60))
+        url = server.make_url("/item")
+
+        # An entry written in a format the cache no longer understands
+        key = http_cache.build_key("GET", url)
+        await http_cache.cache.set_basic_cache(key=key, value=b'{"body": 1}', ttl=60)
+
+        assert (await http_cache.get(url)).json() == {"name": "kumiko"}
+        assert (await http_cache.get(url)).json() == {"name": "kumiko"}
+        assert upstream.requests == 1
@@ -103,3 +103,18 @@ async def test_delete_basic_cache():
     await cache.set_basic_cache(key=key, value="yo")
     await cache.delete_basic_cache(key=key)
     assert await cache.cache_exists(key) is False
+
+
+@pytest.mark.asyncio
+async def test_batch():
+    key = "cache:8888888888:batch"
+    other_key = "cache:8888888889:batch"
+    cache = KumikoCache(connection_pool=ConnectionPool().from_url(REDIS_URI))
+    async with cache.batch() as b:
+        b.set_json_cache(key=key, value=DICT_DATA, ttl=60)
+        b.merge_json_cache(key=key, path="$.testing", value="no")
+        b.set_basic_cache(key=other_key, value="yo")
+        b.delete(other_key)
+    res = await cache.get_json_cache(key=key)
+    assert res == {"message": DATA, "testing": "no"}
+    assert await cache.cache_exists(other_key) is False
@@ -0,0 +1,65 @@
+"""Benchmark of the batched scorers in fuzzy_utils against scoring one pair at a time
+
+Run with: python tests/utils/bench_fuzzy_utils.py
+"""
+import heapq
+import random
+import sys
+import time
+from pathlib import Path
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils.timer import fuzzy_utils as fuzzy
+
+SIZES = (1_000, 10_000, 100_000)
+SCORERS = {
+    "quick_ratio": fuzzy.quick_ratio,
+    "ratio": fuzzy.ratio,
+    "token_sort_ratio": fuzzy.token_sort_ratio,
+    "partial_ratio": fuzzy.partial_ratio,
+}
+QUERIES = ("america", "new york", "eu/lon", "tok")
+
+
+def make_choices(amount: int) -> list:
+    rng = random.Random(0)
+    alphabet = "abcdefghijklmnopqrstuvwxyz /_"
+    return [
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(4, 24)))
+        for _ in range(amount)
+    ]
+
+
+def pairwise_extract(query, choices, scorer, limit=10):
+    it = fuzzy._extraction_generator(query, choices, scorer, 0)
+    return heapq.nlargest(limit, it, key=lambda t: t[1])
+
+
+def timed(func) -> float:
+    start = time.perf_counter()
+    for query in QUERIES:
+        func(query)
+    return (time.perf_counter() - start) / len(QUERIES) * 1000
+
+
+def main() -> None:
+    for size in SIZES:
+        choices = make_choices(size)
+        for name, scorer in SCORERS.items():
+            for query in QUERIES:
+                assert fuzzy.extract(query, choices, scorer=scorer) == pairwise_extract(
+                    query, choices, scorer
+                )
+
+            pairwise = timed(lambda q: pairwise_extract(q, choices, scorer))
+            batched = timed(lambda q: fuzzy.extract(q, choices, scorer=scorer))
+            print(
+                f"{size:>7} choices {name:<17} pairwise={pairwise:9.2f}ms "
+                f"batched={batched:9.2f}ms ({pairwise / batched:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    main()
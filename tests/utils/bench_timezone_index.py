@@ -0,0 +1,57 @@
+"""Benchmark of TimezoneIndex against the `fuzzy.finder` path for timezone autocomplete
+
+Run with: python tests/utils/bench_timezone_index.py [queries]
+"""
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from dateutil.zoneinfo import get_zonefile_instance
+from Libs.utils.timer import fuzzy_utils as fuzzy
+from Libs.utils.timer.tz_index import TimezoneIndex
+
+ZONES = set(get_zonefile_instance().zones)
+
+
+def make_queries(amount: int) -> list:
+    # Partial queries, as typed out one keystroke at a time
+    rng = random.Random(0)
+    queries = []
+    while len(queries) < amount:
+        zone = rng.choice(sorted(ZONES))
+        for end in range(1, min(len(zone), 10) + 1):
+            queries.append(zone[:end])
+    return queries[:amount]
+
+
+def run(name: str, func, queries: list) -> None:
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        timings.append((time.perf_counter() - start) * 1000)
+    p50, p99 = (statistics.quantiles(timings, n=100)[idx] for idx in (49, 98))
+    print(f"{name:<22} p50={p50:.4f}ms p99={p99:.4f}ms total={sum(timings):.1f}ms")
+
+
+def main(amount: int) -> None:
+    queries = make_queries(amount)
+
+    start = time.perf_counter()
+    index = TimezoneIndex(ZONES)
+    print(
+        f"index built over {len(ZONES)} zones in {(time.perf_counter() - start) * 1000:.2f}ms"
+    )
+
+    run("fuzzy.finder", lambda q: fuzzy.finder(q, ZONES)[:25], queries)
+    run("TimezoneIndex (cold)", index.search, queries)
+    run("TimezoneIndex (warm)", index.search, queries)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
@@ -0,0 +1,50 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils.pages import AsyncIteratorPageSource
+
+
+class Posts:
+    def __init__(self, amount: int) -> None:
+        self.amount = amount
+        self.pulled = 0
+
+    async def stream(self):
+        for idx in range(self.amount):
+            self.pulled += 1
+            await asyncio.sleep(0)
+            yield idx
+
+
+@pytest.mark.asyncio
+async def test_first_page_before_the_rest():
+    posts = Posts(12)
+    source = AsyncIteratorPageSource(posts.stream(), per_page=3)
+    await source.prepare()
+
+    # Only the first page and one more entry are needed to show page one
+    assert posts.pulled == 4
+    assert source.is_paginating() and source.get_max_pages() is None
+
+    assert await source.get_page(0) == [0, 1, 2]
+    await source._prefetch_task  # type: ignore
+    assert posts.pulled == 7
+
+
+@pytest.mark.asyncio
+async def test_exhausted_source():
+    posts = Posts(5)
+    source = AsyncIteratorPageSource(posts.stream(), per_page=2)
+    await source.prepare()
+
+    assert await source.get_page(2) == [4]
+    assert source.get_max_pages() == 3
+
+    with pytest.raises(IndexError):
+        await source.get_page(3)
@@ -11,7 +11,8 @@ another_path = Path(__file__).parents[2].joinpath("Bot")
 sys.path.append(str(another_path))
 
 
-from Libs.utils.blacklist import BlacklistEntity, get_blacklist
+from Libs.utils.blacklist import BlacklistCache, BlacklistEntity, get_blacklist
+from Libs.utils.change_feed import ChangeEvent
 
 load_dotenv(dotenv_path=another_path.joinpath(".env"))
 
@@ -33,6 +34,22 @@ def test_blacklist_entity():
     assert second_entity.blacklist_status is None
 
 
+def test_blacklist_cache_changes():
+    blacklist = BlacklistCache()
+    blacklist.handle_change(ChangeEvent(table="blacklist", op="INSERT", key=123))
+    assert 123 in blacklist and len(blacklist) == 1
+
+    blacklist.handle_change(ChangeEvent(table="blacklist", op="UPDATE", key=123))
+    assert len(blacklist) == 1
+
+    blacklist.handle_change(ChangeEvent(table="blacklist", op="DELETE", key=123))
+    assert 123 not in blacklist
+
+    blacklist.handle_change(ChangeEvent(table="blacklist", op="DELETE", key=456))
+    blacklist.handle_change(ChangeEvent(table="blacklist", op="TRUNCATE"))
+    assert len(blacklist) == 0
+
+
 @pytest.mark.asyncio
 async def test_get_blacklist(setup):
     unknown_call = await get_blacklist(3, setup)
@@ -48,3 +65,17 @@ async def test_get_blacklist(setup):
 
     known_call = await get_blacklist(known_id, setup)
     assert known_call.id == known_id and known_call.blacklist_status is True
+
+
+@pytest.mark.asyncio
+async def test_blacklist_cache_load(setup):
+    query = """
+    INSERT INTO blacklist (id, blacklist_status)
+    VALUES ($1, $2) ON CONFLICT (id) DO NOTHING;
+    """
+    known_id = 1234567891
+    await setup.execute(query, known_id, True)
+
+    blacklist = BlacklistCache()
+    assert await blacklist.load(setup) >= 1
+    assert known_id in blacklist
@@ -0,0 +1,78 @@
+import os
+import sys
+from pathlib import Path
+
+import aiohttp
+import orjson
+import pytest
+from gql.transport.exceptions import TransportServerError
+from graphql import build_schema, introspection_from_schema
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils import CachedSchemaClient
+
+INTROSPECTION = introspection_from_schema(build_schema("type Query { hello: String }"))
+
+
+async def unreachable(*args, **kwargs):
+    raise TransportServerError("No network")
+
+
+@pytest.mark.asyncio
+async def test_uses_cached_schema(tmp_path: Path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_bytes(orjson.dumps(INTROSPECTION))
+
+    async with aiohttp.ClientSession() as session:
+        client = CachedSchemaClient("http://localhost:1", session, schema_path)
+        client.transport.execute = unreachable  # type: ignore
+        await client.start()
+
+        assert client.client is not None and client.client.schema is not None
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_schema_without_network(tmp_path: Path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_bytes(orjson.dumps(INTROSPECTION))
+    os.utime(schema_path, (0, 0))
+
+    async with aiohttp.ClientSession() as session:
+        client = CachedSchemaClient("http://localhost:1", session, schema_path)
+        client.transport.execute = unreachable  # type: ignore
+
+        assert await client._load_introspection() == INTROSPECTION
+
+
+@pytest.mark.asyncio
+async def test_stale_schema_after_disconnect(tmp_path: Path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_bytes(orjson.dumps(INTROSPECTION))
+    os.utime(schema_path, (0, 0))
+
+    async def disconnected(*args, **kwargs):
+        raise aiohttp.ServerDisconnectedError()
+
+    async with aiohttp.ClientSession() as session:
+        client = CachedSchemaClient("http://localhost:1", session, schema_path)
+        client.transport.execute = disconnected  # type: ignore
+
+        assert await client._load_introspection() == INTROSPECTION
+
+
+@pytest.mark.asyncio
+async def test_caches_fetched_schema(tmp_path: Path):
+    schema_path = tmp_path / "cache" / "schema.json"
+
+    async with aiohttp.ClientSession() as session:
+        client = CachedSchemaClient("http://localhost:1", session, schema_path)
+
+        async def introspect():
+            return INTROSPECTION
+
+        client._introspect = introspect  # type: ignore
+        assert await client._load_introspection() == INTROSPECTION
+        assert orjson.loads(schema_path.read_bytes()) == INTROSPECTION
@@ -0,0 +1,58 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils.change_feed import ChangeEvent, ChangeFeed
+
+
+@pytest.mark.asyncio
+async def test_dispatch():
+    feed = ChangeFeed(None)  # type: ignore
+    events = []
+    resyncs = []
+
+    async def handler(event: ChangeEvent) -> None:
+        events.append(event)
+
+    feed.subscribe("guild", handler, resync=lambda: resyncs.append("guild"))
+    feed.subscribe("blacklist", events.append)
+
+    feed._on_notify(None, 0, "", '{"table": "guild", "op": "UPDATE", "key": 123}')  # type: ignore
+    feed._on_notify(None, 0, "", "not json")  # type: ignore
+    while not feed._queue.empty():
+        await feed._dispatch(feed._queue.get_nowait())
+
+    assert events == [ChangeEvent(table="guild", op="UPDATE", key=123)]
+
+    await feed._dispatch(ChangeEvent(table="guild", op="TRUNCATE"))
+    assert resyncs == ["guild"] and len(events) == 1
+
+    feed.unsubscribe("guild", handler)
+    await feed._dispatch(ChangeEvent(table="guild", op="DELETE", key=123))
+    await feed._dispatch(ChangeEvent(table="blacklist", op="INSERT", key=1))
+    assert events[-1] == ChangeEvent(table="blacklist", op="INSERT", key=1)
+    assert len(events) == 2
+
+
+@pytest.mark.asyncio
+async def test_resync_on_reconnect():
+    feed = ChangeFeed(None)  # type: ignore
+    resyncs = []
+
+    feed.subscribe("guild", print, resync=lambda: resyncs.append("guild"))
+    feed.subscribe(
+        "pin_lookup",
+        print,
+        resync=lambda: resyncs.append("pin_lookup"),
+        resync_on_reconnect=False,
+    )
+
+    await feed._resync_tables()
+    assert resyncs == ["guild"]
+
+    await feed._dispatch(ChangeEvent(table="pin_lookup", op="TRUNCATE"))
+    assert resyncs == ["guild", "pin_lookup"]
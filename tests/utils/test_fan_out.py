@@ -0,0 +1,82 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils import FanOut
+
+
+class FakeHost:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def request(self, delay: float, value: str) -> str:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+        return value
+
+
+async def fail() -> str:
+    raise ValueError("Upstream failed")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls():
+    host = FakeHost()
+    fan_out = FanOut(per_host=4, timeout=5)
+    start = time.perf_counter()
+    results = await fan_out.gather(
+        *[
+            ("https://api.github.com/a", lambda: host.request(0.1, "a")),
+            ("https://api.github.com/b", lambda: host.request(0.2, "b")),
+            ("https://api.github.com/c", lambda: host.request(0.1, "c")),
+        ]
+    )
+
+    # Takes as long as the slowest call, not the sum of them
+    assert time.perf_counter() - start < 0.35
+    assert [result.value for result in results] == ["a", "b", "c"]
+    assert all(result.ok for result in results)
+
+
+@pytest.mark.asyncio
+async def test_per_host_limit():
+    github = FakeHost()
+    other = FakeHost()
+    fan_out = FanOut(per_host=2, timeout=5)
+    calls = [("https://api.github.com", lambda: github.request(0.01, "gh"))] * 6
+    calls += [("https://example.com", lambda: other.request(0.01, "ex"))] * 2
+
+    results = await fan_out.gather(*calls)
+    assert len(results) == 8 and all(result.ok for result in results)
+    assert github.peak == 2 and other.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_and_timeout():
+    host = FakeHost()
+    fan_out = FanOut(timeout=5)
+    ok, failed, slow = await fan_out.gather(
+        ("https://api.github.com/ok", lambda: host.request(0, "ok")),
+        ("https://api.github.com/failed", fail),
+        ("https://api.github.com/slow", lambda: host.request(10, "slow")),
+        timeout=0.1,
+    )
+
+    assert ok.ok and ok.value == "ok"
+    assert isinstance(failed.error, ValueError)
+    assert isinstance(slow.error, asyncio.TimeoutError) and slow.value is None
+
+    # The call that ran out of time was cancelled, rather than left running
+    assert host.active == 0
+    assert await fan_out.gather() == []
@@ -0,0 +1,77 @@
+import heapq
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils.timer import fuzzy_utils as fuzzy
+
+SCORERS = [
+    fuzzy.ratio,
+    fuzzy.quick_ratio,
+    fuzzy.token_sort_ratio,
+    fuzzy.quick_token_sort_ratio,
+    fuzzy.partial_ratio,
+    fuzzy.partial_token_sort_ratio,
+]
+
+
+def make_words(rng: random.Random, amount: int) -> list:
+    return [
+        "".join(rng.choice("abcdeinorst _-") for _ in range(rng.randint(0, 20)))
+        for _ in range(amount)
+    ]
+
+
+def pairwise_extract(query, choices, scorer, score_cutoff, limit):
+    # The extraction as done before the batched scorers, one pair at a time
+    it = fuzzy._extraction_generator(query, choices, scorer, score_cutoff)
+    if limit is not None:
+        return heapq.nlargest(limit, it, key=lambda t: t[1])
+    return sorted(it, key=lambda t: t[1], reverse=True)
+
+
+@pytest.mark.parametrize("scorer", SCORERS)
+def test_batched_matches_pairwise(scorer):
+    rng = random.Random(0)
+    for _ in range(25):
+        choices = make_words(rng, 200)
+        query = make_words(rng, 1)[0]
+        for score_cutoff in (0, 50, 80):
+            for limit in (None, 1, 10):
+                assert fuzzy.extract(
+                    query,
+                    choices,
+                    scorer=scorer,
+                    score_cutoff=score_cutoff,
+                    limit=limit,
+                ) == pairwise_extract(query, choices, scorer, score_cutoff, limit)
+
+
+def test_extract_dict_and_one():
+    choices = {"pins": 1, "pinned": 2, "jobs": 3}
+    assert fuzzy.extract("pin", choices, scorer=fuzzy.ratio, limit=2) == [
+        ("pins", 86, 1),
+        ("pinned", 67, 2),
+    ]
+    assert fuzzy.extract_one("jobs", choices) == ("jobs", 100, 3)
+    assert fuzzy.extract_one("jobs", {}) is None
+
+
+def test_extract_non_indexable():
+    choices = {"pins": 1, "pinned": 2, "jobs": 3}
+    expected = fuzzy.extract("pin", list(choices), scorer=fuzzy.ratio)
+    assert fuzzy.extract("pin", choices.keys(), scorer=fuzzy.ratio) == expected  # type: ignore
+    assert sorted(fuzzy.extract("pin", set(choices), scorer=fuzzy.ratio)) == sorted(expected)  # type: ignore
+    assert fuzzy.extract_one("jobs", (key for key in choices)) == ("jobs", 100)  # type: ignore
+
+
+def test_unregistered_scorer():
+    assert fuzzy.extract("a", ["a", "b"], scorer=lambda a, b: int(a == b) * 100) == [
+        ("a", 100),
+        ("b", 0),
+    ]
@@ -0,0 +1,74 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils import ImagePool
+
+
+class FakeAPI:
+    def __init__(self, batch: int = 4) -> None:
+        self.batch = batch
+        self.fetches = 0
+        self.fail = False
+
+    async def fetch(self):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            raise ConnectionError("Upstream is down")
+        return [f"{self.fetches}-{idx}" for idx in range(self.batch)]
+
+
+@pytest.mark.asyncio
+async def test_served_from_buffer():
+    api = FakeAPI()
+    pool = ImagePool(capacity=8, low_water=3)
+    pool.register("hug", api.fetch)
+    await asyncio.sleep(0.1)
+
+    # Filled in the background, with two batches
+    assert api.fetches == 2 and pool.stats["hug"].size == 8
+
+    images = [await pool.get("hug") for _ in range(5)]
+    assert len(set(images)) == 5
+    assert api.fetches == 2
+
+    # Dropping below the low-water mark starts a refill
+    await pool.get("hug")
+    await asyncio.sleep(0.1)
+    stats = pool.stats["hug"]
+    assert api.fetches > 2 and stats.size == 8
+    assert stats.served == 6 and stats.misses == 0 and stats.fetch_p50 > 0
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_empty_buffer_waits_for_refill():
+    api = FakeAPI(batch=2)
+    pool = ImagePool(capacity=2, low_water=1)
+    pool.register("pat", api.fetch)
+
+    # Nothing is ready yet, so every caller shares the running refill
+    images = await asyncio.gather(*[pool.get("pat") for _ in range(2)])
+    assert sorted(images) == ["1-0", "1-1"]  # type: ignore
+    assert pool.stats["pat"].misses == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_refill():
+    api = FakeAPI()
+    api.fail = True
+    pool = ImagePool(capacity=4, low_water=1)
+    pool.register("poke", api.fetch)
+
+    assert await pool.get("poke") is None
+    assert pool.stats["poke"].failures >= 1
+
+    pool.unregister("poke")
+    assert "poke" not in pool.stats
@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils.pages import KeysetPageSource
+
+PLAN = '[{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 40}}]'
+
+
+class FakePool:
+    def __init__(self, amount: int) -> None:
+        self.rows = [{"id": idx, "name": f"item {idx}"} for idx in range(1, amount + 1)]
+        self.fetches = []
+
+    async def fetchval(self, query: str, *args):
+        assert query.startswith("EXPLAIN (FORMAT JSON)")
+        return PLAN
+
+    async def fetch(self, query: str, guild_id: int, last_id: int, limit: int):
+        self.fetches.append((last_id, limit))
+        return [row for row in self.rows if row["id"] > last_id][:limit]
+
+
+def create_source(pool: FakePool, per_page: int = 5) -> KeysetPageSource:
+    return KeysetPageSource(
+        pool,  # type: ignore
+        "SELECT id, name FROM items WHERE guild_id = $1 AND id > $2 ORDER BY id LIMIT $3;",
+        1,
+        per_page=per_page,
+        count_query="SELECT 1 FROM items WHERE guild_id = $1",
+        transform=lambda row: row["name"],
+    )
+
+
+@pytest.mark.asyncio
+async def test_loads_pages_on_demand():
+    pool = FakePool(23)
+    source = create_source(pool)
+    await source.prepare()
+    await source.prepare()
+
+    assert pool.fetches == [(0, 6)]
+    assert source.approximate and source.get_max_pages() == 8
+
+    # Skipping ahead loads every row in between with one query
+    assert await source.get_page(2) == [f"item {idx}" for idx in range(11, 16)]
+    assert pool.fetches[-1] == (5, 11)
+
+    # Pages that were already loaded are not queried again
+    await source.get_page(1)
+    assert len(pool.fetches) == 2
+
+
+@pytest.mark.asyncio
+async def test_exact_once_exhausted():
+    pool = FakePool(23)
+    source = create_source(pool)
+    await source.prepare()
+
+    assert await source.get_page(4) == ["item 21", "item 22", "item 23"]
+    assert not source.approximate and source.get_max_pages() == 5
+
+    with pytest.raises(IndexError):
+        await source.get_page(6)
+
+
+@pytest.mark.asyncio
+async def test_empty_source():
+    pool = FakePool(0)
+    source = create_source(pool)
+    await source.prepare()
+
+    assert source.entries == [] and not source.is_paginating()
+    assert await source.get_page(0) == []
+
+
+@pytest.mark.asyncio
+async def test_single_row():
+    # The listings show one entry per page
+    source = create_source(FakePool(1), per_page=1)
+    await source.prepare()
+
+    assert not source.approximate and not source.is_paginating()
+    assert source.get_max_pages() == 1
+    assert await source.get_page(0) == "item 1"
+
+
+@pytest.mark.asyncio
+async def test_exact_multiple_of_per_page():
+    pool = FakePool(10)
+    source = create_source(pool)
+    await source.prepare()
+    assert source.approximate
+
+    # The second page ends on the last row, which is known without another query
+    assert await source.get_page(1) == [f"item {idx}" for idx in range(6, 11)]
+    assert not source.approximate and source.get_max_pages() == 2
+    assert len(pool.fetches) == 2
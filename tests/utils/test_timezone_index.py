@@ -0,0 +1,29 @@
+import random
+import sys
+from pathlib import Path
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from dateutil.zoneinfo import get_zonefile_instance
+from Libs.utils.timer import fuzzy_utils as fuzzy
+from Libs.utils.timer.tz_index import TimezoneIndex
+
+ZONES = set(get_zonefile_instance().zones)
+
+
+def test_matches_finder():
+    index = TimezoneIndex(ZONES)
+    rng = random.Random(0)
+    for _ in range(200):
+        zone = rng.choice(sorted(ZONES))
+        start = rng.randrange(len(zone))
+        query = zone[start : start + rng.randint(1, 8)]
+        assert index.search(query) == fuzzy.finder(query, ZONES)[:25]
+        assert index.search(query, limit=None) == fuzzy.finder(query, ZONES)
+
+
+def test_no_match():
+    index = TimezoneIndex(ZONES)
+    assert index.search("§") == []
+    assert index.search("zzzzzzzzz") == []
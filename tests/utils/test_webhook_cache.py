@@ -0,0 +1,51 @@
+import sys
+from pathlib import Path
+
+import aiohttp
+import pytest
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils.change_feed import ChangeEvent
+from Libs.utils.webhooks import WebhookConfigCache
+
+URL = "https://discord.com/api/webhooks/123456789012345678/" + "a" * 68
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.queries = 0
+
+    async def fetchrow(self, query: str, guild_id: int):
+        self.queries += 1
+        if guild_id != 1:
+            return None
+        return {"channel_id": 2, "broadcast_url": URL, "locked": False}
+
+
+@pytest.mark.asyncio
+async def test_shared_config():
+    cache = WebhookConfigCache(max_size=8)
+    conn = FakeConnection()
+
+    assert (await cache.get(1, conn))["channel_id"] == 2  # type: ignore
+    assert await cache.get(1, conn) is not None
+    assert await cache.get(3, conn) is None
+    assert await cache.get(3, conn) is None
+    assert conn.queries == 2 and cache.stats.hits == 2
+
+    cache.handle_change(ChangeEvent(table="logging_webhooks", op="DELETE", key=1))
+    await cache.get(1, conn)
+    assert conn.queries == 3
+
+
+@pytest.mark.asyncio
+async def test_webhook_reused():
+    cache = WebhookConfigCache(max_size=8)
+    conn = FakeConnection()
+    async with aiohttp.ClientSession() as session:
+        first = await cache.get_webhook(1, conn, session)  # type: ignore
+        assert first is not None and first.id == 123456789012345678
+        assert await cache.get_webhook(1, conn, session) is first  # type: ignore
+        assert await cache.get_webhook(3, conn, session) is None  # type: ignore
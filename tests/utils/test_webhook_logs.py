@@ -0,0 +1,88 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+path = Path(__file__).parents[2].joinpath("Bot")
+sys.path.append(str(path))
+
+from Libs.utils.embeds import Embed
+from Libs.utils.webhook_logs import WebhookLogSender, _split_messages
+
+
+class FakeWebhook:
+    def __init__(self) -> None:
+        self.messages = []
+
+    async def send(self, *, embeds) -> None:
+        self.messages.append(embeds)
+
+
+class FakeSender(WebhookLogSender):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(None, None, **kwargs)  # type: ignore
+        self.webhook = FakeWebhook()
+
+    async def _get_webhook(self, guild_id: int):
+        return self.webhook
+
+
+def test_split_messages():
+    embeds = [Embed(description=str(idx)) for idx in range(25)]
+    assert [len(message) for message in _split_messages(embeds)] == [10, 10, 5]
+
+    large = [Embed(description="a" * 2500) for _ in range(5)]
+    assert [len(message) for message in _split_messages(large)] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_coalesces_events():
+    sender = FakeSender(flush_interval=0.05)
+    for idx in range(25):
+        assert sender.send(1, Embed(description=str(idx)))
+
+    await asyncio.sleep(0.2)
+    assert [len(message) for message in sender.webhook.messages] == [10, 10, 5]
+    assert sender.stats.sent_embeds == 25 and sender.stats.queued == 0
+    await sender.close()
+
+
+@pytest.mark.asyncio
+async def test_overflow_summary():
+    sender = FakeSender(flush_interval=0.05, max_queue_size=5)
+    results = [sender.send(1, Embed(description=str(idx))) for idx in range(8)]
+    assert results.count(False) == 3 and sender.stats.dropped == 3
+
+    await asyncio.sleep(0.2)
+    summary = sender.webhook.messages[0][-1]
+    assert summary.title == "Events dropped" and "3 events" in summary.description
+    await sender.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_worker_exits():
+    sender = FakeSender(flush_interval=0.01, idle_timeout=0.05)
+    sender.send(1, Embed(description="joined"))
+    await asyncio.sleep(0.2)
+    assert sender.stats.guilds == 0 and len(sender.webhook.messages) == 1
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_errors():
+    sender = FakeSender(flush_interval=0.01, idle_timeout=0.05)
+    send = sender.webhook.send
+
+    async def fail_once(*, embeds) -> None:
+        sender.webhook.send = send  # type: ignore
+        raise ValueError("Invalid embed")
+
+    sender.webhook.send = fail_once  # type: ignore
+    sender.send(1, Embed(description="rejected"))
+    await asyncio.sleep(0.03)
+    sender.send(1, Embed(description="sent"))
+    await asyncio.sleep(0.03)
+
+    assert sender.stats.dropped == 1 and len(sender.webhook.messages) == 1
+    await asyncio.sleep(0.1)
+    assert sender.stats.guilds == 0